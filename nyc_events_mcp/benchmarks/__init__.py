@@ -0,0 +1,15 @@
+"""
+Benchmarks for the NYC Events MCP server.
+
+Usage (from the nyc_events_mcp/ directory):
+    python -m benchmarks.run --sizes 10k,100k --output results.json
+    python -m benchmarks.compare baseline.json results.json
+"""
+
+import os
+import sys
+
+# Make the package importable without installing it, like demo.py does
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
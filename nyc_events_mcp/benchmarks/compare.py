@@ -0,0 +1,76 @@
+"""
+Compare two benchmark result files and flag regressions.
+
+Exits with status 1 if any case's median slowed down by more than the
+threshold, so it can gate CI.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Tuple[str, str, float, float, float, str]]:
+    """
+    Compare median timings of cases present in both reports.
+
+    Args:
+        baseline: Baseline results document
+        current: Current results document
+        threshold: Allowed relative change, e.g. 0.10 for 10%
+
+    Returns:
+        Rows of (size, case, baseline_ms, current_ms, ratio, verdict), where verdict
+        is "regression" or "faster" beyond the threshold and "" otherwise
+    """
+    rows = []
+    for size, cases in current["results"].items():
+        base_cases = baseline["results"].get(size, {})
+        for case, stats in cases.items():
+            if case not in base_cases:
+                continue
+            base_ms = base_cases[case]["median_ms"]
+            cur_ms = stats["median_ms"]
+            ratio = cur_ms / base_ms if base_ms else float("inf")
+            if ratio > 1 + threshold:
+                verdict = "regression"
+            elif ratio < 1 - threshold:
+                verdict = "faster"
+            else:
+                verdict = ""
+            rows.append((size, case, base_ms, cur_ms, ratio, verdict))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", help="Baseline results JSON")
+    parser.add_argument("current", help="Current results JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown (default: 0.10)")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    regressions = 0
+    print(f"{'size':<6} {'case':<48} {'base ms':>10} {'cur ms':>10} {'ratio':>7}")
+    for size, case, base_ms, cur_ms, ratio, verdict in compare(baseline, current, args.threshold):
+        flag = {"regression": "  REGRESSION", "faster": "  faster"}.get(verdict, "")
+        if verdict == "regression":
+            regressions += 1
+        print(f"{size:<6} {case:<48} {base_ms:>10.3f} {cur_ms:>10.3f} {ratio:>6.2f}x{flag}")
+
+    if regressions:
+        print(f"\n{regressions} regression(s) above {args.threshold:.0%}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
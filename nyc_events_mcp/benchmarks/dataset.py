@@ -0,0 +1,295 @@
+"""
+Synthetic NYC event dataset generator for benchmarks.
+
+Generates databases with the same schema as the shipped events database at
+arbitrary sizes. Venues are clustered around real NYC hotspots, categories
+follow a skewed mix and start times follow per-category daily patterns, so
+query selectivity looks like production rather than uniform noise.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Tuple
+
+from . import SRC_DIR  # noqa: F401  (puts src/ on sys.path)
+from nyc_events_mcp import ingest
+
+# Standard dataset sizes used by the benchmark runner
+SIZES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+DEFAULT_SEED = 20251020
+
+# Bump when generate_events() changes what it produces, so cached databases are rebuilt
+GENERATOR_VERSION = 2
+DEFAULT_START_DATE = date(2025, 10, 20)
+DEFAULT_DAYS = 31
+
+# (name, latitude, longitude, spread in degrees, weight)
+NEIGHBORHOOD_CLUSTERS = [
+    ("Midtown", 40.7549, -73.9840, 0.008, 0.20),
+    ("Lower East Side", 40.7200, -73.9880, 0.006, 0.12),
+    ("East Village", 40.7265, -73.9815, 0.005, 0.10),
+    ("Chelsea", 40.7465, -74.0014, 0.006, 0.10),
+    ("Upper West Side", 40.7870, -73.9754, 0.008, 0.07),
+    ("Upper East Side", 40.7736, -73.9566, 0.008, 0.08),
+    ("Williamsburg", 40.7081, -73.9571, 0.007, 0.10),
+    ("Downtown Brooklyn", 40.6928, -73.9903, 0.006, 0.06),
+    ("Long Island City", 40.7447, -73.9485, 0.006, 0.05),
+    ("Financial District", 40.7075, -74.0113, 0.005, 0.05),
+    ("Harlem", 40.8116, -73.9465, 0.008, 0.04),
+    ("Astoria", 40.7644, -73.9235, 0.007, 0.03),
+]
+
+# category -> (share of events, typical start hours, duration hours)
+CATEGORY_PROFILES = {
+    "music": (0.32, [19, 20, 20, 21, 21, 22], 3),
+    "museum": (0.20, [10, 11, 13, 14, 15, 18], 3),
+    "pop-ups": (0.16, [11, 12, 12, 13, 16, 17], 3),
+    "movies": (0.22, [14, 17, 19, 19, 21, 22], 2),
+    "football": (0.10, [13, 16, 20, 20, 20], 3),
+}
+
+TITLE_TEMPLATES = {
+    "music": ["Live Set", "Live Jazz Night", "Indie Showcase", "DJ Night", "Open Mic", "Jazz Trio"],
+    "museum": ["Gallery Spotlight", "Curator Talk", "After Hours", "Family Day", "Exhibit Opening"],
+    "pop-ups": ["Limited-Time Pop-Up", "Vintage Market", "Food Pop-Up", "Tech Meetup Pop-Up", "Sample Sale"],
+    "movies": ["Indie Film Screening", "Classic Double Feature", "Premiere Night", "Documentary Screening"],
+    "football": ["Game Watch Party", "Match Day Screening", "Fantasy Draft Night"],
+}
+
+# Descriptions open with a category-specific sentence and add two shared
+# details, so keyword and semantic search see realistic term variety
+DESCRIPTION_OPENERS = {
+    "music": [
+        "An evening of live music", "Local bands share the bill", "A night of jazz standards and improvisation",
+        "DJs spin house and disco until late", "Singer-songwriters take the stage", "A quartet plays soul and funk covers",
+    ],
+    "museum": [
+        "A guided walk through the current exhibition", "Curators discuss recent acquisitions",
+        "Extended gallery hours with drinks", "Hands-on art activities for kids and families",
+        "Opening reception for a new show of contemporary art", "A talk on photography and the city",
+    ],
+    "pop-ups": [
+        "A weekend market of local makers", "Street food vendors and tasting plates",
+        "Racks of vintage clothing and records", "A startup demo night with founders and engineers",
+        "Designer samples at deep discounts", "A limited-run shop of handmade ceramics and prints",
+    ],
+    "movies": [
+        "A screening of a festival favorite", "Two classics back to back",
+        "The director joins for a Q&A after the film", "A documentary about New York neighborhoods",
+        "A restored print on the big screen", "Short films from emerging filmmakers",
+    ],
+    "football": [
+        "Watch the big game on giant screens", "Match day with wings and drink specials",
+        "Fans gather for kickoff and the post-game show", "A fantasy league draft with prizes",
+        "Live commentary and halftime trivia",
+    ],
+}
+
+DESCRIPTION_DETAILS = [
+    "Free entry.", "Tickets sold at the door.", "RSVP recommended.", "All ages welcome.", "21+ with ID.",
+    "Vegetarian and vegan food available.", "Wheelchair accessible.", "Doors open 30 minutes early.",
+    "Bring a friend.", "Limited capacity.", "Cash bar.", "Outdoor seating if the weather holds.",
+]
+
+VENUE_KINDS = {
+    "music": ["Ballroom", "Jazz Club", "Hall", "Lounge", "Music Hall"],
+    "museum": ["Museum", "Gallery", "Art Center", "Collection"],
+    "pop-ups": ["Market", "Studio", "Loft", "Warehouse"],
+    "movies": ["Cinema", "Film Center", "Theater"],
+    "football": ["Sports Bar", "Tavern", "Pub"],
+}
+
+VENUE_ADJECTIVES = [
+    "Bowery", "Hudson", "Union", "Canal", "Empire", "Gotham", "Liberty", "Astor",
+    "Orchard", "Mercer", "Delancey", "Bedford", "Greenpoint", "Lenox", "Prince",
+]
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a dataset size such as ``10k``, ``1m`` or ``2500``.
+
+    Args:
+        value: Size string
+
+    Returns:
+        Number of rows
+    """
+    value = value.strip().lower()
+    if value in SIZES:
+        return SIZES[value]
+    multiplier = 1
+    if value.endswith("k"):
+        multiplier, value = 1_000, value[:-1]
+    elif value.endswith("m"):
+        multiplier, value = 1_000_000, value[:-1]
+    return int(float(value) * multiplier)
+
+
+def _generate_venues(rng: random.Random, count: int) -> List[Tuple[str, str, float, float]]:
+    """
+    Generate clustered venues as (name, category, latitude, longitude).
+    """
+    names = set()
+    venues = []
+    weights = [cluster[4] for cluster in NEIGHBORHOOD_CLUSTERS]
+    categories = list(CATEGORY_PROFILES)
+    category_weights = [CATEGORY_PROFILES[c][0] for c in categories]
+
+    while len(venues) < count:
+        hood, lat, lon, spread, _ = rng.choices(NEIGHBORHOOD_CLUSTERS, weights)[0]
+        category = rng.choices(categories, category_weights)[0]
+        name = f"{rng.choice(VENUE_ADJECTIVES)} {rng.choice(VENUE_KINDS[category])}"
+        if name in names:
+            name = f"{name} {hood}"
+        if name in names:
+            name = f"{name} {len(venues)}"
+        names.add(name)
+        venues.append((
+            name,
+            category,
+            round(rng.gauss(lat, spread), 6),
+            round(rng.gauss(lon, spread), 6),
+        ))
+    return venues
+
+
+def generate_events(
+    rows: int,
+    seed: int = DEFAULT_SEED,
+    start: date = DEFAULT_START_DATE,
+    days: int = DEFAULT_DAYS,
+) -> Iterator[tuple]:
+    """
+    Yield synthetic event rows in the events table column order.
+
+    Args:
+        rows: Number of events to generate
+        seed: Random seed; the same seed always yields the same dataset
+        start: First event date
+        days: Number of days covered
+
+    Yields:
+        Tuples of (event_id, title, category, date, start_time_local,
+        end_time_local, venue_name, latitude, longitude, description)
+    """
+    rng = random.Random(seed)
+    venue_count = max(20, min(rows // 40, 50_000))
+    venues = _generate_venues(rng, venue_count)
+    by_category = {c: [v for v in venues if v[1] == c] or venues for c in CATEGORY_PROFILES}
+
+    categories = list(CATEGORY_PROFILES)
+    category_weights = [CATEGORY_PROFILES[c][0] for c in categories]
+    # Weekends (Fri-Sun) get roughly 1.6x the events of weekdays
+    day_weights = [1.6 if (start + timedelta(d)).weekday() >= 4 else 1.0 for d in range(days)]
+
+    for _ in range(rows):
+        category = rng.choices(categories, category_weights)[0]
+        _, hours, duration = CATEGORY_PROFILES[category]
+        venue_name, _, latitude, longitude = rng.choice(by_category[category])
+
+        day = start + timedelta(days=rng.choices(range(days), day_weights)[0])
+        start_dt = datetime(day.year, day.month, day.day, rng.choice(hours), rng.choice((0, 0, 15, 30, 45)))
+        end_dt = start_dt + timedelta(hours=duration)
+
+        title = f"{rng.choice(TITLE_TEMPLATES[category])} @ {venue_name}"
+        description = f"{rng.choice(DESCRIPTION_OPENERS[category])} at {venue_name}. {' '.join(rng.sample(DESCRIPTION_DETAILS, 2))}"
+        yield (
+            str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            title,
+            category,
+            day.isoformat(),
+            start_dt.isoformat(),
+            end_dt.isoformat(),
+            venue_name,
+            latitude,
+            longitude,
+            description,
+        )
+
+
+def build_database(path: str, rows: int, seed: int = DEFAULT_SEED, batch_size: int = 50_000) -> str:
+    """
+    Create a synthetic events database.
+
+    Args:
+        path: Output SQLite path (overwritten if it exists)
+        rows: Number of events
+        seed: Random seed
+        batch_size: Rows per executemany batch
+
+    Returns:
+        The database path
+    """
+    if os.path.exists(path):
+        os.remove(path)
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    # Same schema and derived tables as a production ingest
+    ingest.ensure_schema(conn)
+    ingest.ingest_events(conn, generate_events(rows, seed=seed), batch_size=batch_size)
+
+    conn.commit()
+    conn.close()
+    return path
+
+
+def database_name(rows: int, seed: int = DEFAULT_SEED) -> str:
+    """Return the cache file name of a synthetic database."""
+    return f"events_{rows}_{seed}_g{GENERATOR_VERSION}_s{ingest.SCHEMA_VERSION}.sqlite"
+
+
+def ensure_database(data_dir: str, rows: int, seed: int = DEFAULT_SEED) -> str:
+    """
+    Return the path of a cached synthetic database, building it if missing.
+
+    The file name includes the generator and schema versions, so a change to
+    either builds a fresh database instead of reusing a stale one.
+
+    Args:
+        data_dir: Directory holding generated databases
+        rows: Number of events
+        seed: Random seed
+
+    Returns:
+        Path to the database
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, database_name(rows, seed))
+    if not os.path.exists(path):
+        started = time.perf_counter()
+        build_database(path, rows, seed=seed)
+        print(f"Generated {rows:,} events in {time.perf_counter() - started:.1f}s -> {path}")
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic NYC events database")
+    parser.add_argument("size", help="Number of rows, e.g. 10k, 100k, 1m, 10m or 2500")
+    parser.add_argument("--output", default=None, help="Output path (default: benchmarks/.data/events_<rows>_<seed>_g<generator>_s<schema>.sqlite)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    rows = parse_size(args.size)
+    if args.output:
+        build_database(args.output, rows, seed=args.seed)
+        print(f"Wrote {rows:,} events to {args.output}")
+    else:
+        ensure_database(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data"), rows, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Concurrent load generator for the SSE server.
+
+Opens N MCP client sessions against a running server and replays a weighted
+mix of tool calls at a target rate (open loop: requests are issued on
+schedule whether or not earlier ones have finished). Reports throughput,
+per-tool p50/p95/p99 latency and error rates, and can ramp the rate until a
+latency SLO breaks.
+
+Usage (with ``python -m nyc_events_mcp.server --mode sse --port 8022`` running):
+    python -m benchmarks.loadgen --url http://localhost:8022/sse --sessions 16 --rate 200 --duration 30
+    python -m benchmarks.loadgen --ramp 50:50:1000 --slo-p99-ms 250
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+# Days covered by the synthetic datasets (and the bundled Oct 20 - Nov 20 database)
+from .dataset import DEFAULT_DAYS, DEFAULT_START_DATE
+
+TIMES_SQUARE = (40.7580, -73.9855)
+
+DEFAULT_MIX = {
+    "search_events": 3,
+    "get_events_by_category": 2,
+    "get_events_by_date_range": 2,
+    "find_events_near_location": 3,
+    "get_event_by_id": 2,
+    "get_event_categories": 1,
+}
+
+EVENT_ID_PATTERN = re.compile(r"Event ID: ([0-9a-f-]{36})")
+
+
+def parse_mix(spec: Optional[str]) -> Dict[str, float]:
+    """
+    Parse a tool mix such as ``search_events=3,get_event_by_id=1``.
+    """
+    if not spec:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def make_arguments(tool: str, rng: random.Random, event_ids: List[str]) -> Dict[str, Any]:
+    """
+    Build plausible arguments for a tool call.
+    """
+    day = (DEFAULT_START_DATE + timedelta(days=rng.randrange(DEFAULT_DAYS))).isoformat()
+    category = rng.choice(["music", "museum", "pop-ups", "football", "movies"])
+    if tool == "search_events":
+        return {"query": rng.choice(["Jazz", "Gallery", "Pop-Up", "Screening", "Live"]), "limit": 20}
+    if tool == "get_events_by_category":
+        return {"category": category, "limit": 20}
+    if tool == "get_events_by_date_range":
+        return {"start_date": day, "end_date": day, "limit": 50}
+    if tool == "find_events_near_location":
+        return {
+            "latitude": TIMES_SQUARE[0] + rng.uniform(-0.03, 0.03),
+            "longitude": TIMES_SQUARE[1] + rng.uniform(-0.03, 0.03),
+            "radius_km": rng.choice([1.0, 2.0, 3.0]),
+        }
+    if tool == "get_event_by_id":
+        return {"event_id": rng.choice(event_ids) if event_ids else "missing"}
+    return {}
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LoadStats:
+    """
+    Latency and error accounting for one load stage.
+    """
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.dropped = 0
+
+    def record(self, tool: str, latency_ms: float, ok: bool) -> None:
+        self.latencies.setdefault(tool, []).append(latency_ms)
+        if not ok:
+            self.errors[tool] = self.errors.get(tool, 0) + 1
+
+    def summary(self, elapsed_s: float) -> Dict[str, Any]:
+        per_tool = {}
+        total = 0
+        all_latencies: List[float] = []
+        for tool, samples in sorted(self.latencies.items()):
+            total += len(samples)
+            all_latencies.extend(samples)
+            per_tool[tool] = {
+                "calls": len(samples),
+                "error_rate": round(self.errors.get(tool, 0) / len(samples), 4),
+                "p50_ms": round(_percentile(samples, 50), 3),
+                "p95_ms": round(_percentile(samples, 95), 3),
+                "p99_ms": round(_percentile(samples, 99), 3),
+            }
+        errors = sum(self.errors.values())
+        return {
+            "calls": total,
+            "dropped": self.dropped,
+            "throughput_rps": round(total / elapsed_s, 2) if elapsed_s else 0.0,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "p50_ms": round(_percentile(all_latencies, 50), 3),
+            "p95_ms": round(_percentile(all_latencies, 95), 3),
+            "p99_ms": round(_percentile(all_latencies, 99), 3),
+            "tools": per_tool,
+        }
+
+
+async def _call(session: ClientSession, tool: str, args: Dict[str, Any], stats: LoadStats, timeout_s: float) -> None:
+    started = time.perf_counter()
+    ok = True
+    try:
+        result = await asyncio.wait_for(session.call_tool(tool, args), timeout_s)
+        text = result.content[0].text if result.content else ""
+        # Handlers report failures as text rather than protocol errors
+        ok = not result.isError and not text.startswith("Error")
+    except Exception:
+        ok = False
+    stats.record(tool, (time.perf_counter() - started) * 1000, ok)
+
+
+async def run_stage(
+    sessions: List[ClientSession],
+    mix: Dict[str, float],
+    rate: float,
+    duration_s: float,
+    event_ids: List[str],
+    max_in_flight: int,
+    timeout_s: float,
+    seed: int,
+) -> Dict[str, Any]:
+    """
+    Issue calls at ``rate`` per second for ``duration_s`` seconds.
+
+    Returns:
+        Stage summary (see LoadStats.summary) plus the target rate
+    """
+    rng = random.Random(seed)
+    tools = list(mix)
+    weights = [mix[t] for t in tools]
+    stats = LoadStats()
+    in_flight: set = set()
+    interval = 1.0 / rate
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    next_at = started
+    i = 0
+    while next_at - started < duration_s:
+        delay = next_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            # Server can't keep up; count it rather than queueing unboundedly
+            stats.dropped += 1
+        else:
+            tool = rng.choices(tools, weights)[0]
+            task = asyncio.create_task(
+                _call(sessions[i % len(sessions)], tool, make_arguments(tool, rng, event_ids), stats, timeout_s)
+            )
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        i += 1
+        next_at += interval
+
+    if in_flight:
+        await asyncio.wait(in_flight)
+    summary = stats.summary(loop.time() - started)
+    summary["target_rps"] = rate
+    return summary
+
+
+async def _discover_event_ids(session: ClientSession) -> List[str]:
+    result = await session.call_tool("search_events", {"limit": 200})
+    text = result.content[0].text if result.content else ""
+    return EVENT_ID_PATTERN.findall(text)
+
+
+def _print_summary(summary: Dict[str, Any]) -> None:
+    print(
+        f"target {summary['target_rps']:>7.1f} rps | achieved {summary['throughput_rps']:>7.1f} rps | "
+        f"p50 {summary['p50_ms']:.1f} p95 {summary['p95_ms']:.1f} p99 {summary['p99_ms']:.1f} ms | "
+        f"errors {summary['error_rate']:.2%} | dropped {summary['dropped']}"
+    )
+    for tool, stats in summary["tools"].items():
+        print(
+            f"    {tool:<28} n={stats['calls']:<6} p50 {stats['p50_ms']:>8.1f} "
+            f"p95 {stats['p95_ms']:>8.1f} p99 {stats['p99_ms']:>8.1f} ms  err {stats['error_rate']:.2%}"
+        )
+
+
+def _slo_broken(summary: Dict[str, Any], slo_p99_ms: float, max_error_rate: float) -> bool:
+    return (
+        summary["p99_ms"] > slo_p99_ms
+        or summary["error_rate"] > max_error_rate
+        or summary["throughput_rps"] < 0.9 * summary["target_rps"]
+    )
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    mix = parse_mix(args.mix)
+    report: Dict[str, Any] = {"url": args.url, "sessions": args.sessions, "mix": mix, "stages": []}
+
+    async with AsyncExitStack() as stack:
+        sessions = []
+        for _ in range(args.sessions):
+            read_stream, write_stream = await stack.enter_async_context(sse_client(args.url))
+            session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+            await session.initialize()
+            sessions.append(session)
+        print(f"Opened {len(sessions)} session(s) to {args.url}")
+
+        event_ids = await _discover_event_ids(sessions[0])
+
+        if args.ramp:
+            start, step, stop = (float(x) for x in args.ramp.split(":"))
+            rate = start
+            last_good = None
+            while rate <= stop:
+                summary = await run_stage(sessions, mix, rate, args.duration, event_ids,
+                                          args.max_in_flight, args.timeout, args.seed)
+                _print_summary(summary)
+                report["stages"].append(summary)
+                if _slo_broken(summary, args.slo_p99_ms, args.max_error_rate):
+                    print(f"SLO broken at {rate:.1f} rps")
+                    break
+                last_good = rate
+                rate += step
+            report["max_sustainable_rps"] = last_good
+            print(f"Max sustainable rate: {last_good} rps (p99 <= {args.slo_p99_ms} ms)")
+        else:
+            summary = await run_stage(sessions, mix, args.rate, args.duration, event_ids,
+                                      args.max_in_flight, args.timeout, args.seed)
+            _print_summary(summary)
+            report["stages"].append(summary)
+
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the NYC Events MCP SSE server")
+    parser.add_argument("--url", default="http://localhost:8080/sse", help="SSE endpoint URL")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent MCP client sessions")
+    parser.add_argument("--rate", type=float, default=50.0, help="Target calls per second")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per stage")
+    parser.add_argument("--mix", default=None, help="Tool weights, e.g. search_events=3,get_event_by_id=1")
+    parser.add_argument("--ramp", default=None, help="start:step:max rate; ramps until the SLO breaks")
+    parser.add_argument("--slo-p99-ms", type=float, default=250.0, help="p99 latency SLO for ramp mode")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Error rate SLO for ramp mode")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="Calls in flight before new ones are dropped")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-call timeout in seconds")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default=None, help="Optional JSON report path")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote report to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Memory and throughput of materialized result rows.
+
+Compares the old per-row dictionaries (built from ``sqlite3.Row``) with the
+slotted EventRecord objects on large result sets, reporting peak traced
+memory and materialization time.
+
+Usage (from the nyc_events_mcp/ directory):
+    python -m benchmarks.records --size 100k --rows 50000
+"""
+
+import argparse
+import gc
+import os
+import sqlite3
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from . import dataset
+
+from nyc_events_mcp.tools.records import EVENT_SELECT, EventRecord
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data")
+
+
+def _as_dicts(conn: sqlite3.Connection, sql: str, params: tuple) -> List[Dict[str, Any]]:
+    conn.row_factory = sqlite3.Row
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.row_factory = None
+
+
+def _as_records(conn: sqlite3.Connection, sql: str, params: tuple) -> List[EventRecord]:
+    cursor = conn.cursor()
+    cursor.row_factory = EventRecord.row_factory
+    return cursor.execute(sql, params).fetchall()
+
+
+def measure(materialize: Callable[[], List[Any]], repeat: int) -> Dict[str, Any]:
+    """
+    Time a materialization and trace its peak memory.
+
+    Args:
+        materialize: Zero-argument callable returning the rows
+        repeat: Timed iterations (memory is traced on a separate run)
+
+    Returns:
+        Row count, best time in milliseconds and peak memory in bytes
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        rows = materialize()
+        timings.append((time.perf_counter() - started) * 1000)
+        del rows
+
+    gc.collect()
+    tracemalloc.start()
+    rows = materialize()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"rows": len(rows), "best_ms": min(timings), "peak_bytes": peak}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare dict rows with slotted event records")
+    parser.add_argument("--size", default="100k", help="Dataset size (10k, 100k, 1m, ...)")
+    parser.add_argument("--rows", type=int, default=50_000, help="Rows materialized per query")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed iterations per variant")
+    parser.add_argument("--seed", type=int, default=dataset.DEFAULT_SEED)
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Where generated databases are cached")
+    args = parser.parse_args()
+
+    db_path = dataset.ensure_database(args.data_dir, dataset.parse_size(args.size), seed=args.seed)
+    conn = sqlite3.connect(db_path)
+    sql = f"SELECT {EVENT_SELECT} FROM event_details ORDER BY date, start_time_local LIMIT ?"
+    params = (args.rows,)
+
+    results = {
+        "dict": measure(lambda: _as_dicts(conn, sql, params), args.repeat),
+        "EventRecord": measure(lambda: _as_records(conn, sql, params), args.repeat),
+    }
+    conn.close()
+
+    print(f"{'variant':<12} {'rows':>8} {'best ms':>9} {'peak MiB':>9} {'bytes/row':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<12} {result['rows']:>8,} {result['best_ms']:>9.1f} "
+            f"{result['peak_bytes'] / 2**20:>9.1f} {result['peak_bytes'] / max(result['rows'], 1):>10.0f}"
+        )
+    ratio = results["dict"]["peak_bytes"] / max(results["EventRecord"]["peak_bytes"], 1)
+    print(f"\nEventRecord uses {ratio:.1f}x less peak memory than per-row dicts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+Micro-benchmarks for EventsService methods and tool handlers.
+
+Runs every case against synthetic datasets of the requested sizes and
+writes JSON results that benchmarks.compare can diff across runs.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from . import dataset
+
+from nyc_events_mcp import server
+from nyc_events_mcp.tools.events_service import EventsService
+from nyc_events_mcp.tools.user_prefs import UserPrefs, get_prefs_store
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data")
+
+# Fixed query parameters so runs are comparable
+TIMES_SQUARE = (40.7580, -73.9855)
+MIDTOWN_TO_EAST_VILLAGE = [(40.7527, -73.9772), (40.7265, -73.9815)]
+DAY = "2025-10-25"
+WEEK = ("2025-10-24", "2025-10-30")
+
+# User seeded into the run's temporary preferences database
+BENCH_USER = "bench"
+BENCH_PREFS = {
+    "name": "Bench",
+    "city": "New York, NY",
+    "home": {"latitude": TIMES_SQUARE[0], "longitude": TIMES_SQUARE[1]},
+    "wake_hour": 8,
+    "diet": "vegetarian",
+    "interests": ["live jazz", "museums", "indie film"],
+    "travel_buffer_min": 15,
+}
+
+# Saved searches the user has before the saved search cases run
+BENCH_SAVED_SEARCHES = 5
+
+# (case name, coroutine factory taking the service)
+SERVICE_CASES: List[Tuple[str, Callable[[EventsService], Awaitable[Any]]]] = [
+    ("search_events.keyword", lambda es: es.search_events(query="Jazz", limit=20)),
+    ("search_events.category_week", lambda es: es.search_events(category="music", start_date=WEEK[0], end_date=WEEK[1], limit=20)),
+    ("search_events.no_filters", lambda es: es.search_events(limit=20)),
+    ("search_events.neighborhood_week", lambda es: es.search_events(neighborhood="Williamsburg", start_date=WEEK[0], end_date=WEEK[1], limit=20)),
+    ("search_events.borough", lambda es: es.search_events(borough="Brooklyn", limit=20)),
+    ("get_search_facets.keyword", lambda es: es.get_search_facets(query="Jazz")),
+    ("semantic_search_events", lambda es: es.semantic_search_events("live jazz", limit=20)),
+    ("semantic_search_events.category_week", lambda es: es.semantic_search_events("sports", category="football", start_date=WEEK[0], end_date=WEEK[1], limit=20)),
+    ("get_events_by_category", lambda es: es.get_events_by_category("museum", limit=20)),
+    ("get_events_by_date_range.day", lambda es: es.get_events_by_date_range(DAY, DAY, limit=50)),
+    ("find_events_near_location.2km", lambda es: es.find_events_near_location(*TIMES_SQUARE, radius_km=2.0, limit=20)),
+    ("find_events_near_location.day_1km", lambda es: es.find_events_near_location(*TIMES_SQUARE, radius_km=1.0, start_date=DAY, end_date=DAY, limit=20)),
+    ("find_events_near_location.travel_20min", lambda es: es.find_events_near_location(*TIMES_SQUARE, max_travel_minutes=20, limit=20)),
+    ("find_events_along_route.midtown_east_village", lambda es: es.find_events_along_route(MIDTOWN_TO_EAST_VILLAGE, corridor_km=0.5, limit=20)),
+    ("get_events_at_venue", lambda es: es.get_events_at_venue(1, limit=20)),
+    ("get_all_categories", lambda es: es.get_all_categories()),
+    ("get_day_digest.weekend", lambda es: es.get_day_digest("2025-10-24", "2025-10-26")),
+    ("get_day_listing.day", lambda es: es.get_day_listing(DAY)),
+    ("get_day_listing.category_day", lambda es: es.get_day_listing(DAY, category="music")),
+    ("get_day_versions", lambda es: es.get_day_versions()),
+]
+
+# (case name, tool name, arguments); get_event_by_id uses a real id at runtime and
+# each delete_saved_search call deletes a search saved for it beforehand
+TOOL_CASES: List[Tuple[str, str, Dict[str, Any]]] = [
+    ("search_events", "search_events", {"query": "Jazz", "limit": 20}),
+    ("search_events.facets", "search_events", {"query": "Jazz", "limit": 20, "facets": True}),
+    ("semantic_search_events", "semantic_search_events", {"query": "tech meetups", "limit": 10}),
+    ("get_events_by_category", "get_events_by_category", {"category": "music", "start_date": WEEK[0], "end_date": WEEK[1]}),
+    ("get_events_by_date_range", "get_events_by_date_range", {"start_date": DAY, "end_date": DAY}),
+    ("get_events_by_date_range.neighborhood", "get_events_by_date_range", {"start_date": WEEK[0], "end_date": WEEK[1], "neighborhood": "East Village"}),
+    ("get_events_by_date_range.trending", "get_events_by_date_range", {"start_date": DAY, "end_date": DAY, "limit": 10, "sort": "trending"}),
+    ("get_events_by_date_range.changed_since", "get_events_by_date_range", {"start_date": WEEK[0], "end_date": WEEK[1], "changed_since": "2100-01-01T00:00:00Z"}),
+    ("get_events_by_date_range.rank_for_user", "get_events_by_date_range", {"start_date": DAY, "end_date": DAY, "limit": 10, "rank_for_user": BENCH_USER}),
+    ("find_events_near_location", "find_events_near_location", {"latitude": TIMES_SQUARE[0], "longitude": TIMES_SQUARE[1]}),
+    ("find_events_near_location.place", "find_events_near_location", {"place": "Union Square"}),
+    ("find_events_near_location.travel_sort", "find_events_near_location", {"latitude": TIMES_SQUARE[0], "longitude": TIMES_SQUARE[1], "sort": "travel"}),
+    ("find_events_along_route", "find_events_along_route", {"waypoints": [{"latitude": lat, "longitude": lon} for lat, lon in MIDTOWN_TO_EAST_VILLAGE]}),
+    ("get_events_at_venue", "get_events_at_venue", {"venue_id": 1}),
+    ("get_event_by_id", "get_event_by_id", {}),
+    ("trending_events", "trending_events", {"limit": 10}),
+    ("get_event_categories", "get_event_categories", {}),
+    ("get_neighborhoods", "get_neighborhoods", {}),
+    ("get_day_digest", "get_day_digest", {"date": DAY}),
+    ("get_user_preferences", "get_user_preferences", {"user_id": BENCH_USER}),
+    ("get_my_recommendations", "get_my_recommendations", {"user_id": BENCH_USER, "date": DAY}),
+    ("list_saved_searches", "list_saved_searches", {"user_id": BENCH_USER}),
+    ("save_search.near_home", "save_search", {"user_id": BENCH_USER, "name": "Jazz near home", "query": "jazz", "near_home": True}),
+    ("delete_saved_search", "delete_saved_search", {"user_id": BENCH_USER}),
+]
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def measure(
+    func: Callable[[], Awaitable[Any]],
+    repeat: int,
+    warmup: int,
+    max_seconds: float,
+) -> Dict[str, Any]:
+    """
+    Time an async callable.
+
+    Args:
+        func: Zero-argument coroutine factory
+        repeat: Maximum timed iterations
+        warmup: Untimed iterations run first
+        max_seconds: Stop early once this much time has been spent timing
+
+    Returns:
+        Summary statistics in milliseconds
+    """
+    for _ in range(warmup):
+        await func()
+
+    samples: List[float] = []
+    budget_start = time.perf_counter()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started) * 1000)
+        if time.perf_counter() - budget_start > max_seconds:
+            break
+
+    return {
+        "iterations": len(samples),
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(_percentile(samples, 95), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+    }
+
+
+def prepare_prefs_store(path: str) -> None:
+    """
+    Point the preferences store at a fresh database holding BENCH_USER, so the write tools leave no trace.
+
+    Args:
+        path: SQLite path for the run's preferences database
+    """
+    os.environ["NYC_EVENTS_PREFS_DB"] = path
+    store = get_prefs_store()
+    if store.db_path != path:
+        raise RuntimeError(f"Preferences store already opened at {store.db_path}")
+    store.put(UserPrefs.from_prefs_json(BENCH_USER, BENCH_PREFS))
+
+
+def _sample_event_id(db_path: str) -> str:
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT event_id FROM events LIMIT 1 OFFSET 7").fetchone()[0]
+    finally:
+        conn.close()
+
+
+async def run_size(db_path: str, repeat: int, warmup: int, max_seconds: float) -> Dict[str, Any]:
+    """
+    Run all benchmark cases against one database.
+    """
+    results: Dict[str, Any] = {}
+    service = EventsService(db_path)
+
+    # Recommendations stored for the previous dataset would be served as precomputed,
+    # and saved searches carry over between sizes
+    store = get_prefs_store()
+    store.delete_recommendations_before("9999-12-31")
+    for search in store.saved_searches(BENCH_USER):
+        store.delete_saved_search(BENCH_USER, search["search_id"])
+    for i in range(BENCH_SAVED_SEARCHES):
+        await service.save_search(BENCH_USER, f"Saved search {i}", query="jazz", category="music")
+
+    for name, factory in SERVICE_CASES:
+        results[f"service.{name}"] = await measure(lambda: factory(service), repeat, warmup, max_seconds)
+        print(f"  service.{name}: {results[f'service.{name}']['median_ms']} ms")
+
+    if not server.tool_names():
+        server.register_all_tools()
+    for tool_name in server.tool_names():
+        server.get_tool_handler(tool_name).events_service = service
+
+    event_id = _sample_event_id(db_path)
+    for name, tool_name, args in TOOL_CASES:
+        handler = server.get_tool_handler(tool_name)
+        if tool_name == "get_event_by_id":
+            args = {"event_id": event_id}
+        if tool_name == "delete_saved_search":
+            search_ids = [
+                (await service.save_search(BENCH_USER, f"To delete {i}", query="jazz"))["search_id"]
+                for i in range(warmup + repeat)
+            ]
+            func = lambda: handler.run_tool({**args, "search_id": search_ids.pop()})
+        else:
+            func = lambda: handler.run_tool(dict(args))
+        results[f"tool.{name}"] = await measure(func, repeat, warmup, max_seconds)
+        print(f"  tool.{name}: {results[f'tool.{name}']['median_ms']} ms")
+
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(sizes: List[str], repeat: int, warmup: int, max_seconds: float, seed: int, data_dir: str) -> Dict[str, Any]:
+    """
+    Run the suite for each dataset size and return the results document.
+    """
+    report: Dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "warmup": warmup,
+        },
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="nyc-events-bench-") as prefs_dir:
+        prepare_prefs_store(os.path.join(prefs_dir, "users.sqlite"))
+        for size in sizes:
+            rows = dataset.parse_size(size)
+            db_path = dataset.ensure_database(data_dir, rows, seed=seed)
+            print(f"Benchmarking {size} ({rows:,} rows)")
+            report["results"][size] = await run_size(db_path, repeat, warmup, max_seconds)
+        get_prefs_store().close()
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run NYC Events MCP benchmarks")
+    parser.add_argument("--sizes", default="10k,100k", help="Comma-separated dataset sizes (10k, 100k, 1m, 10m)")
+    parser.add_argument("--repeat", type=int, default=50, help="Maximum timed iterations per case")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed warmup iterations per case")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="Time budget per case")
+    parser.add_argument("--seed", type=int, default=dataset.DEFAULT_SEED)
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Where generated databases are cached")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results path")
+    args = parser.parse_args()
+
+    # Per-call INFO logs would dominate the timings
+    logging.getLogger("nyc-events-mcp").setLevel(logging.WARNING)
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    report = asyncio.run(run(sizes, args.repeat, args.warmup, args.max_seconds, args.seed, args.data_dir))
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote results to {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
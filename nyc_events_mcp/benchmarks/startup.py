@@ -0,0 +1,222 @@
+"""
+Cold-start budget check for stdio mode.
+
+Nearly all of the time from spawning ``python -m nyc_events_mcp.server`` to
+the first ``list_tools`` response is importing the MCP SDK, so budgets are
+ratios to a bare ``mcp.server`` stdio server with one tool, measured on the
+same machine:
+
+- import overhead: the modules our first list_tools loads on top of
+  ``mcp.server`` (``-X importtime``), as a fraction of importing ``mcp.server``
+- wall-clock overhead: the median difference between our time to first
+  list_tools and the bare server's, started alternately, as a fraction of
+  the bare server's
+
+Exits non-zero if either exceeds its budget, so it can gate CI.
+
+Usage (from the nyc_events_mcp/ directory):
+    python -m benchmarks.startup --runs 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from . import SRC_DIR
+
+# Our imports measured at ~1% of mcp.server's with tool modules, the events
+# service and resources imported on first use (~2.2% when they were eager)
+DEFAULT_IMPORT_BUDGET_RATIO = 0.015
+
+# Wall-clock overhead measured at 2-4% of the bare server's time to first
+# list_tools; the margin absorbs process start-up noise
+DEFAULT_BUDGET_RATIO = 0.10
+
+# Modules imported up to the first list_tools response: the server module,
+# then the tool handlers list_tools constructs
+FIRST_LIST_TOOLS_MODULES = ["nyc_events_mcp.server", "nyc_events_mcp.tools.tools_events"]
+
+# Baseline: the smallest stdio server the MCP SDK can answer list_tools with
+BARE_SERVER = """
+import asyncio
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+from mcp.types import Tool
+
+app = Server("bare")
+
+@app.list_tools()
+async def list_tools():
+    return [Tool(name="noop", description="No-op", inputSchema={"type": "object", "properties": {}})]
+
+async def main():
+    async with stdio_server() as (read_stream, write_stream):
+        await app.run(read_stream, write_stream, app.create_initialization_options())
+
+asyncio.run(main())
+"""
+
+SERVER_ARGS = ["-m", "nyc_events_mcp.server", "--mode", "stdio"]
+BARE_SERVER_ARGS = ["-c", BARE_SERVER]
+
+
+def _server_env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _import_times(modules: List[str]) -> List[Tuple[int, int, str, int]]:
+    """
+    Import modules in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        [(self_us, cumulative_us, module, nesting level)] in import order
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True, text=True, env=_server_env(), check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        level = (len(module) - len(module.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), module.strip(), level))
+    return rows
+
+
+def import_time_report(top: int = 15) -> Tuple[int, List[Tuple[int, int, str]]]:
+    """
+    Run ``-X importtime`` on the server module.
+
+    Args:
+        top: Number of modules to return
+
+    Returns:
+        (total cumulative microseconds, [(self_us, cumulative_us, module)] sorted by cumulative time)
+    """
+    rows = [(self_us, cumulative_us, module) for self_us, cumulative_us, module, _ in _import_times(["nyc_events_mcp.server"])]
+    total = next((cumulative_us for _, cumulative_us, module in rows if module == "nyc_events_mcp.server"), 0)
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return total, rows[:top]
+
+
+def measure_import_overhead(runs: int) -> Tuple[float, float]:
+    """
+    Time importing ``mcp.server`` and then the modules our first list_tools adds to it.
+
+    Args:
+        runs: Fresh interpreters to time
+
+    Returns:
+        (median mcp.server import ms, median ms of our modules on top of it)
+    """
+    bare: List[float] = []
+    ours: List[float] = []
+    for _ in range(runs):
+        rows = _import_times(["mcp.server", "mcp.server.stdio", *FIRST_LIST_TOOLS_MODULES])
+        top_level = [(cumulative_us, module) for _, cumulative_us, module, level in rows if level == 0]
+        bare.append(sum(us for us, module in top_level if not module.startswith("nyc_events_mcp")) / 1000)
+        ours.append(sum(us for us, module in top_level if module.startswith("nyc_events_mcp")) / 1000)
+    return statistics.median(bare), statistics.median(ours)
+
+
+async def time_to_first_list_tools(args: List[str] = SERVER_ARGS) -> float:
+    """
+    Spawn a stdio server and time until list_tools returns.
+
+    Args:
+        args: Python arguments starting the server (default: ours)
+
+    Returns:
+        Elapsed milliseconds
+    """
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=args,
+        env=_server_env(),
+    )
+    started = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                result = await session.list_tools()
+                elapsed = (time.perf_counter() - started) * 1000
+    if not result.tools:
+        raise RuntimeError("Server returned no tools")
+    return elapsed
+
+
+def measure_overhead(runs: int) -> Tuple[float, float]:
+    """
+    Time cold starts of the bare server and ours, alternating so both see the same machine load.
+
+    Args:
+        runs: Cold starts of each server
+
+    Returns:
+        (median bare server ms, median of the per-pair differences of ours over it in ms)
+    """
+    bare: List[float] = []
+    overhead: List[float] = []
+    for _ in range(runs):
+        bare_ms = asyncio.run(time_to_first_list_tools(BARE_SERVER_ARGS))
+        overhead.append(asyncio.run(time_to_first_list_tools()) - bare_ms)
+        bare.append(bare_ms)
+    return statistics.median(bare), statistics.median(overhead)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure stdio cold start of the NYC Events MCP server")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts to time, of each server")
+    parser.add_argument("--budget-ratio", type=float, default=DEFAULT_BUDGET_RATIO,
+                        help=f"Budget for the wall-clock overhead, as a fraction of the bare server's "
+                             f"time to first list_tools (default: {DEFAULT_BUDGET_RATIO})")
+    parser.add_argument("--import-budget-ratio", type=float, default=DEFAULT_IMPORT_BUDGET_RATIO,
+                        help=f"Budget for our import time, as a fraction of importing mcp.server "
+                             f"(default: {DEFAULT_IMPORT_BUDGET_RATIO})")
+    parser.add_argument("--top", type=int, default=15, help="Imports to show in the importtime report")
+    args = parser.parse_args()
+
+    total_us, rows = import_time_report(args.top)
+    print(f"import nyc_events_mcp.server: {total_us / 1000:.1f} ms cumulative")
+    print(f"{'self ms':>9} {'cum ms':>9}  module")
+    for self_us, cumulative_us, module in rows:
+        print(f"{self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}  {module}")
+
+    failed = False
+    bare_import_ms, import_ms = measure_import_overhead(args.runs)
+    import_ratio = import_ms / bare_import_ms
+    print(f"\nimports up to first list_tools: {import_ms:.1f} ms on top of mcp.server "
+          f"({bare_import_ms:.0f} ms), {import_ratio:.1%} (budget {args.import_budget_ratio:.1%})")
+    if import_ratio > args.import_budget_ratio:
+        print("FAIL: import overhead exceeds its budget")
+        failed = True
+
+    bare_ms, overhead_ms = measure_overhead(args.runs)
+    ratio = overhead_ms / bare_ms
+    print(f"time to first list_tools: {overhead_ms:.0f} ms over the bare server "
+          f"({bare_ms:.0f} ms), {ratio:.1%} (budget {args.budget_ratio:.1%})")
+    if ratio > args.budget_ratio:
+        print("FAIL: wall-clock overhead exceeds its budget")
+        failed = True
+
+    if failed:
+        return 1
+    print("OK: within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,7 +36,7 @@ async def demo():
     
     for i, event in enumerate(nearby, 1):
         print(f"{i}. {event['title']}")
-        print(f"   📍 {event['venue_name']} ({event['distance_km']}km away)")
+        print(f"   📍 {event['venue_name']} ({event.distance_km:.2f}km away)")
         print(f"   🕒 {event['start_time_local'].split('T')[1]} - {event['end_time_local'].split('T')[1]}")
         print(f"   📅 {event['date']}")
         print()
@@ -109,7 +109,7 @@ async def demo():
         for i, event in enumerate(popup_nearby, 1):
             print(f"\n{i}. {event['title']}")
             print(f"   📍 {event['venue_name']}")
-            print(f"   🚶 {event['distance_km']}km ({event['distance_miles']} miles) away")
+            print(f"   🚶 {event.distance_km:.2f}km ({event.distance_miles:.2f} miles) away")
             print(f"   🕒 {event['start_time_local'].split('T')[1]} - {event['end_time_local'].split('T')[1]}")
             print(f"   📅 {event['date']}")
     else:
@@ -0,0 +1,440 @@
+"""
+Async client for the NYC Events MCP server.
+
+Backend jobs use ``EventsClient`` to call the SSE server, rather than going
+through mcpo or importing EventsService directly::
+
+    async with EventsClient("http://127.0.0.1:8022/sse") as client:
+        events = await client.get_events_by_date_range("2025-10-24", "2025-10-26", category="music")
+        for event in events:
+            print(event.title, event.venue_name, event.start_time_local)
+
+The client keeps ``pool_size`` MCP sessions open. An MCP session matches
+responses to requests by id, so each session carries up to
+``max_in_flight`` concurrent calls pipelined over one connection. New calls
+go to the least busy session, so high call rates pay no per-call connection
+setup.
+
+A session whose connection drops (server restart, idle timeout) is reopened
+on its next use. A call that failed because of the drop is retried once,
+unless it is a tool that writes (``WRITE_TOOLS``), which is never retried.
+
+Tool calls ask the server for structured results (``_meta.structured``), so
+events come back as ``EventRecord`` objects rather than formatted text.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TypeVar
+
+import anyio
+import httpx
+from mcp import ClientSession, McpError
+from mcp.client.sse import sse_client
+from mcp.shared.session import ProgressFnT
+from mcp.types import (
+    CONNECTION_CLOSED,
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    ClientRequest,
+    TextContent,
+    TextResourceContents,
+)
+from pydantic import AnyUrl
+
+from .tools.records import EventRecord
+from .tracing import current_traceparent, span
+
+logger = logging.getLogger("nyc-events-mcp")
+
+DEFAULT_URL = "http://127.0.0.1:8022/sse"
+
+DEFAULT_POOL_SIZE = 4
+
+# Concurrent calls per session
+DEFAULT_MAX_IN_FLIGHT = 16
+
+# Seconds to wait for the server to connect or answer a call
+DEFAULT_TIMEOUT_S = 30.0
+
+# Tools that change user data; a dropped call may already have been applied, so they are not retried
+WRITE_TOOLS = frozenset({"save_search", "delete_saved_search"})
+
+# Attempts per call when the connection drops
+RETRY_ATTEMPTS = 2
+
+T = TypeVar("T")
+
+
+class EventsClientError(Exception):
+    """The server reported an error for a call."""
+
+
+class EventsConnectionError(EventsClientError):
+    """The server could not be reached, or the connection dropped during a call."""
+
+
+class ToolResult:
+    """
+    The answer to one tool call.
+    """
+
+    __slots__ = ("text", "events", "truncated")
+
+    def __init__(self, text: str, events: Optional[List[EventRecord]], truncated: bool):
+        """
+        Args:
+            text: The tool's text answer, as an assistant would see it
+            events: Events the tool returned (None if it returns no event list or failed)
+            truncated: Whether the server cut the call short at its deadline
+        """
+        self.text = text
+        self.events = events
+        self.truncated = truncated
+
+    @classmethod
+    def from_result(cls, result: CallToolResult) -> "ToolResult":
+        """Build from a tools/call result; raises EventsClientError if the server flagged an error."""
+        text = "\n\n".join(content.text for content in result.content if isinstance(content, TextContent))
+        if result.isError:
+            raise EventsClientError(text)
+        structured = result.structuredContent or {}
+        events = structured.get("events")
+        return cls(
+            text=text,
+            events=None if events is None else [EventRecord.from_dict(event) for event in events],
+            truncated=bool(structured.get("truncated")),
+        )
+
+    def __repr__(self) -> str:
+        count = "no events" if self.events is None else f"{len(self.events)} events"
+        return f"ToolResult({count}, truncated={self.truncated})"
+
+
+def _connection_lost(error: BaseException) -> bool:
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return isinstance(error, (
+        EventsConnectionError,
+        anyio.ClosedResourceError,
+        anyio.BrokenResourceError,
+        anyio.EndOfStream,
+        httpx.TransportError,
+    ))
+
+
+def _root_cause(error: BaseException) -> BaseException:
+    # Transport failures surface wrapped in (nested) task group exception groups
+    while getattr(error, "exceptions", None):
+        error = error.exceptions[0]
+    return error
+
+
+class _Connection:
+    """
+    One persistent MCP session over SSE.
+
+    The session is opened and closed by a task of its own, because the SSE
+    transport's context must be exited in the task that entered it; calls
+    from any task share the session.
+    """
+
+    def __init__(self, url: str, headers: Optional[Dict[str, str]], timeout: float):
+        self.url = url
+        self.headers = headers
+        self.timeout = timeout
+        # Calls currently assigned to this connection
+        self.in_flight = 0
+        self._session: Optional[ClientSession] = None
+        # Calls awaiting a response on the current session
+        self._requests: Set[asyncio.Future] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self._session is not None and self._task is not None and not self._task.done()
+
+    async def session(self) -> ClientSession:
+        """Return the open session, (re)connecting first if needed."""
+        if self.alive:
+            return self._session
+        async with self._lock:
+            if not self.alive:
+                await self.close()
+                await self._open()
+            return self._session
+
+    async def call(self, work: Callable[[ClientSession], Awaitable[T]]) -> T:
+        """
+        Run a request on the session.
+
+        Returns:
+            The request's result; raises EventsConnectionError if the connection
+            drops first (a response can no longer arrive, so nothing waits for the timeout)
+        """
+        request = asyncio.ensure_future(work(await self.session()))
+        self._requests.add(request)
+        try:
+            await asyncio.wait({request})
+        finally:
+            self._requests.discard(request)
+            if not request.done():
+                request.cancel()
+        if request.cancelled():
+            raise EventsConnectionError(f"Connection to {self.url} closed during the call")
+        return request.result()
+
+    async def _open(self) -> None:
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._run(ready))
+        try:
+            self._session = await ready
+        except Exception as e:
+            raise EventsConnectionError(f"Could not connect to {self.url}: {str(_root_cause(e))}") from e
+        logger.debug(f"Connected to {self.url}")
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        try:
+            async with sse_client(self.url, headers=self.headers, timeout=self.timeout) as (read, write):
+                forward, incoming = anyio.create_memory_object_stream(0)
+                async with anyio.create_task_group() as task_group:
+                    task_group.start_soon(self._forward, read, forward)
+                    async with ClientSession(
+                        incoming, write, read_timeout_seconds=timedelta(seconds=self.timeout)
+                    ) as session:
+                        await session.initialize()
+                        ready.set_result(session)
+                        await self._closing.wait()
+                    task_group.cancel_scope.cancel()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.info(f"Connection to {self.url} closed: {str(_root_cause(e))}")
+        finally:
+            self._session = None
+            if not ready.done():
+                ready.set_exception(EventsConnectionError("Connection closed while opening"))
+
+    async def _forward(self, read: Any, forward: Any) -> None:
+        # The SSE transport reports a dropped stream as an exception message (or
+        # just ends it) without closing the session; ending the session's stream
+        # here fails its pending calls with CONNECTION_CLOSED and reconnects later.
+        async with forward:
+            async for message in read:
+                if isinstance(message, Exception):
+                    logger.info(f"Connection to {self.url} lost: {str(message)}")
+                    break
+                await forward.send(message)
+        self.discard()
+
+    def discard(self) -> None:
+        """Drop a broken session, failing the calls waiting on it; the next call reconnects."""
+        self._session = None
+        self._closing.set()
+        for request in self._requests:
+            request.cancel()
+
+    async def close(self) -> None:
+        """Close the session and wait for its connection to shut down."""
+        self.discard()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+class EventsClient:
+    """
+    Pooled async client for the NYC Events MCP server's SSE endpoint.
+
+    Use it as an async context manager, or call connect() and close().
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_URL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: float = DEFAULT_TIMEOUT_S,
+        deadline_s: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            url: SSE endpoint of the server
+            pool_size: Sessions kept open
+            max_in_flight: Concurrent calls per session; further calls wait for a free slot
+            timeout: Seconds to wait for a connection or a response
+            deadline_s: Default deadline sent with each tool call (_meta.deadlineMs); the
+                server cuts slower calls short and returns partial results
+            headers: Extra HTTP headers (e.g. authentication for a proxy)
+        """
+        if pool_size < 1 or max_in_flight < 1:
+            raise ValueError("pool_size and max_in_flight must be at least 1")
+        self.url = url
+        self.deadline_s = deadline_s
+        self._connections = [_Connection(url, headers, timeout) for _ in range(pool_size)]
+        self._slots = asyncio.Semaphore(pool_size * max_in_flight)
+
+    async def __aenter__(self) -> "EventsClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """
+        Open every session of the pool.
+
+        Connecting up front is optional (sessions open on first use) but
+        reports an unreachable server immediately.
+        """
+        results = await asyncio.gather(
+            *(connection.session() for connection in self._connections),
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await self.close()
+            raise errors[0]
+
+    async def close(self) -> None:
+        """Close every session."""
+        await asyncio.gather(*(connection.close() for connection in self._connections))
+
+    async def _with_session(self, work: Callable[[ClientSession], Awaitable[T]], retry: bool = True) -> T:
+        """
+        Run ``work`` on the least busy session, reconnecting and retrying once if the connection drops.
+        """
+        attempts = RETRY_ATTEMPTS if retry else 1
+        attempt = 1
+        async with self._slots:
+            while True:
+                connection = min(self._connections, key=lambda candidate: candidate.in_flight)
+                connection.in_flight += 1
+                try:
+                    return await connection.call(work)
+                except Exception as e:
+                    if not _connection_lost(e):
+                        if isinstance(e, McpError):
+                            raise EventsClientError(e.error.message) from e
+                        raise
+                    connection.discard()
+                    if attempt >= attempts:
+                        if isinstance(e, EventsConnectionError):
+                            raise
+                        raise EventsConnectionError(f"Connection to {self.url} lost: {str(e)}") from e
+                    logger.info(f"Connection to {self.url} lost ({str(e)}); retrying on a new session")
+                    attempt += 1
+                finally:
+                    connection.in_flight -= 1
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        deadline_s: Optional[float] = None,
+        progress_callback: Optional[ProgressFnT] = None
+    ) -> ToolResult:
+        """
+        Call a tool.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            deadline_s: Deadline for this call (default: the client's deadline_s)
+            progress_callback: Receives streamed partial results as progress notifications
+
+        Returns:
+            ToolResult with the text answer and, for event listings, typed events;
+            raises EventsClientError if the server returned an error and
+            EventsConnectionError if it could not be reached
+        """
+        deadline_s = self.deadline_s if deadline_s is None else deadline_s
+        with span("client.call_tool", tool=name):
+            meta: Dict[str, Any] = {"structured": True}
+            traceparent = current_traceparent()
+            if traceparent:
+                meta["traceparent"] = traceparent
+            if deadline_s is not None:
+                meta["deadlineMs"] = int(deadline_s * 1000)
+            request = ClientRequest(
+                CallToolRequest(params=CallToolRequestParams(name=name, arguments=arguments or {}, _meta=meta))
+            )
+            result = await self._with_session(
+                lambda session: session.send_request(request, CallToolResult, progress_callback=progress_callback),
+                retry=name not in WRITE_TOOLS
+            )
+            return ToolResult.from_result(result)
+
+    async def events(self, tool: str, **arguments) -> List[EventRecord]:
+        """
+        Call an event listing tool and return its events.
+
+        Args:
+            tool: Name of a tool that returns events (search, category, date range, proximity, route, venue, trending, ...)
+            **arguments: Tool arguments
+
+        Returns:
+            The events, in the tool's order; raises EventsClientError if the
+            tool failed or returns no event list
+        """
+        result = await self.call_tool(tool, arguments)
+        if result.events is None:
+            raise EventsClientError(result.text)
+        return result.events
+
+    async def search_events(self, query: Optional[str] = None, **filters) -> List[EventRecord]:
+        """Search events by keyword and filters (category, start_date, end_date, neighborhood, borough, limit, ...)."""
+        if query is not None:
+            filters["query"] = query
+        return await self.events("search_events", **filters)
+
+    async def get_events_by_category(self, category: str, **filters) -> List[EventRecord]:
+        """Events of a category (music, museum, pop-ups, football, movies)."""
+        return await self.events("get_events_by_category", category=category, **filters)
+
+    async def get_events_by_date_range(self, start_date: str, end_date: str, **filters) -> List[EventRecord]:
+        """Events between two dates (YYYY-MM-DD, inclusive)."""
+        return await self.events("get_events_by_date_range", start_date=start_date, end_date=end_date, **filters)
+
+    async def find_events_near_location(
+        self,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        **filters
+    ) -> List[EventRecord]:
+        """Events near a point, or near a named place (place="...")."""
+        if latitude is not None and longitude is not None:
+            filters.update(latitude=latitude, longitude=longitude)
+        return await self.events("find_events_near_location", **filters)
+
+    async def get_event(self, event_id: str) -> Optional[EventRecord]:
+        """
+        Get one event by id.
+
+        Returns:
+            The event, or None if there is no event with that id
+        """
+        result = await self.call_tool("get_event_by_id", {"event_id": event_id})
+        return result.events[0] if result.events else None
+
+    async def read_resource(self, uri: str) -> Dict[str, Any]:
+        """
+        Read an events, venues or saved search resource (see nyc_events_mcp.resources).
+
+        Returns:
+            The JSON document, including its version; raises EventsClientError for unknown resources
+        """
+        result = await self._with_session(lambda session: session.read_resource(AnyUrl(uri)))
+        for contents in result.contents:
+            if isinstance(contents, TextResourceContents):
+                return json.loads(contents.text)
+        raise EventsClientError(f"Resource has no JSON contents: {uri}")
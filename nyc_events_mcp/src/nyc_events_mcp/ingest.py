@@ -0,0 +1,629 @@
+"""
+Ingest path for the NYC events database.
+
+Owns the database schema (versioned with ``PRAGMA user_version``), loads
+events from CSV and keeps derived tables such as the per-day digest in sync
+with the events they summarize. New venues are tagged with their borough and
+neighborhood from the bundled boundary polygons.
+
+Every new or modified event gets ``updated_at`` set to the time of the write
+(re-ingesting an identical row leaves it alone), and removed events leave a
+tombstone, so clients can ask for only what changed since their last poll.
+Each digest row also carries content versions of its day (overall and per
+category), derived from the event count and newest ``updated_at``, which the
+server publishes with its ``events://`` resources.
+After a CSV ingest the changed events are matched against users' saved
+searches (see ``tools/saved_searches.py``).
+
+Usage:
+    python -m nyc_events_mcp.ingest NYC_Events.csv [--db events.sqlite]
+    python -m nyc_events_mcp.ingest --cancel EVENT_ID [EVENT_ID ...] [--db events.sqlite]
+    python -m nyc_events_mcp.ingest --migrate [--db events.sqlite]
+    python -m nyc_events_mcp.ingest --retag-areas [--db events.sqlite]
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .tools.events_service import default_db_path
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# Columns of an ingested event row (CSV layout)
+EVENT_COLUMNS = (
+    "event_id",
+    "title",
+    "category",
+    "date",
+    "start_time_local",
+    "end_time_local",
+    "venue_name",
+    "latitude",
+    "longitude",
+    "description",
+)
+
+# Columns stored in the events table; venue details live in the venues table
+STORED_EVENT_COLUMNS = (
+    "event_id",
+    "title",
+    "category",
+    "date",
+    "start_time_local",
+    "end_time_local",
+    "venue_id",
+    "description",
+)
+
+# Venue coordinates are rounded to ~1m so the same venue deduplicates at ingest
+VENUE_COORD_PRECISION = 5
+
+# Number of venues and highlight events kept per day in the digest
+DIGEST_TOP_VENUES = 5
+DIGEST_HIGHLIGHTS = 5
+
+# Tombstones of removed events are kept this long; older changed_since
+# cursors can no longer see every cancellation
+TOMBSTONE_RETENTION_DAYS = 30
+
+
+def _migrate_v1(conn: sqlite3.Connection) -> None:
+    """Events table, date index and the per-day digest."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS events (
+            event_id TEXT PRIMARY KEY,
+            title TEXT,
+            category TEXT,
+            date TEXT,
+            start_time_local TEXT,
+            end_time_local TEXT,
+            venue_name TEXT,
+            latitude REAL,
+            longitude REAL,
+            description TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_date ON events(date, start_time_local)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS day_digest (
+            date TEXT PRIMARY KEY,
+            total_events INTEGER NOT NULL,
+            category_counts TEXT NOT NULL,
+            top_venues TEXT NOT NULL,
+            earliest_start TEXT,
+            latest_start TEXT,
+            highlight_event_ids TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        ) WITHOUT ROWID
+    """)
+
+
+def _migrate_v2(conn: sqlite3.Connection) -> None:
+    """Normalize venues into their own table; events reference them by id."""
+    # Venues need a name and coordinates; events without them could not be
+    # joined to a venue and would be dropped.
+    missing = conn.execute(
+        "SELECT COUNT(*) FROM events WHERE venue_name IS NULL OR latitude IS NULL OR longitude IS NULL"
+    ).fetchone()[0]
+    if missing:
+        raise ValueError(
+            f"Cannot migrate events database: {missing} event(s) have no venue name or coordinates; "
+            f"fill in or delete them first"
+        )
+
+    conn.execute("""
+        CREATE TABLE venues (
+            venue_id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL COLLATE NOCASE,
+            latitude REAL NOT NULL,
+            longitude REAL NOT NULL,
+            neighborhood TEXT,
+            UNIQUE (name, latitude, longitude)
+        )
+    """)
+    conn.execute("CREATE INDEX idx_venues_location ON venues(latitude, longitude)")
+    conn.execute(
+        f"INSERT OR IGNORE INTO venues (name, latitude, longitude) "
+        f"SELECT DISTINCT venue_name, round(latitude, {VENUE_COORD_PRECISION}), "
+        f"round(longitude, {VENUE_COORD_PRECISION}) FROM events"
+    )
+
+    conn.execute("""
+        CREATE TABLE events_v2 (
+            event_id TEXT PRIMARY KEY,
+            title TEXT,
+            category TEXT,
+            date TEXT,
+            start_time_local TEXT,
+            end_time_local TEXT,
+            venue_id INTEGER NOT NULL REFERENCES venues(venue_id),
+            description TEXT
+        )
+    """)
+    conn.execute(f"""
+        INSERT INTO events_v2
+        SELECT e.event_id, e.title, e.category, e.date, e.start_time_local, e.end_time_local,
+               v.venue_id, e.description
+        FROM events e
+        JOIN venues v
+          ON v.name = e.venue_name
+         AND v.latitude = round(e.latitude, {VENUE_COORD_PRECISION})
+         AND v.longitude = round(e.longitude, {VENUE_COORD_PRECISION})
+    """)
+    conn.execute("DROP TABLE events")
+    conn.execute("ALTER TABLE events_v2 RENAME TO events")
+    conn.execute("CREATE INDEX idx_events_date ON events(date, start_time_local)")
+    conn.execute("CREATE INDEX idx_events_venue ON events(venue_id, date, start_time_local)")
+
+    # Denormalized read shape used by the service; the planner flattens the
+    # view so the indexes on both tables still apply.
+    conn.execute("""
+        CREATE VIEW event_details AS
+        SELECT e.event_id, e.title, e.category, e.date, e.start_time_local, e.end_time_local,
+               v.name AS venue_name, v.latitude, v.longitude, e.description, e.venue_id
+        FROM events e
+        JOIN venues v ON v.venue_id = e.venue_id
+    """)
+
+
+def _migrate_v3(conn: sqlite3.Connection) -> None:
+    """Borough and neighborhood per venue, indexed for equality filters."""
+    conn.execute("ALTER TABLE venues ADD COLUMN borough TEXT")
+    conn.execute("CREATE INDEX idx_venues_borough ON venues(borough COLLATE NOCASE)")
+    conn.execute("CREATE INDEX idx_venues_neighborhood ON venues(neighborhood COLLATE NOCASE)")
+
+    conn.execute("DROP VIEW event_details")
+    conn.execute("""
+        CREATE VIEW event_details AS
+        SELECT e.event_id, e.title, e.category, e.date, e.start_time_local, e.end_time_local,
+               v.name AS venue_name, v.latitude, v.longitude, v.neighborhood, v.borough,
+               e.description, e.venue_id
+        FROM events e
+        JOIN venues v ON v.venue_id = e.venue_id
+    """)
+    tag_venue_areas(conn)
+
+
+def _migrate_v4(conn: sqlite3.Connection) -> None:
+    """Change tracking: updated_at per event and tombstones for removed events."""
+    conn.execute("ALTER TABLE events ADD COLUMN updated_at TEXT")
+    conn.execute("UPDATE events SET updated_at = ?", (_utc_now("microseconds"),))
+    conn.execute("CREATE INDEX idx_events_updated ON events(updated_at, event_id)")
+    conn.execute("""
+        CREATE TABLE event_tombstones (
+            event_id TEXT PRIMARY KEY,
+            category TEXT,
+            date TEXT,
+            deleted_at TEXT NOT NULL
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX idx_tombstones_deleted ON event_tombstones(deleted_at)")
+
+    conn.execute("DROP VIEW event_details")
+    conn.execute("""
+        CREATE VIEW event_details AS
+        SELECT e.event_id, e.title, e.category, e.date, e.start_time_local, e.end_time_local,
+               v.name AS venue_name, v.latitude, v.longitude, v.neighborhood, v.borough,
+               e.description, e.venue_id, e.updated_at
+        FROM events e
+        JOIN venues v ON v.venue_id = e.venue_id
+    """)
+
+
+def _migrate_v5(conn: sqlite3.Connection) -> None:
+    """Content versions per day and per day and category, kept in the digest."""
+    conn.execute("ALTER TABLE day_digest ADD COLUMN version TEXT")
+    conn.execute("ALTER TABLE day_digest ADD COLUMN category_versions TEXT")
+
+
+# (schema version, migration) in order; each runs once per database
+MIGRATIONS: List[Tuple[int, Callable[[sqlite3.Connection], None]]] = [
+    (1, _migrate_v1),
+    (2, _migrate_v2),
+    (3, _migrate_v3),
+    (4, _migrate_v4),
+    (5, _migrate_v5),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version stored in the database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Bring a database up to the current schema, running pending migrations.
+
+    Works on empty databases as well as legacy ones that only have the
+    events table. Each migration and its ``user_version`` bump commit in one
+    explicit transaction: the sqlite3 module would otherwise autocommit DDL
+    statement by statement, and a crash mid-migration would leave a
+    half-migrated database at the old version.
+
+    Args:
+        conn: Open SQLite connection
+    """
+    current = schema_version(conn)
+    pending = [(version, migrate) for version, migrate in MIGRATIONS if version > current]
+    if conn.in_transaction:
+        conn.commit()
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        for version, migrate in pending:
+            logger.info(f"Migrating events database to schema v{version}")
+            conn.execute("BEGIN")
+            try:
+                migrate(conn)
+                conn.execute(f"PRAGMA user_version = {version}")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    finally:
+        conn.isolation_level = isolation_level
+
+    # Derived tables are rebuilt once against the final schema
+    if pending:
+        with conn:
+            refresh_day_digest(conn)
+
+
+def _utc_now(timespec: str = "seconds") -> str:
+    return datetime.now(timezone.utc).isoformat(timespec=timespec)
+
+
+def _begin_change(conn: sqlite3.Connection) -> str:
+    """
+    Take the write lock and return the change stamp for this transaction.
+
+    Stamping under the lock keeps stamps in commit order, so a reader's
+    newest stamp never has an older, still uncommitted write behind it.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+    return _utc_now("microseconds")
+
+
+def content_version(*parts: Any) -> str:
+    """
+    Return an opaque version token for a piece of published content.
+
+    Listings are versioned by what identifies them (e.g. their date) plus their
+    event count and newest updated_at: any added or modified event moves the
+    newest stamp and any removal changes the count.
+
+    Args:
+        *parts: JSON-serializable values that change whenever the content does
+
+    Returns:
+        16 hex digits, stable across processes and restarts
+    """
+    encoded = json.dumps(parts, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def refresh_day_digest(conn: sqlite3.Connection, dates: Optional[Iterable[str]] = None) -> int:
+    """
+    Recompute digest rows for the given dates (all dates if None).
+
+    Args:
+        conn: Open SQLite connection
+        dates: Dates (YYYY-MM-DD) whose events changed
+
+    Returns:
+        Number of dates refreshed
+    """
+    if dates is None:
+        dates = [row[0] for row in conn.execute("SELECT DISTINCT date FROM events")]
+    dates = sorted(set(dates))
+    now = _utc_now()
+
+    for day in dates:
+        stats = conn.execute(
+            "SELECT COUNT(*), MIN(start_time_local), MAX(start_time_local), MAX(updated_at) "
+            "FROM events WHERE date = ?",
+            (day,),
+        ).fetchone()
+        if not stats[0]:
+            conn.execute("DELETE FROM day_digest WHERE date = ?", (day,))
+            continue
+
+        categories = conn.execute(
+            "SELECT category, COUNT(*), MAX(updated_at) FROM events WHERE date = ? GROUP BY category ORDER BY category",
+            (day,),
+        ).fetchall()
+        category_counts = {category: count for category, count, _ in categories}
+        top_venues = conn.execute(
+            "SELECT venue_name, COUNT(*) AS n FROM event_details WHERE date = ? "
+            "GROUP BY venue_id ORDER BY n DESC, venue_name LIMIT ?",
+            (day, DIGEST_TOP_VENUES),
+        ).fetchall()
+        # One highlight per category: its earliest event of the day
+        highlights = [row[0] for row in conn.execute(
+            "SELECT event_id FROM ("
+            "  SELECT event_id, category, ROW_NUMBER() OVER ("
+            "    PARTITION BY category ORDER BY start_time_local, event_id) AS rn"
+            "  FROM events WHERE date = ?"
+            ") WHERE rn = 1 ORDER BY category LIMIT ?",
+            (day, DIGEST_HIGHLIGHTS),
+        )]
+
+        conn.execute(
+            "INSERT OR REPLACE INTO day_digest (date, total_events, category_counts, top_venues, "
+            "earliest_start, latest_start, highlight_event_ids, updated_at, version, category_versions) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                day,
+                stats[0],
+                json.dumps(category_counts),
+                json.dumps([[name, count] for name, count in top_venues]),
+                stats[1],
+                stats[2],
+                json.dumps(highlights),
+                now,
+                content_version(day, stats[0], stats[3]),
+                json.dumps({category: content_version(day, category, count, last) for category, count, last in categories}),
+            ),
+        )
+    return len(dates)
+
+
+def ingest_events(conn: sqlite3.Connection, rows: Iterable[Sequence[Any]], batch_size: int = 50_000) -> int:
+    """
+    Insert or replace events and update derived tables.
+
+    Rows identical to the stored event are skipped, so their updated_at stays put.
+
+    Args:
+        conn: Open SQLite connection (schema must be current)
+        rows: Event tuples in EVENT_COLUMNS order; venues are deduplicated into the venues table
+        batch_size: Rows per executemany batch
+
+    Returns:
+        Number of events written (new or changed)
+    """
+    columns = (*STORED_EVENT_COLUMNS, "updated_at")
+    sql = f"INSERT OR REPLACE INTO events ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+
+    venue_ids: Dict[Tuple[str, float, float], int] = {}
+    touched_dates = set()
+    count = 0
+    batch: List[Sequence[Any]] = []
+    with conn:
+        stamp = _begin_change(conn)
+        for row in rows:
+            venue_id = resolve_venue_id(conn, row[6], row[7], row[8], venue_ids)
+            batch.append((*row[:6], venue_id, row[9]))
+            if len(batch) >= batch_size:
+                dates, written = _write_batch(conn, sql, batch, stamp)
+                touched_dates.update(dates)
+                count += written
+                batch = []
+        if batch:
+            dates, written = _write_batch(conn, sql, batch, stamp)
+            touched_dates.update(dates)
+            count += written
+        tag_venue_areas(conn)
+        refresh_day_digest(conn, touched_dates)
+
+    logger.info(f"Ingested {count} new or changed events across {len(touched_dates)} day(s)")
+    return count
+
+
+def delete_events(conn: sqlite3.Connection, event_ids: Iterable[str]) -> int:
+    """
+    Remove events (e.g. cancellations), leaving tombstones for changed_since queries.
+
+    Tombstones older than TOMBSTONE_RETENTION_DAYS are pruned on the way.
+
+    Args:
+        conn: Open SQLite connection (schema must be current)
+        event_ids: Events to remove; unknown ids are ignored
+
+    Returns:
+        Number of events removed
+    """
+    ids = list(dict.fromkeys(event_ids))
+    removed: List[Tuple[str, str, str]] = []
+    with conn:
+        stamp = _begin_change(conn)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            removed.extend(conn.execute(
+                f"SELECT event_id, category, date FROM events WHERE event_id IN ({', '.join('?' for _ in chunk)})", chunk
+            ))
+        conn.executemany(
+            "INSERT OR REPLACE INTO event_tombstones VALUES (?, ?, ?, ?)", [(*row, stamp) for row in removed]
+        )
+        conn.executemany("DELETE FROM events WHERE event_id = ?", [(row[0],) for row in removed])
+
+        retention = timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        cutoff = (datetime.now(timezone.utc) - retention).isoformat(timespec="microseconds")
+        conn.execute("DELETE FROM event_tombstones WHERE deleted_at < ?", (cutoff,))
+        refresh_day_digest(conn, {row[2] for row in removed})
+
+    logger.info(f"Removed {len(removed)} of {len(ids)} event(s)")
+    return len(removed)
+
+
+def resolve_venue_id(
+    conn: sqlite3.Connection,
+    name: str,
+    latitude: float,
+    longitude: float,
+    cache: Optional[Dict[Tuple[str, float, float], int]] = None
+) -> int:
+    """
+    Return the id of a venue, inserting it if it is new.
+
+    Args:
+        conn: Open SQLite connection
+        name: Venue name
+        latitude: Venue latitude
+        longitude: Venue longitude
+        cache: Optional per-ingest cache of already resolved venues
+
+    Returns:
+        The venue_id
+    """
+    key = (name, round(float(latitude), VENUE_COORD_PRECISION), round(float(longitude), VENUE_COORD_PRECISION))
+    if cache is not None and key in cache:
+        return cache[key]
+
+    conn.execute("INSERT OR IGNORE INTO venues (name, latitude, longitude) VALUES (?, ?, ?)", key)
+    venue_id = conn.execute(
+        "SELECT venue_id FROM venues WHERE name = ? AND latitude = ? AND longitude = ?", key
+    ).fetchone()[0]
+    if cache is not None:
+        cache[key] = venue_id
+    return venue_id
+
+
+def tag_venue_areas(conn: sqlite3.Connection, retag: bool = False) -> int:
+    """
+    Set borough and neighborhood on venues by point-in-polygon lookup.
+
+    Args:
+        conn: Open SQLite connection (schema v3 or later)
+        retag: Re-tag every venue, e.g. after the boundary file changed;
+            by default only venues without a borough are tagged. Events at
+            venues whose area changed get a new updated_at (schema v4 or later).
+
+    Returns:
+        Number of venues looked up
+    """
+    from .tools.areas import get_area_index
+
+    where = "" if retag else " WHERE borough IS NULL"
+    venues = conn.execute(f"SELECT venue_id, latitude, longitude, borough, neighborhood FROM venues{where}").fetchall()
+    if not venues:
+        return 0
+
+    areas = get_area_index().locate([v[1] for v in venues], [v[2] for v in venues])
+    changed = [
+        (borough, neighborhood, venue[0])
+        for venue, (borough, neighborhood) in zip(venues, areas)
+        if (borough, neighborhood) != (venue[3], venue[4])
+    ]
+    conn.executemany("UPDATE venues SET borough = ?, neighborhood = ? WHERE venue_id = ?", changed)
+    if retag and changed:
+        # Their events read differently now, so they count as changed
+        stamp = _begin_change(conn)
+        venue_ids = [row[2] for row in changed]
+        dates = set()
+        for start in range(0, len(venue_ids), 500):
+            chunk = venue_ids[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            dates.update(row[0] for row in conn.execute(
+                f"SELECT DISTINCT date FROM events WHERE venue_id IN ({placeholders})", chunk
+            ))
+            conn.execute(f"UPDATE events SET updated_at = ? WHERE venue_id IN ({placeholders})", (stamp, *chunk))
+        refresh_day_digest(conn, dates)
+    logger.info(f"Tagged {len(venues)} venue(s) with borough and neighborhood ({len(changed)} changed)")
+    return len(venues)
+
+
+def _write_batch(conn: sqlite3.Connection, sql: str, batch: List[Sequence[Any]], stamp: str) -> Tuple[set, int]:
+    # Unchanged rows are dropped; INSERT OR REPLACE still gives changed rows a
+    # new rowid, which the semantic index relies on to pick them up
+    ids = [row[0] for row in batch]
+    stored: Dict[str, Tuple[Any, ...]] = {}
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        stored.update((r[0], r) for r in conn.execute(
+            f"SELECT {', '.join(STORED_EVENT_COLUMNS)} FROM events "
+            f"WHERE event_id IN ({', '.join('?' for _ in chunk)})", chunk
+        ))
+    changed = [row for row in batch if stored.get(row[0]) != tuple(row)]
+    if not changed:
+        return set(), 0
+
+    # Dates an updated event is moving away from also need their digest refreshed
+    dates = {row[3] for row in changed}
+    dates.update(stored[row[0]][3] for row in changed if row[0] in stored)
+    conn.executemany(sql, [(*row, stamp) for row in changed])
+    # A re-added event is no longer cancelled
+    conn.executemany(
+        "DELETE FROM event_tombstones WHERE event_id = ?", [(row[0],) for row in changed if row[0] not in stored]
+    )
+    return dates, len(changed)
+
+
+def load_csv(path: str) -> List[Tuple[Any, ...]]:
+    """
+    Read events from a CSV file with EVENT_COLUMNS headers.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        Event tuples in EVENT_COLUMNS order
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = []
+        for record in reader:
+            rows.append(tuple(
+                float(record[col]) if col in ("latitude", "longitude") else record[col]
+                for col in EVENT_COLUMNS
+            ))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load events into the NYC events database")
+    parser.add_argument("csv", nargs="?", help="CSV file with events to ingest")
+    parser.add_argument("--db", default=None, help="SQLite database path (default: bundled events database)")
+    parser.add_argument("--cancel", nargs="+", metavar="EVENT_ID", help="Remove events, leaving tombstones")
+    parser.add_argument("--migrate", action="store_true", help="Only bring the schema up to date")
+    parser.add_argument("--retag-areas", action="store_true", help="Re-tag all venues with borough and neighborhood")
+    parser.add_argument("--prefs-db", default=None, help="User preferences database with the saved searches (default: NYC_EVENTS_PREFS_DB or workspace root)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db_path = args.db or default_db_path()
+    if args.prefs_db is not None:
+        os.environ["NYC_EVENTS_PREFS_DB"] = args.prefs_db
+    conn = sqlite3.connect(db_path)
+    try:
+        ensure_schema(conn)
+        if args.csv:
+            ingest_events(conn, load_csv(args.csv))
+        if args.cancel:
+            delete_events(conn, args.cancel)
+        if args.retag_areas:
+            with conn:
+                tag_venue_areas(conn, retag=True)
+        if not (args.csv or args.cancel or args.migrate or args.retag_areas):
+            parser.error("either a CSV file, --cancel, --migrate or --retag-areas is required")
+    finally:
+        conn.close()
+
+    # Rebuild a persisted semantic index now rather than on the next search
+    if args.csv or args.cancel:
+        from .tools import semantic
+        if os.path.exists(semantic.index_path(db_path)):
+            semantic.load_or_build(db_path)
+
+    # Record new matches of saved searches; a running server notifies subscribers
+    if args.csv:
+        from .tools.events_service import EventsService
+        from .tools.saved_searches import match_saved_searches
+        from .tools.user_prefs import get_prefs_store
+        asyncio.run(match_saved_searches(EventsService(db_path), get_prefs_store()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Non-blocking structured logging for the NYC Events MCP server.
+
+Records are put on an in-memory queue by the event loop thread and written
+by a background ``QueueListener`` thread, so formatting and I/O (including
+traceback rendering) happen off the loop. Success logs can be sampled and
+repeated errors are de-duplicated before they are enqueued. The queue is
+bounded: when the writer falls behind, new records are dropped and counted
+rather than blocking the loop or growing memory without limit.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import secrets
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# Request id of the tool call currently being handled in this task
+request_id_var: ContextVar[Optional[str]] = ContextVar("nyc_events_request_id", default=None)
+
+# Fields passed through ``extra=`` that the JSON formatter copies into the record
+STRUCTURED_FIELDS = ("request_id", "tool", "duration_ms", "outcome", "suppressed", "dropped")
+
+# Records the queue holds before new ones are dropped
+LOG_QUEUE_SIZE = 10_000
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["_DeferredQueueHandler"] = None
+
+
+def new_request_id() -> str:
+    """Generate a short random request id."""
+    return secrets.token_hex(6)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Stamps each record with the request id of the current tool call.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "request_id", None) is None:
+            record.request_id = request_id_var.get()
+        return True
+
+
+class SuccessSampler(logging.Filter):
+    """
+    Keeps only a fraction of records marked with ``extra={"sampled": True}``.
+
+    Unmarked records (warnings, errors, lifecycle messages) always pass.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or not getattr(record, "sampled", False):
+            return True
+        return random.random() < self.rate
+
+
+class ErrorDeduplicator(logging.Filter):
+    """
+    Suppresses repeats of the same error within a time window.
+
+    Errors are keyed by logger, exception type and either the ``tool`` the
+    record was logged for or, without one, the formatted message. The first
+    occurrence in each window is logged; later ones are counted and the
+    count is attached as ``suppressed`` to the next record that gets through
+    for that key.
+    """
+
+    def __init__(self, window_s: float = 60.0, max_keys: int = 1024):
+        super().__init__()
+        self.window_s = window_s
+        self.max_keys = max_keys
+        self._seen: Dict[Any, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.ERROR or self.window_s <= 0:
+            return True
+
+        exc_type = record.exc_info[0].__name__ if record.exc_info and record.exc_info[0] else None
+        # The generic "Error executing tool %s" template would merge every tool's
+        # errors, and handlers' f-string messages differ only by their arguments
+        tool = getattr(record, "tool", None)
+        key = (record.name, exc_type, ("tool", tool) if tool is not None else record.getMessage())
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is not None and now - entry[0] < self.window_s:
+                entry[1] += 1
+                return False
+
+            suppressed = entry[1] if entry is not None else 0
+            if len(self._seen) >= self.max_keys:
+                self._seen.clear()
+            self._seen[key] = [now, 0]
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as single-line JSON objects.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock ``prepare()`` formats the record (and renders tracebacks) on the
+    calling thread; here only the message is merged so the args can't change
+    underneath us, and exc_info travels with the record.
+
+    Records that find the queue full are dropped without blocking. The number
+    dropped since the last enqueued record is attached to the next one as
+    ``dropped``; ``dropped_total`` counts all of them.
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped_total = 0
+        self._dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        with self._drop_lock:
+            if self._dropped:
+                record.dropped = self._dropped
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._dropped += 1
+                self.dropped_total += 1
+                return
+            self._dropped = 0
+
+
+class _BoundedQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener whose stop() waits for room for its sentinel in a full queue.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    json_format: bool = True,
+    success_sample_rate: float = 1.0,
+    error_dedup_window_s: float = 60.0,
+    stream=None,
+    queue_size: int = LOG_QUEUE_SIZE,
+) -> None:
+    """
+    Install the queue-based logging pipeline on the root logger.
+
+    Args:
+        level: Minimum log level
+        json_format: Emit JSON records (True) or plain text (False)
+        success_sample_rate: Fraction of sampled success logs to keep (0.0-1.0)
+        error_dedup_window_s: Window for collapsing repeated errors (0 disables)
+        stream: Output stream for the listener (default: stderr)
+        queue_size: Records queued for the listener before new ones are dropped
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    if json_format:
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(request_id)s:%(message)s"))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+    queue_handler.addFilter(SuccessSampler(success_sample_rate))
+    queue_handler.addFilter(ErrorDeduplicator(error_dedup_window_s))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _queue_handler = queue_handler
+    _listener = _BoundedQueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def dropped_record_count() -> int:
+    """Number of records dropped because the queue was full, since logging was configured."""
+    return _queue_handler.dropped_total if _queue_handler is not None else 0
+
+
+def shutdown_logging() -> None:
+    """Stop the listener thread, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,194 @@
+"""
+Nightly batch job that precomputes per-user event recommendations.
+
+For every user in the preferences store (earliest ``wake_hour`` first) the
+job ranks the day's events by interest match, proximity to home and the
+day's scheduled locations, and category diversity, then stores the top
+picks in the ``recommendations`` table that ``get_my_recommendations``
+reads with a single primary-key lookup.
+
+Users are processed in parallel worker processes and each result is committed
+on its own, so an interrupted run resumes where it stopped: users whose
+stored recommendations already match their current preferences version are
+skipped (``--force`` recomputes them).
+
+Scheduled locations come from an optional JSON file mapping user ids to the
+day's appointment coordinates, e.g. exported from the calendar integration:
+    {"alice": [{"latitude": 40.7527, "longitude": -73.9772}]}
+
+Usage:
+    python -m nyc_events_mcp.recommend [--date YYYY-MM-DD] [--workers 4]
+    python -m nyc_events_mcp.recommend --wake-hour 7 --schedule today.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .tools.events_service import RECOMMENDATIONS_PER_DAY, EventsService
+from .tools.user_prefs import PrefsStore, get_prefs_store
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# Worker processes used when --workers is not given
+DEFAULT_WORKERS = os.cpu_count() or 4
+
+# From this hour on, the job prepares the next day instead of today
+NEXT_DAY_FROM_HOUR = 12
+
+
+def default_target_date(now: Optional[datetime] = None) -> str:
+    """
+    Return the day a run should prepare: today before noon, otherwise tomorrow.
+
+    Args:
+        now: Current local time (default: datetime.now())
+
+    Returns:
+        Date in YYYY-MM-DD format
+    """
+    now = now or datetime.now()
+    day = now.date() if now.hour < NEXT_DAY_FROM_HOUR else now.date() + timedelta(days=1)
+    return day.isoformat()
+
+
+def load_schedule(path: str) -> Dict[str, List[Tuple[float, float]]]:
+    """
+    Load scheduled locations per user.
+
+    Args:
+        path: JSON file mapping user ids to lists of {"latitude", "longitude"} objects
+
+    Returns:
+        Dictionary of user id -> list of (latitude, longitude)
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        user_id: [(float(point["latitude"]), float(point["longitude"])) for point in points]
+        for user_id, points in data.items()
+    }
+
+
+# Per-process state of the worker pool, set up by _init_worker
+_worker_service: Optional[EventsService] = None
+_worker_store: Optional[PrefsStore] = None
+
+
+def _init_worker(db_path: Optional[str], prefs_db_path: str) -> None:
+    global _worker_service, _worker_store
+    _worker_service = EventsService(db_path)
+    _worker_store = PrefsStore(prefs_db_path)
+
+
+def _recommend_one(user_id: str, version: int, date: str, locations: List[Tuple[float, float]], limit: int) -> int:
+    events = asyncio.run(
+        _worker_service.recommend_for_user(user_id, date, locations=locations, limit=limit, cache=False)
+    )
+    _worker_store.put_recommendations(user_id, date, version, [event.to_dict() for event in events])
+    return len(events)
+
+
+def run_batch(
+    db_path: Optional[str],
+    store: PrefsStore,
+    date: str,
+    schedule: Optional[Dict[str, List[Tuple[float, float]]]] = None,
+    wake_hour: Optional[int] = None,
+    workers: int = DEFAULT_WORKERS,
+    limit: int = RECOMMENDATIONS_PER_DAY,
+    force: bool = False
+) -> Dict[str, int]:
+    """
+    Precompute and store recommendations for one day.
+
+    Args:
+        db_path: Events database (None for the bundled database)
+        store: Preferences store to read users from; workers write to the same database
+        date: Day in YYYY-MM-DD format
+        schedule: User id -> scheduled (latitude, longitude) points for the day (optional)
+        wake_hour: Only process users waking at this hour (optional)
+        workers: Number of worker processes
+        limit: Events stored per user
+        force: Recompute users that already have current recommendations
+
+    Returns:
+        Counts of computed, skipped and failed users
+    """
+    schedule = schedule or {}
+    users = store.users_by_wake_hour(wake_hour)
+    done = {} if force else store.recommendation_versions(date)
+    pending = [(user_id, version) for user_id, _, version in users if done.get(user_id) != version]
+    counts = {"computed": 0, "skipped": len(users) - len(pending), "failed": 0}
+    logger.info(f"Recommendations for {date}: {len(pending)} user(s) to compute, {counts['skipped']} up to date")
+
+    if not pending:
+        return counts
+
+    # Ranking is mostly Python-level work, so workers are processes rather than threads
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(workers, len(pending))),
+        initializer=_init_worker,
+        initargs=(db_path, store.db_path),
+    ) as pool:
+        futures = {
+            pool.submit(_recommend_one, user_id, version, date, schedule.get(user_id, []), limit): user_id
+            for user_id, version in pending
+        }
+        for future in as_completed(futures):
+            user_id = futures[future]
+            try:
+                stored = future.result()
+                counts["computed"] += 1
+                logger.debug(f"Stored {stored} recommendation(s) for {user_id}")
+            except Exception as e:
+                counts["failed"] += 1
+                logger.exception(f"Recommendations failed for {user_id}: {str(e)}")
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Precompute per-user event recommendations")
+    parser.add_argument("--date", default=None, help="Day to prepare, YYYY-MM-DD (default: today before noon, else tomorrow)")
+    parser.add_argument("--wake-hour", type=int, default=None, help="Only users waking at this hour (default: all users)")
+    parser.add_argument("--schedule", default=None, help="JSON file of scheduled locations per user (optional)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Worker processes (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--limit", type=int, default=RECOMMENDATIONS_PER_DAY, help="Events stored per user")
+    parser.add_argument("--force", action="store_true", help="Recompute users that are already up to date")
+    parser.add_argument("--keep-days", type=int, default=7, help="Drop recommendations older than this many days before --date")
+    parser.add_argument("--db", default=None, help="Events database (default: bundled database)")
+    parser.add_argument("--prefs-db", default=None, help="User preferences database (default: NYC_EVENTS_PREFS_DB or workspace root)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.prefs_db is not None:
+        os.environ["NYC_EVENTS_PREFS_DB"] = args.prefs_db
+
+    date = args.date or default_target_date()
+    store = get_prefs_store()
+    schedule = load_schedule(args.schedule) if args.schedule else None
+
+    started = time.perf_counter()
+    counts = run_batch(
+        args.db, store, date,
+        schedule=schedule, wake_hour=args.wake_hour, workers=args.workers, limit=args.limit, force=args.force,
+    )
+    cutoff = (datetime.strptime(date, "%Y-%m-%d") - timedelta(days=args.keep_days)).date().isoformat()
+    removed = store.delete_recommendations_before(cutoff)
+
+    print(
+        f"{date}: computed {counts['computed']}, skipped {counts['skipped']}, failed {counts['failed']}, "
+        f"pruned {removed} old row(s) in {time.perf_counter() - started:.1f}s"
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,317 @@
+"""
+MCP resources: events, venues and saved searches as cacheable JSON documents.
+
+URIs (also advertised as resource templates):
+    events://date/{date}                 every event of a day
+    events://category/{category}/{date}  a day's events of one category
+    events://event/{event_id}            one event
+    venues://{venue_id}                  a venue and its events
+    searches://{user_id}/{search_id}     a saved search and its latest matches
+
+Every events and venues document carries a ``version`` that changes exactly
+when its content does (see ``ingest.content_version``). resources/list
+reports each day's version in ``_meta`` straight from the day digest, so a
+client can compare versions and only read the days that changed. Sessions
+subscribed to a URI get notifications/resources/updated when its version
+changes or, for saved searches, when new matches are recorded. Ingest runs
+in its own process, so a watcher task polls for changes while anyone is
+subscribed: one indexed lookup of the newest change stamp per interval, and
+version checks only after something changed.
+"""
+
+import asyncio
+import json
+import logging
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+from mcp.server.session import ServerSession
+from mcp.types import Resource, ResourceTemplate
+from pydantic import AnyUrl
+
+from .tools.events_service import EventsService, get_events_service
+from .tools.saved_searches import SEARCH_URI_SCHEME, parse_search_uri, search_uri
+from .tools.user_prefs import get_prefs_store
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# Seconds between checks for changes to subscribed resources
+SUBSCRIPTION_POLL_SECONDS = 5.0
+
+MIME_TYPE = "application/json"
+
+RESOURCE_TEMPLATES = [
+    ResourceTemplate(
+        uriTemplate="events://date/{date}",
+        name="events-by-date",
+        description="All events on a date (YYYY-MM-DD), with a content version",
+        mimeType=MIME_TYPE,
+    ),
+    ResourceTemplate(
+        uriTemplate="events://category/{category}/{date}",
+        name="events-by-category-and-date",
+        description="Events of one category (music, museum, pop-ups, football, movies) on a date",
+        mimeType=MIME_TYPE,
+    ),
+    ResourceTemplate(
+        uriTemplate="events://event/{event_id}",
+        name="event",
+        description="One event by id",
+        mimeType=MIME_TYPE,
+    ),
+    ResourceTemplate(
+        uriTemplate="venues://{venue_id}",
+        name="venue",
+        description="A venue with all of its events",
+        mimeType=MIME_TYPE,
+    ),
+    ResourceTemplate(
+        uriTemplate=f"{SEARCH_URI_SCHEME}://{{user_id}}/{{search_id}}",
+        name="saved-search",
+        description="A saved search with the events most recently matched to it",
+        mimeType=MIME_TYPE,
+    ),
+]
+
+# Resource URI -> sessions subscribed to it
+_subscriptions: Dict[str, "weakref.WeakSet[ServerSession]"] = {}
+
+# Last version sent to subscribers of an events or venues URI
+_versions: Dict[str, Optional[str]] = {}
+
+# Background task notifying subscribers, started on the first subscription
+_watcher: Optional[asyncio.Task] = None
+
+
+def day_uri(date: str, category: Optional[str] = None) -> str:
+    """Return the resource URI of a day's events, optionally of one category."""
+    if category:
+        return f"events://category/{quote(category, safe='')}/{date}"
+    return f"events://date/{date}"
+
+
+def parse_resource_uri(uri: str) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Split a resource URI into its kind and arguments.
+
+    Args:
+        uri: One of the URIs in RESOURCE_TEMPLATES
+
+    Returns:
+        ("date", (date,)), ("category", (category, date)), ("event", (event_id,)),
+        ("venue", (venue_id,)) or ("search", (user_id, search_id)); raises
+        ValueError for anything else
+    """
+    scheme, separator, rest = uri.partition("://")
+    parts = [unquote(part) for part in rest.split("/")] if separator else []
+    if scheme == "events" and len(parts) == 2 and parts[0] == "date":
+        return "date", (parts[1],)
+    if scheme == "events" and len(parts) == 3 and parts[0] == "category":
+        return "category", (parts[1], parts[2])
+    if scheme == "events" and len(parts) == 2 and parts[0] == "event" and parts[1]:
+        return "event", (parts[1],)
+    if scheme == "venues" and len(parts) == 1 and parts[0].isdigit():
+        return "venue", (int(parts[0]),)
+    if scheme == SEARCH_URI_SCHEME:
+        return "search", parse_search_uri(uri)
+    raise ValueError(f"Unknown resource: {uri}")
+
+
+async def list_resources(service: EventsService) -> List[Resource]:
+    """
+    List each day with events and every saved search.
+
+    Day resources carry their content version in ``_meta``.
+
+    Args:
+        service: Service over the events database
+
+    Returns:
+        Resources, days first in date order
+    """
+    resources = [
+        Resource(
+            uri=AnyUrl(day_uri(day["date"])),
+            name=f"events-{day['date']}",
+            description=f"{day['total_events']} events on {day['date']}",
+            mimeType=MIME_TYPE,
+            _meta={"version": day["version"]},
+        )
+        for day in await service.get_day_versions()
+    ]
+    store = await asyncio.to_thread(get_prefs_store)
+    searches = await asyncio.to_thread(store.saved_searches)
+    resources.extend(
+        Resource(
+            uri=AnyUrl(search_uri(search["user_id"], search["search_id"])),
+            name=search["name"],
+            description=f"Events matching saved search {search['search_id']} of {search['user_id']}",
+            mimeType=MIME_TYPE,
+        )
+        for search in searches
+    )
+    return resources
+
+
+async def read_resource(service: EventsService, uri: str) -> Dict[str, Any]:
+    """
+    Read a resource as a JSON-serializable document.
+
+    Args:
+        service: Service over the events database
+        uri: Resource URI
+
+    Returns:
+        The document; raises ValueError for unknown URIs, events, venues or searches
+    """
+    kind, args = parse_resource_uri(uri)
+    if kind == "date":
+        return await service.get_day_listing(args[0])
+    if kind == "category":
+        return await service.get_day_listing(args[1], category=args[0])
+    if kind == "event":
+        document = await service.get_event_document(args[0])
+        if document is None:
+            raise ValueError(f"Event not found: {args[0]}")
+        return document
+    if kind == "venue":
+        document = await service.get_venue_listing(args[0])
+        if document is None:
+            raise ValueError(f"Venue not found: {args[0]}")
+        return document
+
+    user_id, search_id = args
+    search = next(
+        (search for search in await service.get_saved_searches(user_id) if search["search_id"] == search_id),
+        None,
+    )
+    if search is None:
+        raise ValueError(f"Unknown saved search {search_id} for user {user_id}")
+    events = await service.get_saved_search_matches(user_id, search_id)
+    return {**search, "matches": [event.to_dict() for event in events]}
+
+
+async def resource_version(service: EventsService, uri: str) -> Optional[str]:
+    """
+    Current content version of an events or venues resource, reading as little as possible.
+
+    Args:
+        service: Service over the events database
+        uri: Resource URI
+
+    Returns:
+        The version (None for a missing event or venue); raises ValueError for
+        saved searches, which are not versioned
+    """
+    kind, args = parse_resource_uri(uri)
+    if kind in ("date", "category"):
+        day = args[-1]
+        versions = await service.get_day_versions(day, day)
+        if versions:
+            version = versions[0]["version"] if kind == "date" else versions[0]["category_versions"].get(args[0].lower())
+            if version is not None:
+                return version
+        # Days and categories without events are versioned like any other empty listing
+        return (await read_resource(service, uri))["version"]
+    if kind == "search":
+        raise ValueError(f"Saved searches are not versioned: {uri}")
+    try:
+        return (await read_resource(service, uri))["version"]
+    except ValueError:
+        return None
+
+
+async def subscribe(session: ServerSession, uri: str) -> None:
+    """
+    Notify a session when a resource changes.
+
+    Args:
+        session: The subscribing session
+        uri: Resource URI
+    """
+    global _watcher
+    kind, _ = parse_resource_uri(uri)
+    if kind != "search" and uri not in _subscriptions:
+        _versions[uri] = await resource_version(get_events_service(), uri)
+    _subscriptions.setdefault(uri, weakref.WeakSet()).add(session)
+    if _watcher is None or _watcher.done():
+        _watcher = asyncio.create_task(watch_subscriptions())
+    logger.info(f"Subscribed to {uri}")
+
+
+def unsubscribe(session: ServerSession, uri: str) -> None:
+    """
+    Stop notifying a session about a resource.
+
+    Args:
+        session: The subscribed session
+        uri: Resource URI
+    """
+    sessions = _subscriptions.get(uri)
+    if sessions is not None:
+        sessions.discard(session)
+        if not sessions:
+            _forget(uri)
+    logger.info(f"Unsubscribed from {uri}")
+
+
+def _forget(uri: str) -> None:
+    _subscriptions.pop(uri, None)
+    _versions.pop(uri, None)
+
+
+async def _notify(uri: str) -> None:
+    for session in list(_subscriptions.get(uri, ())):
+        try:
+            await session.send_resource_updated(AnyUrl(uri))
+        except Exception as e:
+            logger.info(f"Dropping subscriber of {uri}: {str(e)}")
+            _subscriptions[uri].discard(session)
+    if uri in _subscriptions and not _subscriptions[uri]:
+        _forget(uri)
+
+
+async def watch_subscriptions() -> None:
+    """
+    Send resources/updated to subscribers while there are any.
+
+    Saved searches are checked for match ids past the last one seen; events
+    and venues resources are re-versioned only when the newest change stamp
+    of the events database moved.
+    """
+    service = get_events_service()
+    store = await asyncio.to_thread(get_prefs_store)
+    last_match_id = await asyncio.to_thread(store.last_match_id)
+    last_change = await service.latest_change()
+    while _subscriptions:
+        await asyncio.sleep(SUBSCRIPTION_POLL_SECONDS)
+        try:
+            matches = await asyncio.to_thread(store.matches_after, last_match_id)
+            latest = await service.latest_change()
+        except Exception as e:
+            logger.warning(f"Could not check subscribed resources: {str(e)}")
+            continue
+
+        if matches:
+            last_match_id = matches[-1][0]
+            for uri in {search_uri(user_id, search_id) for _, search_id, user_id in matches}:
+                await _notify(uri)
+
+        if latest == last_change:
+            continue
+        last_change = latest
+        for uri in [uri for uri in _versions if uri in _subscriptions]:
+            try:
+                version = await resource_version(service, uri)
+            except Exception as e:
+                logger.warning(f"Could not version {uri}: {str(e)}")
+                continue
+            if version != _versions.get(uri):
+                _versions[uri] = version
+                await _notify(uri)
+
+
+def encode(document: Dict[str, Any]) -> str:
+    """Serialize a resource document; equal documents always encode the same."""
+    return json.dumps(document, indent=2)
@@ -5,44 +5,49 @@ Supports both stdio and SSE MCP server modes.
 
 import argparse
 import asyncio
+import importlib
+import importlib.util
 import logging
 import sys
-import traceback
-from typing import Any, Dict
-from collections.abc import Sequence
+import time
+from typing import TYPE_CHECKING, Any, Dict
+from collections.abc import Iterable, Sequence
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.models import InitializationOptions
 from mcp.types import (
     Tool,
     TextContent,
     ImageContent,
     EmbeddedResource,
+    Resource,
+    ResourceTemplate,
+)
+from pydantic import AnyUrl
+
+# SSE transport dependencies (starlette, uvicorn) are imported lazily in
+# create_starlette_app()/run_server() so stdio clients don't pay for them at
+# startup. find_spec only checks they are installed.
+SSE_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None
+    for module in ("starlette", "uvicorn", "sse_starlette")
 )
 
-# SSE-related imports (imported conditionally)
-try:
-    from mcp.server.sse import SseServerTransport
+# Tool modules, the events service (and sqlite3 behind it) and the resources
+# module are imported on first use rather than at startup, so a stdio client
+# gets its first list_tools response after little more than the MCP SDK's own
+# import time. See benchmarks/startup.py.
+if TYPE_CHECKING:
     from starlette.applications import Starlette
-    from starlette.requests import Request
-    from starlette.routing import Mount, Route
-    from starlette.middleware.cors import CORSMiddleware
-    import uvicorn
-    SSE_AVAILABLE = True
-except ImportError:
-    SSE_AVAILABLE = False
+    from .tools.deadline import CallBudget
 
-# Import tool handlers
+from .tools.progress import ProgressReporter, reporting_progress
+from .tools.structured import collecting_events
 from .tools.toolhandler import ToolHandler
-from .tools.tools_events import (
-    SearchEventsToolHandler,
-    GetEventsByCategoryToolHandler,
-    GetEventsByDateRangeToolHandler,
-    FindEventsNearLocationToolHandler,
-    GetEventByIdToolHandler,
-    GetEventCategoriesToolHandler,
-)
+from .tracing import configure_tracing_from_spec, span
+from .logging_pipeline import configure_logging, new_request_id, request_id_var
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured in main() via the queue-based pipeline
 logger = logging.getLogger("nyc-events-mcp")
 
 # Create the MCP server instance
@@ -51,6 +56,27 @@ app = Server("nyc-events-mcp-server")
 # Global tool handlers registry
 tool_handlers: Dict[str, ToolHandler] = {}
 
+# Registered tools not constructed yet: name -> (module, handler class name).
+# get_tool_handler imports and constructs them on first use.
+_lazy_tool_handlers: Dict[str, tuple[str, str]] = {}
+
+# Tool names in registration order
+_tool_names: list[str] = []
+
+# Tool descriptions, built once on the first list_tools and reused afterwards
+_tool_list_cache: list[Tool] | None = None
+
+# Argument validators by tool name, built on a tool's first call. The SDK's own
+# validation re-checks the schema against the metaschema on every call, which
+# cost more than most tools themselves.
+_tool_validators: Dict[str, Any] = {}
+
+# Deadline of tools without their own deadline_s, in seconds (None: no deadline)
+default_tool_deadline_s: float | None = None
+
+# Time a tool gets past its deadline to return partial results before it is stopped
+DEADLINE_GRACE_S = 1.0
+
 
 def add_tool_handler(tool_handler: ToolHandler) -> None:
     """
@@ -59,14 +85,37 @@ def add_tool_handler(tool_handler: ToolHandler) -> None:
     Args:
         tool_handler: The tool handler instance to register
     """
-    global tool_handlers
+    global tool_handlers, _tool_list_cache
     tool_handlers[tool_handler.name] = tool_handler
+    _lazy_tool_handlers.pop(tool_handler.name, None)
+    if tool_handler.name not in _tool_names:
+        _tool_names.append(tool_handler.name)
+    _tool_list_cache = None
+    _tool_validators.pop(tool_handler.name, None)
     logger.info(f"Registered tool handler: {tool_handler.name}")
 
 
+def add_lazy_tool_handler(name: str, module: str, class_name: str) -> None:
+    """
+    Register a tool handler that is imported and constructed on first use.
+
+    Args:
+        name: The tool name (must match the handler's name)
+        module: Module defining the handler, relative to this package (e.g. ".tools.tools_events")
+        class_name: The handler class, constructed without arguments
+    """
+    global _tool_list_cache
+    tool_handlers.pop(name, None)
+    _lazy_tool_handlers[name] = (module, class_name)
+    if name not in _tool_names:
+        _tool_names.append(name)
+    _tool_list_cache = None
+    _tool_validators.pop(name, None)
+
+
 def get_tool_handler(name: str) -> ToolHandler | None:
     """
-    Retrieve a tool handler by name.
+    Retrieve a tool handler by name, constructing it if it was registered lazily.
 
     Args:
         name: The name of the tool handler
@@ -74,7 +123,117 @@ def get_tool_handler(name: str) -> ToolHandler | None:
     Returns:
         The tool handler instance or None if not found
     """
-    return tool_handlers.get(name)
+    handler = tool_handlers.get(name)
+    if handler is None and name in _lazy_tool_handlers:
+        module, class_name = _lazy_tool_handlers.pop(name)
+        handler = getattr(importlib.import_module(module, __package__), class_name)()
+        tool_handlers[name] = handler
+    return handler
+
+
+def tool_names() -> list[str]:
+    """
+    Names of all registered tools, constructed or not, in registration order.
+    """
+    return list(_tool_names)
+
+
+def get_request_traceparent() -> str | None:
+    """
+    Read a W3C traceparent from the current MCP request's _meta, if any.
+
+    Returns:
+        The traceparent string or None outside a request or when not provided
+    """
+    try:
+        meta = app.request_context.meta
+    except LookupError:
+        return None
+    if meta is None:
+        return None
+    return getattr(meta, "traceparent", None)
+
+
+def validate_arguments(tool_handler: ToolHandler, arguments: dict) -> None:
+    """
+    Check tool arguments against the tool's input schema.
+
+    Args:
+        tool_handler: The tool being called
+        arguments: Its arguments
+
+    Returns:
+        None; raises ValueError describing the first problem found
+    """
+    # Imported on the first call rather than at startup (~100ms)
+    import jsonschema
+
+    validator = _tool_validators.get(tool_handler.name)
+    if validator is None:
+        schema = tool_handler.get_tool_description().inputSchema
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = _tool_validators[tool_handler.name] = validator_class(schema)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+    if error is not None:
+        raise ValueError(f"Input validation error: {error.message}")
+
+
+def get_request_structured() -> bool:
+    """
+    Whether the current MCP request asked for the returned events as structuredContent (_meta.structured).
+    """
+    try:
+        meta = app.request_context.meta
+    except LookupError:
+        return False
+    return meta is not None and getattr(meta, "structured", False) is True
+
+
+def get_call_budget(tool_handler: ToolHandler) -> "CallBudget":
+    """
+    Build the budget of a tool call: the tool's deadline, shortened by a client's _meta.deadlineMs.
+
+    Args:
+        tool_handler: The tool being called
+
+    Returns:
+        CallBudget, without a deadline if neither the server nor the client set one
+    """
+    from .tools.deadline import CallBudget
+
+    seconds = tool_handler.deadline_s if tool_handler.deadline_s is not None else default_tool_deadline_s
+    try:
+        meta = app.request_context.meta
+    except LookupError:
+        meta = None
+    client_ms = getattr(meta, "deadlineMs", None) if meta is not None else None
+    if isinstance(client_ms, (int, float)) and client_ms > 0:
+        seconds = client_ms / 1000 if seconds is None else min(seconds, client_ms / 1000)
+    return CallBudget(seconds)
+
+
+def get_request_progress_reporter() -> ProgressReporter | None:
+    """
+    Build a progress reporter for the current MCP request if it carries a progressToken.
+
+    Returns:
+        ProgressReporter sending notifications/progress to the calling session, or None
+    """
+    try:
+        context = app.request_context
+    except LookupError:
+        return None
+    token = getattr(context.meta, "progressToken", None) if context.meta is not None else None
+    if token is None:
+        return None
+
+    async def send(progress: float, total: float | None, message: str | None) -> None:
+        await context.session.send_progress_notification(
+            token, progress, total=total, message=message, related_request_id=str(context.request_id)
+        )
+
+    return ProgressReporter(send)
 
 
 def register_all_tools() -> None:
@@ -83,23 +242,62 @@ def register_all_tools() -> None:
 
     This function serves as the central registry for all tools.
     New tool handlers should be added here for automatic registration.
+    Handlers are constructed (and their modules imported) on first use.
     """
+    events = ".tools.tools_events"
+
     # Event search and filtering tools
-    add_tool_handler(SearchEventsToolHandler())
-    add_tool_handler(GetEventsByCategoryToolHandler())
-    add_tool_handler(GetEventsByDateRangeToolHandler())
+    add_lazy_tool_handler("search_events", events, "SearchEventsToolHandler")
+    add_lazy_tool_handler("semantic_search_events", events, "SemanticSearchEventsToolHandler")
+    add_lazy_tool_handler("get_events_by_category", events, "GetEventsByCategoryToolHandler")
+    add_lazy_tool_handler("get_events_by_date_range", events, "GetEventsByDateRangeToolHandler")
     
     # Proximity-based search (key feature for calendar integration)
-    add_tool_handler(FindEventsNearLocationToolHandler())
+    add_lazy_tool_handler("find_events_near_location", events, "FindEventsNearLocationToolHandler")
+    add_lazy_tool_handler("find_events_along_route", events, "FindEventsAlongRouteToolHandler")
+    add_lazy_tool_handler("get_events_at_venue", events, "GetEventsAtVenueToolHandler")
     
     # Event details and metadata
-    add_tool_handler(GetEventByIdToolHandler())
-    add_tool_handler(GetEventCategoriesToolHandler())
+    add_lazy_tool_handler("get_event_by_id", events, "GetEventByIdToolHandler")
+    add_lazy_tool_handler("trending_events", events, "TrendingEventsToolHandler")
+    add_lazy_tool_handler("get_event_categories", events, "GetEventCategoriesToolHandler")
+    add_lazy_tool_handler("get_neighborhoods", events, "GetNeighborhoodsToolHandler")
+
+    # Precomputed summaries
+    add_lazy_tool_handler("get_day_digest", events, "GetDayDigestToolHandler")
+
+    # Per-user preferences
+    add_lazy_tool_handler("get_user_preferences", events, "GetUserPreferencesToolHandler")
+    add_lazy_tool_handler("get_my_recommendations", events, "GetMyRecommendationsToolHandler")
 
-    logger.info(f"Registered {len(tool_handlers)} tool handlers")
+    # Saved searches, matched against new events at ingest
+    add_lazy_tool_handler("save_search", events, "SaveSearchToolHandler")
+    add_lazy_tool_handler("list_saved_searches", events, "ListSavedSearchesToolHandler")
+    add_lazy_tool_handler("delete_saved_search", events, "DeleteSavedSearchToolHandler")
 
+    logger.info(f"Registered {len(_tool_names)} tool handlers")
 
-def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
+
+def create_initialization_options(mcp_server: Server) -> InitializationOptions:
+    """
+    Build the initialization options, advertising resource subscriptions.
+
+    The low-level server always reports subscribe=False, even with subscribe
+    handlers registered, so the flag is set here.
+
+    Args:
+        mcp_server: The MCP server instance
+
+    Returns:
+        Initialization options for Server.run
+    """
+    options = mcp_server.create_initialization_options()
+    if options.capabilities.resources is not None:
+        options.capabilities.resources.subscribe = True
+    return options
+
+
+def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> "Starlette":
     """
     Create a Starlette application that can serve the provided mcp server with SSE.
     Implements the MCP Streamable HTTP protocol with /mcp endpoint and CORS support.
@@ -114,6 +312,12 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
     if not SSE_AVAILABLE:
         raise RuntimeError("SSE dependencies not available. Install with: pip install starlette uvicorn")
 
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.routing import Mount, Route
+    from starlette.middleware.cors import CORSMiddleware
+
     sse = SseServerTransport("/messages/")
 
     async def handle_mcp(request: Request) -> None:
@@ -126,7 +330,7 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
             await mcp_server.run(
                 read_stream,
                 write_stream,
-                mcp_server.create_initialization_options(),
+                create_initialization_options(mcp_server),
             )
 
     app = Starlette(
@@ -160,17 +364,21 @@ async def list_tools() -> list[Tool]:
     Returns:
         List of Tool objects describing all registered tools
     """
+    global _tool_list_cache
     try:
-        tools = [handler.get_tool_description() for handler in tool_handlers.values()]
-        logger.info(f"Listed {len(tools)} available tools")
-        return tools
+        if _tool_list_cache is None:
+            _tool_list_cache = [get_tool_handler(name).get_tool_description() for name in _tool_names]
+        logger.debug("Listed %d available tools", len(_tool_list_cache))
+        return _tool_list_cache
     except Exception as e:
         logger.exception(f"Error listing tools: {str(e)}")
         raise
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+@app.call_tool(validate_input=False)
+async def call_tool(
+    name: str, arguments: Any
+) -> Sequence[TextContent | ImageContent | EmbeddedResource] | tuple[Sequence[TextContent], dict[str, Any]]:
     """
     Execute a tool with the provided arguments.
 
@@ -179,41 +387,179 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
         arguments: The arguments to pass to the tool
 
     Returns:
-        Sequence of MCP content objects
+        Sequence of MCP content objects, paired with the returned events as
+        structured content when the client set _meta.structured
 
     Raises:
         RuntimeError: If the tool execution fails
+        ValueError: If the arguments do not match the tool's input schema
     """
-    try:
-        # Validate arguments
-        if not isinstance(arguments, dict):
-            raise RuntimeError("Arguments must be a dictionary")
+    # Schema violations are reported as MCP tool errors (isError), as the SDK does
+    tool_handler = get_tool_handler(name)
+    if tool_handler is not None and isinstance(arguments, dict):
+        validate_arguments(tool_handler, arguments)
+
+    request_token = request_id_var.set(new_request_id())
+    started = time.perf_counter()
+    with span("call_tool", traceparent=get_request_traceparent(), tool=name) as tool_span:
+        try:
+            # Validate arguments
+            if not isinstance(arguments, dict):
+                raise RuntimeError("Arguments must be a dictionary")
+
+            # Get the tool handler
+            tool_handler = get_tool_handler(name)
+            if not tool_handler:
+                raise ValueError(f"Unknown tool: {name}")
+
+            logger.debug("Executing tool %s with arguments %s", name, list(arguments.keys()))
+
+            from .tools.deadline import call_budget
+            from .tools.popularity import observing, record_tool_call
+
+            # Execute the tool, collecting the events it returns for popularity tracking
+            # (and structured results if asked for) and streaming partial results if the
+            # client sent a progress token. Database work stops at the deadline; the grace
+            # period lets the tool answer with what it has before it is stopped outright.
+            budget = get_call_budget(tool_handler)
+            with (
+                observing() as observed,
+                collecting_events(get_request_structured()) as collected,
+                reporting_progress(get_request_progress_reporter()),
+                call_budget(budget),
+            ):
+                try:
+                    timeout = budget.seconds + DEADLINE_GRACE_S if budget.seconds is not None else None
+                    result = await asyncio.wait_for(tool_handler.run_tool(arguments), timeout)
+                except asyncio.TimeoutError:
+                    budget.cancelled = True
+                    raise RuntimeError(f"Tool call exceeded its deadline of {budget.seconds:g}s and was stopped")
+                except asyncio.CancelledError:
+                    budget.cancelled = True
+                    logger.info("Tool %s cancelled by the client", name, extra={"tool": name, "outcome": "cancelled"})
+                    raise
+            record_tool_call(name, observed)
+
+            if budget.truncated:
+                result = [
+                    *result,
+                    TextContent(
+                        type="text",
+                        text=f"⚠️ Truncated by deadline: the call was cut short after {budget.seconds:g}s, "
+                             f"so the results above may be incomplete."
+                    ),
+                ]
+
+            logger.info(
+                "Tool %s executed successfully", name,
+                extra={
+                    "tool": name,
+                    "outcome": "ok",
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                    "sampled": True,
+                },
+            )
+            if collected is not None and collected.events is not None:
+                return result, {
+                    "events": [event.to_dict() for event in collected.events],
+                    "truncated": budget.truncated,
+                }
+            return result
+
+        except Exception as e:
+            tool_span.record_error(e)
+            # Single record; the traceback is rendered on the logging thread
+            logger.error(
+                "Error executing tool %s", name,
+                exc_info=True,
+                extra={
+                    "tool": name,
+                    "outcome": "error",
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                },
+            )
 
-        # Get the tool handler
-        tool_handler = get_tool_handler(name)
-        if not tool_handler:
-            raise ValueError(f"Unknown tool: {name}")
+            # Return error as text content
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error executing tool '{name}': {str(e)}"
+                )
+            ]
+        finally:
+            request_id_var.reset(request_token)
 
-        logger.info(f"Executing tool: {name} with arguments: {list(arguments.keys())}")
 
-        # Execute the tool
-        result = await tool_handler.run_tool(arguments)
+@app.list_resources()
+async def list_resources() -> list[Resource]:
+    """
+    List the days with events and the saved searches.
 
-        logger.info(f"Tool {name} executed successfully")
-        return result
+    Returns:
+        Resource objects; day resources carry their content version in _meta
+    """
+    from . import resources
+    from .tools.events_service import get_events_service
 
-    except Exception as e:
-        logger.exception(f"Error executing tool {name}: {str(e)}")
-        error_traceback = traceback.format_exc()
-        logger.error(f"Full traceback: {error_traceback}")
-
-        # Return error as text content
-        return [
-            TextContent(
-                type="text",
-                text=f"Error executing tool '{name}': {str(e)}"
-            )
-        ]
+    return await resources.list_resources(get_events_service())
+
+
+@app.list_resource_templates()
+async def list_resource_templates() -> list[ResourceTemplate]:
+    """
+    List the URI templates of events, venues and saved search resources.
+
+    Returns:
+        ResourceTemplate objects
+    """
+    from . import resources
+
+    return resources.RESOURCE_TEMPLATES
+
+
+@app.read_resource()
+async def read_resource(uri: AnyUrl) -> Iterable[ReadResourceContents]:
+    """
+    Read an events, venues or saved search resource.
+
+    Args:
+        uri: Resource URI (see resources.RESOURCE_TEMPLATES)
+
+    Returns:
+        One JSON document; events and venues documents include their version
+    """
+    from . import resources
+    from .tools.events_service import get_events_service
+
+    with span("read_resource", traceparent=get_request_traceparent(), uri=str(uri)):
+        document = await resources.read_resource(get_events_service(), str(uri))
+    return [ReadResourceContents(content=resources.encode(document), mime_type=resources.MIME_TYPE)]
+
+
+@app.subscribe_resource()
+async def subscribe_resource(uri: AnyUrl) -> None:
+    """
+    Notify the calling session when a resource changes.
+
+    Args:
+        uri: Resource URI
+    """
+    from . import resources
+
+    await resources.subscribe(app.request_context.session, str(uri))
+
+
+@app.unsubscribe_resource()
+async def unsubscribe_resource(uri: AnyUrl) -> None:
+    """
+    Stop notifying the calling session about a resource.
+
+    Args:
+        uri: Resource URI
+    """
+    from . import resources
+
+    resources.unsubscribe(app.request_context.session, str(uri))
 
 
 async def main():
@@ -231,20 +577,46 @@ async def main():
                         help='Port to listen on (SSE mode only, default: from PORT env var or 8080)')
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug mode')
+    parser.add_argument('--log-format', choices=['json', 'text'], default='json',
+                        help='Log record format (default: json)')
+    parser.add_argument('--log-sample-rate', type=float, default=1.0,
+                        help='Fraction of successful tool call logs to keep, 0.0-1.0 (default: 1.0)')
+    parser.add_argument('--log-dedup-window', type=float, default=60.0,
+                        help='Seconds to collapse repeated identical errors, 0 to disable (default: 60)')
+    parser.add_argument('--trace', default=None,
+                        help='Enable tracing: console, jsonl or jsonl:<path> (default: off, or NYC_EVENTS_TRACE env var)')
+    parser.add_argument('--tool-deadline', action='append', default=[], metavar='[TOOL=]SECONDS',
+                        help='Cut tool calls short after this many seconds, for all tools or one tool; '
+                             'repeatable (default: no deadline)')
+    parser.add_argument('--prefs-db', default=None,
+                        help='User preferences database (default: NYC_EVENTS_PREFS_DB env var or workspace root)')
 
     args = parser.parse_args()
 
+    configure_logging(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        json_format=args.log_format == "json",
+        success_sample_rate=args.log_sample_rate,
+        error_dedup_window_s=args.log_dedup_window,
+    )
+
     # Get port from environment variable or use command line argument, or default to 8080
     import os
     port = args.port if args.port is not None else int(os.environ.get("PORT", 8080))
+    if args.prefs_db is not None:
+        os.environ["NYC_EVENTS_PREFS_DB"] = args.prefs_db
 
     try:
+        if args.trace is not None:
+            configure_tracing_from_spec(args.trace)
+
         # Register all tools
         register_all_tools()
+        configure_tool_deadlines(args.tool_deadline)
 
         logger.info(f"Starting NYC Events MCP Server in {args.mode} mode...")
         logger.info(f"Python version: {sys.version}")
-        logger.info(f"Registered tools: {list(tool_handlers.keys())}")
+        logger.info(f"Registered tools: {tool_names()}")
 
         # Run the server in the specified mode
         await run_server(args.mode, args.host, port, args.debug)
@@ -254,6 +626,25 @@ async def main():
         raise
 
 
+def configure_tool_deadlines(specs: list[str]) -> None:
+    """
+    Apply --tool-deadline values: "SECONDS" sets the default, "TOOL=SECONDS" one tool's deadline.
+
+    Args:
+        specs: Values as given on the command line
+    """
+    global default_tool_deadline_s
+    for spec in specs:
+        tool_name, _, seconds = spec.rpartition("=")
+        if not tool_name:
+            default_tool_deadline_s = float(seconds)
+            continue
+        handler = get_tool_handler(tool_name)
+        if handler is None:
+            raise ValueError(f"Unknown tool in --tool-deadline: {tool_name}")
+        handler.deadline_s = float(seconds)
+
+
 async def run_server(mode: str, host: str = "0.0.0.0", port: int = 8080, debug: bool = False):
     """
     Unified server runner that supports both stdio and SSE modes.
@@ -273,7 +664,7 @@ async def run_server(mode: str, host: str = "0.0.0.0", port: int = 8080, debug:
             await app.run(
                 read_stream,
                 write_stream,
-                app.create_initialization_options()
+                create_initialization_options(app)
             )
 
     elif mode == "sse":
@@ -288,6 +679,8 @@ async def run_server(mode: str, host: str = "0.0.0.0", port: int = 8080, debug:
         # Create Starlette app with SSE transport
         starlette_app = create_starlette_app(app, debug=debug)
 
+        import uvicorn
+
         # Configure uvicorn
         config = uvicorn.Config(
             app=starlette_app,
@@ -0,0 +1,253 @@
+"""
+Borough and neighborhood lookup for venue coordinates.
+
+Boundaries come from a GeoJSON FeatureCollection bundled with the package
+(``data/nyc_areas.geojson``). Each feature is a Polygon or MultiPolygon with
+properties ``level`` ("borough" or "neighborhood"), ``name`` and, for
+neighborhoods, ``borough``. The bundled file holds simplified outlines; a
+more detailed file with the same properties (e.g. derived from the city's
+Neighborhood Tabulation Areas) can be used via ``NYC_EVENTS_AREAS``.
+
+Lookups are batched: points are bucketed into a uniform grid whose cells
+list the polygons overlapping them, so each point is only tested against the
+few polygons near it. A point gets the first borough containing it, then the
+first neighborhood of that borough containing it (file order breaks ties).
+
+Usage:
+    python -m nyc_events_mcp.tools.areas 40.7216 -73.9935
+"""
+
+import argparse
+import json
+import math
+import os
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Side of a spatial index cell in degrees (~1km)
+CELL_DEG = 0.01
+
+BOROUGH = "borough"
+NEIGHBORHOOD = "neighborhood"
+
+
+def default_areas_path() -> str:
+    """
+    Return the boundary file path.
+
+    Returns:
+        NYC_EVENTS_AREAS if set, otherwise the bundled GeoJSON file
+    """
+    return os.environ.get("NYC_EVENTS_AREAS") or os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "data", "nyc_areas.geojson"
+    )
+
+
+class Area:
+    """
+    One boundary polygon: rings of (longitude, latitude) vertices and their bounding box.
+    """
+
+    __slots__ = ("level", "name", "borough", "rings", "bbox")
+
+    def __init__(self, level: str, name: str, borough: Optional[str], rings: List[np.ndarray]):
+        self.level = level
+        self.name = name
+        self.borough = borough
+        self.rings = rings
+        stacked = np.concatenate(rings)
+        # (min_lon, min_lat, max_lon, max_lat)
+        self.bbox = (*stacked.min(axis=0), *stacked.max(axis=0))
+
+    def contains(self, longitudes: np.ndarray, latitudes: np.ndarray) -> np.ndarray:
+        """
+        Even-odd ray casting over all rings, so holes and multipolygon parts work.
+
+        Args:
+            longitudes: Point longitudes
+            latitudes: Point latitudes
+
+        Returns:
+            Boolean array aligned with the points
+        """
+        inside = np.zeros(len(longitudes), dtype=bool)
+        for ring in self.rings:
+            x0, y0 = ring[:-1, 0], ring[:-1, 1]
+            x1, y1 = ring[1:, 0], ring[1:, 1]
+            # Points x edges: does a ray to the east cross the edge?
+            py = latitudes[:, None]
+            straddles = (y0 > py) != (y1 > py)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cross_x = x0 + (py - y0) * (x1 - x0) / (y1 - y0)
+            crossings = straddles & (longitudes[:, None] < cross_x)
+            inside ^= (crossings.sum(axis=1) % 2).astype(bool)
+        return inside
+
+
+def _rings(geometry: dict) -> List[np.ndarray]:
+    if geometry["type"] == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry["type"] == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        raise ValueError(f"Unsupported geometry type: {geometry['type']}")
+    rings = []
+    for polygon in polygons:
+        for ring in polygon:
+            points = np.asarray(ring, dtype=np.float64)[:, :2]
+            if not np.array_equal(points[0], points[-1]):
+                points = np.vstack([points, points[:1]])
+            rings.append(points)
+    return rings
+
+
+def load_areas(path: str) -> List[Area]:
+    """
+    Read boundary polygons from a GeoJSON FeatureCollection.
+
+    Args:
+        path: GeoJSON file path
+
+    Returns:
+        Areas in file order; features without a known level are skipped
+    """
+    with open(path, encoding="utf-8") as f:
+        collection = json.load(f)
+    areas = []
+    for feature in collection.get("features", []):
+        props = feature.get("properties") or {}
+        level = props.get("level")
+        if level not in (BOROUGH, NEIGHBORHOOD) or not props.get("name"):
+            continue
+        areas.append(Area(level, props["name"], props.get("borough"), _rings(feature["geometry"])))
+    return areas
+
+
+def _cell(value: float) -> int:
+    return math.floor(value / CELL_DEG)
+
+
+class _GridIndex:
+    """
+    Uniform grid over polygon bounding boxes: cell -> indices of the polygons overlapping it.
+    """
+
+    def __init__(self, areas: List[Area]):
+        self.areas = areas
+        self.cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, area in enumerate(areas):
+            min_lon, min_lat, max_lon, max_lat = area.bbox
+            for cx in range(_cell(min_lon), _cell(max_lon) + 1):
+                for cy in range(_cell(min_lat), _cell(max_lat) + 1):
+                    self.cells[(cx, cy)].append(i)
+
+    def first_match(
+        self,
+        longitudes: np.ndarray,
+        latitudes: np.ndarray,
+        boroughs: Optional[List[Optional[str]]] = None
+    ) -> List[Optional[str]]:
+        """
+        Name of the first polygon containing each point (optionally within the point's borough).
+        """
+        result: List[Optional[str]] = [None] * len(longitudes)
+        cell_x = np.floor(longitudes / CELL_DEG).astype(np.int64)
+        cell_y = np.floor(latitudes / CELL_DEG).astype(np.int64)
+
+        points_by_cell: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, key in enumerate(zip(cell_x.tolist(), cell_y.tolist())):
+            if key in self.cells:
+                points_by_cell[key].append(i)
+
+        for key, point_ids in points_by_cell.items():
+            pending = np.asarray(point_ids)
+            for area_id in self.cells[key]:
+                area = self.areas[area_id]
+                if boroughs is not None:
+                    pending_same = pending[[boroughs[i] == area.borough for i in pending]]
+                else:
+                    pending_same = pending
+                if not len(pending_same):
+                    continue
+                hits = pending_same[area.contains(longitudes[pending_same], latitudes[pending_same])]
+                for i in hits.tolist():
+                    result[i] = area.name
+                pending = np.setdiff1d(pending, hits, assume_unique=True)
+                if not len(pending):
+                    break
+        return result
+
+
+class AreaIndex:
+    """
+    Spatial index over borough and neighborhood boundaries.
+    """
+
+    def __init__(self, areas: List[Area]):
+        self.boroughs = _GridIndex([area for area in areas if area.level == BOROUGH])
+        self.neighborhoods = _GridIndex([area for area in areas if area.level == NEIGHBORHOOD])
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "AreaIndex":
+        """
+        Build the index from a boundary file.
+
+        Args:
+            path: GeoJSON file (default: default_areas_path())
+
+        Returns:
+            AreaIndex instance
+        """
+        return cls(load_areas(path or default_areas_path()))
+
+    def locate(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float]
+    ) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Borough and neighborhood of each point.
+
+        Args:
+            latitudes: Point latitudes
+            longitudes: Point longitudes
+
+        Returns:
+            List of (borough, neighborhood) aligned with the points; None where
+            no boundary contains the point
+        """
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        boroughs = self.boroughs.first_match(lons, lats)
+        neighborhoods = self.neighborhoods.first_match(lons, lats, boroughs)
+        return list(zip(boroughs, neighborhoods))
+
+
+_area_index: Optional[AreaIndex] = None
+
+
+def get_area_index() -> AreaIndex:
+    """
+    Return the shared index over the default boundary file, loading it on first use.
+    """
+    global _area_index
+    if _area_index is None:
+        _area_index = AreaIndex.load()
+    return _area_index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Look up the borough and neighborhood of a point")
+    parser.add_argument("latitude", type=float)
+    parser.add_argument("longitude", type=float)
+    parser.add_argument("--areas", default=None, help="GeoJSON boundary file (default: bundled boundaries)")
+    args = parser.parse_args()
+
+    borough, neighborhood = AreaIndex.load(args.areas).locate([args.latitude], [args.longitude])[0]
+    print(f"{neighborhood or '-'}, {borough or '-'}")
+
+
+if __name__ == "__main__":
+    main()
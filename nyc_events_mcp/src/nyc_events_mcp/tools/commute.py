@@ -0,0 +1,415 @@
+"""
+Offline commute-time estimates between venues and user locations.
+
+Travel time uses a deliberately cheap model instead of a routing engine:
+- distance is measured along Manhattan's street grid (rotated ~29° from
+  true north) rather than as the crow flies;
+- short trips are walked, longer ones use transit with a fixed access and
+  waiting overhead;
+- moving between zones (New Jersey, the five boroughs) adds a transfer
+  penalty, plus a penalty per river or harbor crossing on the cheapest
+  zone-to-zone path.
+
+The venue-to-venue matrix is built once per database and stored next to it
+as ``<db>.commute.npz`` in whole minutes (uint8, saturating at 255). Rows
+from arbitrary points such as user homes are computed in O(venues), kept in
+an LRU and, for every home in the preferences store, precomputed with the
+matrix. A lookup is then an array index.
+
+Usage:
+    python -m nyc_events_mcp.tools.commute [--db events.sqlite]
+"""
+
+import argparse
+import logging
+import math
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# Bump when the model or file layout changes so stale matrices rebuild
+MATRIX_FORMAT = 1
+
+# Travel minutes are stored as uint8; longer trips saturate here
+MAX_MINUTES = 255
+
+# Rotation of Manhattan's street grid from true north, in degrees
+GRID_ANGLE_DEG = 29.0
+
+# Walking pace; within a zone, trips take the faster of walking and transit
+WALK_MIN_PER_KM = 12.0
+# Transit: minutes per grid km plus access, egress and waiting
+TRANSIT_MIN_PER_KM = 3.0
+TRANSIT_OVERHEAD_MIN = 10.0
+
+# Added once whenever origin and destination are in different zones
+ZONE_TRANSFER_MIN = 5.0
+
+# Number of point-to-venue rows kept in memory
+ORIGIN_CACHE_SIZE = 1024
+
+# Coordinates are rounded to ~10m when caching rows for points
+ORIGIN_PRECISION = 4
+
+# Reference point of the local projection (lower Manhattan)
+_LAT0, _LON0 = 40.7128, -74.0060
+_KM_PER_DEG_LAT = 110.57
+_KM_PER_DEG_LON = 111.32 * math.cos(math.radians(_LAT0))
+
+ZONES = ("new_jersey", "manhattan", "brooklyn", "queens", "bronx", "staten_island")
+NJ, MANHATTAN, BROOKLYN, QUEENS, BRONX, STATEN_ISLAND = range(len(ZONES))
+
+# Crossings between adjacent zones and their cost in minutes
+_CROSSINGS: Dict[Tuple[int, int], float] = {
+    (NJ, MANHATTAN): 10.0,           # Hudson (PATH, tunnels)
+    (MANHATTAN, BROOKLYN): 6.0,      # East River
+    (MANHATTAN, QUEENS): 6.0,        # East River
+    (MANHATTAN, BRONX): 4.0,         # Harlem River
+    (BROOKLYN, QUEENS): 0.0,         # land border
+    (QUEENS, BRONX): 8.0,            # East River bridges
+    (BROOKLYN, STATEN_ISLAND): 15.0,  # Verrazzano
+    (MANHATTAN, STATEN_ISLAND): 20.0,  # ferry
+    (NJ, STATEN_ISLAND): 10.0,       # Bayonne / Goethals
+}
+
+# Shorelines as (latitude, longitude) knots, interpolated by latitude.
+# West of the Hudson shore is New Jersey; east of the Manhattan east shore
+# (East and Harlem Rivers) is Brooklyn, Queens or the Bronx.
+_HUDSON_SHORE = np.array([
+    (40.600, -74.050), (40.690, -74.045), (40.700, -74.020), (40.720, -74.017),
+    (40.740, -74.013), (40.760, -74.004), (40.780, -73.990), (40.800, -73.974),
+    (40.820, -73.960), (40.850, -73.948), (40.880, -73.926), (40.920, -73.910),
+])
+_EAST_SHORE = np.array([
+    (40.700, -74.010), (40.705, -73.998), (40.710, -73.975), (40.730, -73.972),
+    (40.750, -73.962), (40.770, -73.945), (40.790, -73.935), (40.800, -73.928),
+    (40.820, -73.933), (40.850, -73.925), (40.880, -73.910), (40.920, -73.900),
+])
+# Brooklyn / Queens border as (longitude, latitude) knots: north of it is Queens
+_BROOKLYN_QUEENS = np.array([
+    (-73.962, 40.739), (-73.920, 40.715), (-73.900, 40.700),
+    (-73.870, 40.690), (-73.855, 40.680), (-73.800, 40.600),
+])
+
+
+def _crossing_penalties() -> np.ndarray:
+    # Cheapest crossing cost between every pair of zones (Floyd-Warshall)
+    penalties = np.full((len(ZONES), len(ZONES)), np.inf)
+    np.fill_diagonal(penalties, 0.0)
+    for (a, b), cost in _CROSSINGS.items():
+        penalties[a, b] = penalties[b, a] = cost
+    for k in range(len(ZONES)):
+        penalties = np.minimum(penalties, penalties[:, k:k + 1] + penalties[k:k + 1, :])
+    return penalties + np.where(np.eye(len(ZONES), dtype=bool), 0.0, ZONE_TRANSFER_MIN)
+
+
+ZONE_PENALTIES = _crossing_penalties()
+
+
+def zone_of(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Approximate zone (index into ZONES) of each point.
+
+    Args:
+        latitudes: Point latitudes
+        longitudes: Point longitudes
+
+    Returns:
+        Array of zone indices
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    west = np.interp(latitudes, _HUDSON_SHORE[:, 0], _HUDSON_SHORE[:, 1])
+    east = np.interp(latitudes, _EAST_SHORE[:, 0], _EAST_SHORE[:, 1])
+    border = np.interp(longitudes, _BROOKLYN_QUEENS[:, 0], _BROOKLYN_QUEENS[:, 1])
+
+    zones = np.where(latitudes >= border, QUEENS, BROOKLYN)
+    zones = np.where(latitudes >= 40.800, BRONX, zones)
+    zones = np.where((longitudes <= east) & (latitudes >= 40.700) & (latitudes < 40.880), MANHATTAN, zones)
+    zones = np.where(longitudes < west, NJ, zones)
+    zones = np.where((latitudes < 40.648) & (longitudes < -74.050), STATEN_ISLAND, zones)
+    return zones.astype(np.int8)
+
+
+def _grid_coordinates(latitudes: np.ndarray, longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Local km coordinates rotated so the axes follow Manhattan's avenues and streets
+    x = (np.asarray(longitudes, dtype=np.float64) - _LON0) * _KM_PER_DEG_LON
+    y = (np.asarray(latitudes, dtype=np.float64) - _LAT0) * _KM_PER_DEG_LAT
+    angle = math.radians(GRID_ANGLE_DEG)
+    return x * math.cos(angle) - y * math.sin(angle), x * math.sin(angle) + y * math.cos(angle)
+
+
+def estimate_minutes(
+    grid_x: np.ndarray,
+    grid_y: np.ndarray,
+    zones: np.ndarray,
+    to_x: np.ndarray,
+    to_y: np.ndarray,
+    to_zones: np.ndarray
+) -> np.ndarray:
+    """
+    Estimated travel minutes between points (broadcasting over the inputs).
+
+    Args:
+        grid_x, grid_y, zones: Origin grid coordinates and zones
+        to_x, to_y, to_zones: Destination grid coordinates and zones
+
+    Returns:
+        Travel minutes as uint8, saturating at MAX_MINUTES
+    """
+    grid_km = np.abs(grid_x - to_x) + np.abs(grid_y - to_y)
+    walk = grid_km * WALK_MIN_PER_KM
+    transit = TRANSIT_OVERHEAD_MIN + grid_km * TRANSIT_MIN_PER_KM + ZONE_PENALTIES[zones, to_zones]
+    # Walking is only realistic within a zone
+    minutes = np.where(zones == to_zones, np.minimum(walk, transit), transit)
+    return np.clip(np.rint(minutes), 0, MAX_MINUTES).astype(np.uint8)
+
+
+def haversine_km(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distance in km from one point to many.
+    """
+    lat1 = math.radians(latitude)
+    lat2 = np.radians(latitudes)
+    dlat = lat2 - lat1
+    dlon = np.radians(longitudes) - math.radians(longitude)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 6371.0 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def matrix_path(db_path: str) -> str:
+    """Path of the persisted matrix for an events database."""
+    return db_path + ".commute.npz"
+
+
+def database_signature(conn: sqlite3.Connection) -> Tuple[int, int, int]:
+    """
+    Cheap fingerprint of the venues table.
+
+    Venues are deduplicated at ingest and only ever appended, so the count
+    and highest id change whenever the matrix needs rebuilding.
+    """
+    count, max_id = conn.execute("SELECT COUNT(*), COALESCE(MAX(venue_id), 0) FROM venues").fetchone()
+    return (MATRIX_FORMAT, count, max_id)
+
+
+class CommuteMatrix:
+    """
+    Venue-to-venue travel minutes plus cached rows from arbitrary points.
+    """
+
+    def __init__(
+        self,
+        venue_ids: np.ndarray,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        minutes: np.ndarray,
+        signature: Tuple[int, ...],
+        cache_size: int = ORIGIN_CACHE_SIZE,
+    ):
+        self.venue_ids = venue_ids
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.minutes = minutes
+        self.signature = signature
+        self.zones = zone_of(latitudes, longitudes)
+        self._grid_x, self._grid_y = _grid_coordinates(latitudes, longitudes)
+        self.cache_size = cache_size
+        self._origins: "OrderedDict[Tuple[float, float], np.ndarray]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.venue_ids)
+
+    @classmethod
+    def build(cls, conn: sqlite3.Connection, chunk_rows: int = 512) -> "CommuteMatrix":
+        """
+        Compute travel minutes between every pair of venues.
+
+        Args:
+            conn: Connection to the events database
+            chunk_rows: Origin venues computed per vectorized step (bounds peak memory)
+
+        Returns:
+            A new CommuteMatrix
+        """
+        rows = conn.execute("SELECT venue_id, latitude, longitude FROM venues ORDER BY venue_id").fetchall()
+        venue_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        latitudes = np.array([row[1] for row in rows], dtype=np.float64)
+        longitudes = np.array([row[2] for row in rows], dtype=np.float64)
+
+        zones = zone_of(latitudes, longitudes)
+        grid_x, grid_y = _grid_coordinates(latitudes, longitudes)
+        minutes = np.empty((len(rows), len(rows)), dtype=np.uint8)
+        for start in range(0, len(rows), chunk_rows):
+            stop = start + chunk_rows
+            minutes[start:stop] = estimate_minutes(
+                grid_x[start:stop, None], grid_y[start:stop, None], zones[start:stop, None],
+                grid_x[None, :], grid_y[None, :], zones[None, :],
+            )
+        np.fill_diagonal(minutes, 0)
+        return cls(venue_ids, latitudes, longitudes, minutes, database_signature(conn))
+
+    def row_of(self, venue_id: int) -> Optional[int]:
+        """Matrix row of a venue, or None if it is not in the matrix."""
+        row = int(np.searchsorted(self.venue_ids, venue_id))
+        if row < len(self.venue_ids) and self.venue_ids[row] == venue_id:
+            return row
+        return None
+
+    def between(self, from_venue_id: int, to_venue_id: int) -> Optional[int]:
+        """
+        Travel minutes between two venues.
+
+        Returns:
+            Minutes, or None if either venue is unknown
+        """
+        origin, destination = self.row_of(from_venue_id), self.row_of(to_venue_id)
+        if origin is None or destination is None:
+            return None
+        return int(self.minutes[origin, destination])
+
+    def from_venue(self, venue_id: int) -> Optional[np.ndarray]:
+        """Travel minutes from a venue to every venue (aligned with venue_ids)."""
+        row = self.row_of(venue_id)
+        return None if row is None else self.minutes[row]
+
+    def from_point(self, latitude: float, longitude: float) -> np.ndarray:
+        """
+        Travel minutes from a point to every venue (aligned with venue_ids).
+
+        Rows are cached per point (rounded to ~10m); homes precomputed with
+        the matrix are already in the cache.
+        """
+        key = (round(latitude, ORIGIN_PRECISION), round(longitude, ORIGIN_PRECISION))
+        row = self._origins.get(key)
+        if row is not None:
+            self._origins.move_to_end(key)
+            return row
+
+        grid_x, grid_y = _grid_coordinates(np.array([key[0]]), np.array([key[1]]))
+        zone = zone_of(np.array([key[0]]), np.array([key[1]]))
+        row = estimate_minutes(grid_x, grid_y, zone, self._grid_x, self._grid_y, self.zones)
+        self._remember(key, row)
+        return row
+
+    def _remember(self, key: Tuple[float, float], row: np.ndarray) -> None:
+        self._origins[key] = row
+        self._origins.move_to_end(key)
+        while len(self._origins) > self.cache_size:
+            self._origins.popitem(last=False)
+
+    def precompute(self, points: Sequence[Tuple[float, float]]) -> None:
+        """Compute and cache the rows of the given points (e.g. every user's home)."""
+        for latitude, longitude in points:
+            self.from_point(latitude, longitude)
+
+    def save(self, path: str) -> None:
+        """
+        Write the matrix, and the cached point rows, atomically to path.
+        """
+        keys = list(self._origins)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                venue_ids=self.venue_ids,
+                latitudes=self.latitudes,
+                longitudes=self.longitudes,
+                minutes=self.minutes,
+                signature=np.array(self.signature, dtype=np.int64),
+                origin_points=np.array(keys, dtype=np.float64).reshape(len(keys), 2),
+                origin_minutes=np.array([self._origins[key] for key in keys], dtype=np.uint8).reshape(len(keys), len(self)),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CommuteMatrix":
+        """
+        Read a matrix written by save().
+        """
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["signature"][0]) != MATRIX_FORMAT:
+                raise ValueError(f"matrix format {int(data['signature'][0])} is not {MATRIX_FORMAT}")
+            matrix = cls(
+                venue_ids=data["venue_ids"],
+                latitudes=data["latitudes"],
+                longitudes=data["longitudes"],
+                minutes=data["minutes"],
+                signature=tuple(int(value) for value in data["signature"]),
+            )
+            for point, row in zip(data["origin_points"], data["origin_minutes"]):
+                matrix._remember((float(point[0]), float(point[1])), row)
+        return matrix
+
+
+def _home_points() -> List[Tuple[float, float]]:
+    from .user_prefs import get_prefs_store
+
+    try:
+        return get_prefs_store().home_locations()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not read user homes for the commute matrix: {e}")
+        return []
+
+
+def load_or_build(db_path: str, matrix: Optional[CommuteMatrix] = None) -> CommuteMatrix:
+    """
+    Return an up-to-date commute matrix for a database.
+
+    Reuses the in-memory or persisted matrix while the venues are unchanged;
+    otherwise rebuilds it and precomputes the rows of every user's home.
+
+    Args:
+        db_path: Events database path
+        matrix: Matrix already held in memory, if any
+
+    Returns:
+        An up-to-date CommuteMatrix
+    """
+    path = matrix_path(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        signature = database_signature(conn)
+        if matrix is None and os.path.exists(path):
+            try:
+                matrix = CommuteMatrix.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable commute matrix {path}: {e}")
+        if matrix is not None and matrix.signature == signature:
+            return matrix
+
+        started = time.perf_counter()
+        matrix = CommuteMatrix.build(conn)
+    finally:
+        conn.close()
+
+    matrix.precompute(_home_points())
+    logger.info(f"Built commute matrix of {len(matrix)} venues in {time.perf_counter() - started:.2f}s")
+    try:
+        matrix.save(path)
+    except OSError as e:
+        logger.warning(f"Could not persist commute matrix to {path}: {e}")
+    return matrix
+
+
+def main() -> None:
+    from .events_service import default_db_path
+
+    parser = argparse.ArgumentParser(description="Build the commute-time matrix for an events database")
+    parser.add_argument("--db", default=None, help="SQLite database path (default: bundled events database)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db_path = args.db or default_db_path()
+    matrix = load_or_build(db_path)
+    print(f"{matrix_path(db_path)}: {len(matrix)} venues, {matrix.minutes.nbytes / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Per-call deadlines and cancellation for tool calls.
+
+call_tool runs every tool under a CallBudget: an optional deadline (the
+tool's own ``deadline_s`` or the server's ``--tool-deadline``, shortened by
+a client's ``_meta.deadlineMs``) plus a flag that is set when the client
+cancels the request (notifications/cancelled) or the call is stopped.
+
+Database reads inside a call go through ``run_query``: the statement runs on
+a worker thread, a SQLite progress handler aborts it once the budget is
+spent, and cancelling the awaiting task interrupts the connection
+(``Connection.interrupt``). Abandoned queries therefore stop within a few
+thousand VM steps instead of running to completion on a thread that live
+requests need. Rows read before the deadline are kept: the listing comes
+back shorter and the budget is marked truncated, which call_tool reports to
+the client. Outside a tool call (scripts, ingest, service benchmarks)
+queries run inline on the calling thread as before.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# SQLite VM instructions between budget checks
+PROGRESS_CHECK_OPCODES = 10_000
+
+# Rows fetched per step, so rows read before an interrupt are kept
+FETCH_BATCH_SIZE = 256
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(Exception):
+    """The call ran out of time (or was cancelled) before the work could finish."""
+
+
+class CallBudget:
+    """
+    Time budget and cancellation state of one tool call.
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Args:
+            seconds: Time allowed from now (None for no deadline)
+        """
+        self.seconds = seconds
+        self.deadline = time.monotonic() + seconds if seconds is not None else None
+        self.cancelled = False
+        # Set once some work was cut short by the deadline
+        self.truncated = False
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None without one); 0 once cancelled."""
+        if self.cancelled:
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self) -> bool:
+        """True once the deadline has passed or the call was cancelled."""
+        return self.cancelled or (self.deadline is not None and time.monotonic() >= self.deadline)
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the budget is spent; the call's answer is then marked truncated."""
+        if self.expired():
+            self.truncated = True
+        if self.cancelled:
+            raise DeadlineExceeded("Tool call was cancelled")
+        if self.expired():
+            raise DeadlineExceeded(f"Tool call exceeded its deadline of {self.seconds:g}s")
+
+
+_current: ContextVar[Optional[CallBudget]] = ContextVar("call_budget", default=None)
+
+
+@contextmanager
+def call_budget(budget: CallBudget) -> Iterator[CallBudget]:
+    """
+    Make ``budget`` the budget of work run within this block (including worker threads started from it).
+    """
+    token = _current.set(budget)
+    try:
+        yield budget
+    finally:
+        _current.reset(token)
+
+
+def current_budget() -> Optional[CallBudget]:
+    """Return the budget of the running tool call, or None outside one."""
+    return _current.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left for the running tool call, or None when it has no deadline."""
+    budget = _current.get()
+    return budget.remaining() if budget is not None else None
+
+
+def query_batches(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: Sequence[Any],
+    row_factory: Optional[Callable[[sqlite3.Cursor, tuple], Any]] = None,
+    size: int = FETCH_BATCH_SIZE
+) -> Iterator[List[Any]]:
+    """
+    Run a query and yield its rows in batches.
+
+    When the call's budget interrupts the statement, iteration simply stops
+    (marking the budget truncated), so callers keep the rows read so far.
+
+    Args:
+        conn: Open connection (from run_query inside a tool call)
+        sql: Query
+        params: Query parameters
+        row_factory: Optional cursor row factory
+        size: Rows per batch
+
+    Returns:
+        Iterator over lists of rows
+    """
+    cursor = conn.cursor()
+    if row_factory is not None:
+        cursor.row_factory = row_factory
+    try:
+        cursor.execute(sql, params)
+        while True:
+            batch = cursor.fetchmany(size)
+            if not batch:
+                return
+            yield batch
+    except sqlite3.OperationalError:
+        budget = _current.get()
+        if budget is None or not budget.expired():
+            raise
+        budget.truncated = True
+        logger.info("Query interrupted by the call deadline; returning partial results")
+
+
+def read_rows(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: Sequence[Any],
+    row_factory: Optional[Callable[[sqlite3.Cursor, tuple], Any]] = None
+) -> List[Any]:
+    """
+    Like fetchall, but keeps the rows read before the call's deadline interrupted the query.
+    """
+    rows: List[Any] = []
+    for batch in query_batches(conn, sql, params, row_factory):
+        rows.extend(batch)
+    return rows
+
+
+async def run_query(db_path: str, work: Callable[[sqlite3.Connection], T]) -> T:
+    """
+    Run database work under the current call's budget.
+
+    Inside a tool call the work runs on a worker thread with a progress
+    handler that aborts statements once the budget is spent; if the awaiting
+    task is cancelled the connection is interrupted. Outside a call it runs
+    inline.
+
+    Args:
+        db_path: SQLite database path
+        work: Function of an open connection; the connection is closed afterwards
+
+    Returns:
+        The work's result; raises DeadlineExceeded if the budget is already
+        spent or a statement was aborted outside query_batches/read_rows
+    """
+    budget = _current.get()
+    if budget is None:
+        conn = sqlite3.connect(db_path)
+        try:
+            return work(conn)
+        finally:
+            conn.close()
+
+    budget.check()
+    connections: List[sqlite3.Connection] = []
+
+    def run() -> T:
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        connections.append(conn)
+        conn.set_progress_handler(budget.expired, PROGRESS_CHECK_OPCODES)
+        try:
+            return work(conn)
+        except sqlite3.OperationalError:
+            if budget.expired():
+                budget.check()
+            raise
+        finally:
+            conn.close()
+
+    task = asyncio.ensure_future(asyncio.to_thread(run))
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        budget.cancelled = True
+        for conn in connections:
+            try:
+                conn.interrupt()
+            except sqlite3.Error:
+                pass  # already closed: the work has finished
+        # The thread stops at its next check; nobody waits for its result
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        raise
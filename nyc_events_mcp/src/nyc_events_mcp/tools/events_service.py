@@ -3,15 +3,68 @@ EventsService - Database operations for NYC events.
 Handles SQLite queries and proximity calculations.
 """
 
+import asyncio
+import json
 import sqlite3
 import logging
 import os
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from datetime import datetime, date, timedelta, timezone
 import math
 
+from ..tracing import traced
+from .query import (
+    CURSOR_SEPARATOR,
+    All,
+    EventId,
+    EventIds,
+    EventQuery,
+    FacetQuery,
+    StatementCache,
+    Venue,
+    event_filters,
+    parse_change_cursor,
+)
+from .deadline import query_batches, read_rows, run_query
+from .progress import PROGRESS_BATCH_SIZE, ProgressReporter
+from .records import VENUE_SELECT, EventRecord, VenueRecord
+
 logger = logging.getLogger("nyc-events-mcp")
 
+# Number of distinct query shapes whose compiled SQL is kept per service
+STATEMENT_CACHE_SIZE = 128
+
+# Cosine similarity below which semantic matches are treated as noise
+SEMANTIC_MIN_SCORE = 0.1
+
+# Candidates fetched before personalized ranking picks the top results
+RANK_CANDIDATES = 500
+
+# Most viewed events considered before trending_events applies its filters
+TRENDING_CANDIDATES = 200
+
+# Radius of a saved search given a point but no radius
+DEFAULT_SEARCH_RADIUS_KM = 2.0
+
+# User id that the workspace prefs.json is imported as
+DEFAULT_USER_ID = "default"
+
+# Events kept per user and day by the recommendations batch
+RECOMMENDATIONS_PER_DAY = 10
+
+
+def default_db_path() -> str:
+    """
+    Return the path of the bundled events database in the workspace root.
+    """
+    # Navigate from src/nyc_events_mcp/tools/events_service.py -> workspace root
+    current_dir = os.path.dirname(os.path.abspath(__file__))  # tools/
+    src_dir = os.path.dirname(current_dir)  # nyc_events_mcp/
+    pkg_dir = os.path.dirname(src_dir)  # src/
+    server_dir = os.path.dirname(pkg_dir)  # nyc_events_mcp/
+    workspace_root = os.path.dirname(server_dir)  # morning_me/
+    return os.path.join(workspace_root, "events_oct20_to_nov20_2025_nyc.sqlite")
+
 
 class EventsService:
     """
@@ -28,54 +81,153 @@ class EventsService:
         """
         if db_path is None:
             # Default to the database in the workspace root
-            # Navigate from src/nyc_events_mcp/tools/events_service.py -> workspace root
-            current_dir = os.path.dirname(os.path.abspath(__file__))  # tools/
-            src_dir = os.path.dirname(current_dir)  # nyc_events_mcp/
-            pkg_dir = os.path.dirname(src_dir)  # src/
-            server_dir = os.path.dirname(pkg_dir)  # nyc_events_mcp/
-            workspace_root = os.path.dirname(server_dir)  # morning_me/
-            db_path = os.path.join(workspace_root, "events_oct20_to_nov20_2025_nyc.sqlite")
+            db_path = default_db_path()
         
         self.db_path = db_path
+        self.statements = StatementCache(STATEMENT_CACHE_SIZE)
+        self._semantic_index = None
+        self._semantic_db_mtime: Optional[float] = None
+        # Serializes index, matrix and gazetteer loads, which run in a worker thread
+        self._load_lock = asyncio.Lock()
+        self._ranker = None
+        self._commute_matrix = None
+        self._commute_db_mtime: Optional[float] = None
+        self._gazetteer = None
+        self._gazetteer_db_mtime: Optional[float] = None
         logger.info(f"EventsService initialized with database: {self.db_path}")
         
         # Verify database exists
         if not os.path.exists(self.db_path):
             raise FileNotFoundError(f"Events database not found at: {self.db_path}")
+        
+        self._ensure_schema()
     
-    def _get_connection(self) -> sqlite3.Connection:
+    def _ensure_schema(self) -> None:
+        """
+        Run pending schema migrations (e.g. for databases predating the digest table).
         """
-        Get a database connection.
+        from ..ingest import SCHEMA_VERSION, ensure_schema, schema_version
         
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if schema_version(conn) < SCHEMA_VERSION:
+                ensure_schema(conn)
+        finally:
+            conn.close()
+    
+    async def _query_events(self, query: EventQuery) -> List[EventRecord]:
+        """
+        Run an event query through the statement cache and materialize EventRecords.
+        
+        Rows go straight from SQLite tuples into slotted records, skipping
+        sqlite3.Row and per-row dicts. Inside a tool call the query runs under
+        the call's deadline and a deadline cuts the list short.
+        
+        Args:
+            query: Filters, limit and optional proximity join
+            
         Returns:
-            SQLite connection object
+            List of EventRecord objects
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        return conn
+        sql = self.statements.get(query)
+        params = query.params()
+        return await run_query(self.db_path, lambda conn: read_rows(conn, sql, params, EventRecord.row_factory))
     
-    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+    async def _stream_events(self, query: EventQuery, progress: Optional[ProgressReporter]) -> List[EventRecord]:
         """
-        Convert a database row to a dictionary.
+        Run an event query, sending each batch of rows as a progress notification.
+        
+        The query runs in a worker thread that hands over PROGRESS_BATCH_SIZE rows
+        at a time, so batches go out while later rows are still being read.
         
         Args:
-            row: SQLite Row object
+            query: Filters, limit and optional proximity join
+            progress: Reporter of the running tool call; None runs _query_events
             
         Returns:
-            Dictionary representation of the row
+            List of EventRecord objects, in query order
         """
-        return {
-            "event_id": row["event_id"],
-            "title": row["title"],
-            "category": row["category"],
-            "date": row["date"],
-            "start_time_local": row["start_time_local"],
-            "end_time_local": row["end_time_local"],
-            "venue_name": row["venue_name"],
-            "latitude": row["latitude"],
-            "longitude": row["longitude"],
-            "description": row["description"]
-        }
+        if progress is None:
+            return await self._query_events(query)
+        
+        loop = asyncio.get_running_loop()
+        batches: asyncio.Queue = asyncio.Queue()
+        sql = self.statements.get(query)
+        params = query.params()
+        
+        def produce(conn: sqlite3.Connection) -> None:
+            for batch in query_batches(conn, sql, params, EventRecord.row_factory, PROGRESS_BATCH_SIZE):
+                loop.call_soon_threadsafe(batches.put_nowait, batch)
+        
+        producer = asyncio.ensure_future(run_query(self.db_path, produce))
+        # Runs after every batch the thread handed over, and also if it never started
+        producer.add_done_callback(lambda _: batches.put_nowait([]))
+        events: List[EventRecord] = []
+        try:
+            while True:
+                batch = await batches.get()
+                if not batch:
+                    break
+                events.extend(batch)
+                await progress.report(
+                    len(events), query.limit, self.format_event_batch(batch, len(events) - len(batch) + 1)
+                )
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+        await progress.report(len(events), len(events), f"Fetched {len(events)} event(s)")
+        return events
+    
+    def _latest_change(self, conn: sqlite3.Connection) -> Optional[str]:
+        """
+        Return the newest change stamp (event write or cancellation), via the stamp indexes.
+        
+        Args:
+            conn: Open connection to the events database
+            
+        Returns:
+            ISO timestamp, or None for a database without changes
+        """
+        return conn.execute(
+            "SELECT MAX(stamp) FROM (SELECT MAX(updated_at) AS stamp FROM events "
+            "UNION ALL SELECT MAX(deleted_at) FROM event_tombstones)"
+        ).fetchone()[0]
+    
+    async def latest_change(self) -> Optional[str]:
+        """
+        Return the newest change stamp in the events database (None if it never changed).
+        """
+        return await run_query(self.db_path, self._latest_change)
+    
+    async def _query_venues(self, sql: str, params: Sequence[Any]) -> List[VenueRecord]:
+        """
+        Run a query selecting VENUE_SELECT and materialize VenueRecords.
+        
+        Args:
+            sql: Query whose columns are VENUE_SELECT
+            params: Query parameters
+            
+        Returns:
+            List of VenueRecord objects
+        """
+        return await run_query(self.db_path, lambda conn: read_rows(conn, sql, params, VenueRecord.row_factory))
+    
+    @staticmethod
+    def bounding_box_deltas(latitude: float, radius_km: float) -> Tuple[float, float]:
+        """
+        Latitude/longitude half-widths of a box that contains a circle of radius_km.
+        
+        Args:
+            latitude: Latitude of the circle's center
+            radius_km: Circle radius in kilometers
+            
+        Returns:
+            Tuple of (latitude delta, longitude delta) in degrees
+        """
+        lat_delta = radius_km / 110.574
+        lon_delta = radius_km / (111.320 * max(math.cos(math.radians(latitude)), 0.01))
+        return lat_delta, lon_delta
     
     @staticmethod
     def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -110,14 +262,18 @@ class EventsService:
         distance = R * c
         return distance
     
+    @traced("events_service.search_events")
     async def search_events(
         self,
         query: Optional[str] = None,
         category: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 20
-    ) -> List[Dict[str, Any]]:
+        limit: int = 20,
+        neighborhood: Optional[str] = None,
+        borough: Optional[str] = None,
+        progress: Optional[ProgressReporter] = None
+    ) -> List[EventRecord]:
         """
         Search for events with various filters.
         
@@ -127,51 +283,82 @@ class EventsService:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
             limit: Maximum number of results to return
+            neighborhood: Only events in this neighborhood, e.g. "Williamsburg"
+            borough: Only events in this borough, e.g. "Brooklyn"
+            progress: Stream result batches as progress notifications (optional)
             
         Returns:
-            List of event dictionaries
+            List of EventRecord objects
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        sql = "SELECT * FROM events WHERE 1=1"
-        params = []
-        
-        if query:
-            sql += " AND (title LIKE ? OR description LIKE ? OR venue_name LIKE ?)"
-            search_pattern = f"%{query}%"
-            params.extend([search_pattern, search_pattern, search_pattern])
-        
-        if category:
-            sql += " AND category = ?"
-            params.append(category.lower())
-        
-        if start_date:
-            sql += " AND date >= ?"
-            params.append(start_date)
+        events = await self._stream_events(
+            EventQuery(event_filters(query, category, start_date, end_date, neighborhood, borough), limit=limit),
+            progress
+        )
+        logger.info(f"Found {len(events)} events matching search criteria")
+        return events
+    
+    @traced("events_service.get_search_facets")
+    async def get_search_facets(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        top_venues: int = 10,
+        neighborhood: Optional[str] = None,
+        borough: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Count the full match set of a search by category, date and venue.
         
-        if end_date:
-            sql += " AND date <= ?"
-            params.append(end_date)
+        All three facets come from a single grouped pass over the matching rows.
         
-        sql += " ORDER BY date, start_time_local LIMIT ?"
-        params.append(limit)
+        Args:
+            query: Search query for title, description, or venue
+            category: Filter by category
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            top_venues: Number of venues to include in the venue facet
+            neighborhood: Neighborhood filter
+            borough: Borough filter
+            
+        Returns:
+            Dictionary with total, category, date and venue counts
+        """
+        facet_query = FacetQuery(event_filters(query, category, start_date, end_date, neighborhood, borough))
+        sql = self.statements.get(facet_query)
+        # Partial counts would be wrong, so a deadline fails the facets instead of truncating them
+        rows = await run_query(self.db_path, lambda conn: conn.execute(sql, facet_query.params()).fetchall())
         
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
+        total = 0
+        by_category: Dict[str, int] = {}
+        by_date: Dict[str, int] = {}
+        by_venue: Dict[str, int] = {}
+        for event_category, event_date, venue_name, n in rows:
+            total += n
+            by_category[event_category] = by_category.get(event_category, 0) + n
+            by_date[event_date] = by_date.get(event_date, 0) + n
+            by_venue[venue_name] = by_venue.get(venue_name, 0) + n
         
-        events = [self._row_to_dict(row) for row in rows]
-        logger.info(f"Found {len(events)} events matching search criteria")
-        return events
+        venues = sorted(by_venue.items(), key=lambda item: (-item[1], item[0]))[:top_venues]
+        return {
+            "total": total,
+            "category": dict(sorted(by_category.items())),
+            "date": dict(sorted(by_date.items())),
+            "venue": dict(venues),
+        }
     
+    @traced("events_service.get_events_by_category")
     async def get_events_by_category(
         self,
         category: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 20
-    ) -> List[Dict[str, Any]]:
+        limit: int = 20,
+        neighborhood: Optional[str] = None,
+        borough: Optional[str] = None,
+        progress: Optional[ProgressReporter] = None
+    ) -> List[EventRecord]:
         """
         Get events by category.
         
@@ -180,24 +367,34 @@ class EventsService:
             start_date: Optional start date filter
             end_date: Optional end date filter
             limit: Maximum number of results
+            neighborhood: Optional neighborhood filter
+            borough: Optional borough filter
+            progress: Stream result batches as progress notifications (optional)
             
         Returns:
-            List of event dictionaries
+            List of EventRecord objects
         """
         return await self.search_events(
             category=category,
             start_date=start_date,
             end_date=end_date,
-            limit=limit
+            limit=limit,
+            neighborhood=neighborhood,
+            borough=borough,
+            progress=progress
         )
     
+    @traced("events_service.get_events_by_date_range")
     async def get_events_by_date_range(
         self,
         start_date: str,
         end_date: str,
         category: Optional[str] = None,
-        limit: int = 50
-    ) -> List[Dict[str, Any]]:
+        limit: int = 50,
+        neighborhood: Optional[str] = None,
+        borough: Optional[str] = None,
+        progress: Optional[ProgressReporter] = None
+    ) -> List[EventRecord]:
         """
         Get events within a date range.
         
@@ -206,17 +403,115 @@ class EventsService:
             end_date: End date in YYYY-MM-DD format
             category: Optional category filter
             limit: Maximum number of results
+            neighborhood: Optional neighborhood filter
+            borough: Optional borough filter
+            progress: Stream result batches as progress notifications (optional)
             
         Returns:
-            List of event dictionaries
+            List of EventRecord objects
         """
         return await self.search_events(
             start_date=start_date,
             end_date=end_date,
             category=category,
-            limit=limit
+            limit=limit,
+            neighborhood=neighborhood,
+            borough=borough,
+            progress=progress
+        )
+    
+    @traced("events_service.get_event_changes")
+    async def get_event_changes(
+        self,
+        changed_since: str,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 20,
+        neighborhood: Optional[str] = None,
+        borough: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Events added, modified or cancelled after a change cursor, for clients that poll.
+        
+        Changed events come in the order they changed, ``limit`` at a time, via the
+        updated_at index. Cancellations are tombstones filtered by category and date only.
+        
+        Args:
+            changed_since: ISO timestamp, or next_changed_since from a previous call
+            query: Search query for title, description, or venue
+            category: Category filter
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            limit: Maximum number of changed events to return
+            neighborhood: Neighborhood filter
+            borough: Borough filter
+            
+        Returns:
+            Dictionary with events, cancelled (event_id, category, date, cancelled_at),
+            next_changed_since to pass on the next poll, complete (False when more
+            changed events remain past ``limit``) and cancelled_complete (False when
+            changed_since predates the tombstone retention). Raises ValueError for an
+            invalid changed_since.
+        """
+        from ..ingest import TOMBSTONE_RETENTION_DAYS
+        
+        since, _ = parse_change_cursor(changed_since)
+        where = ["deleted_at > ?"]
+        params: List[Any] = [since]
+        if category:
+            where.append("category = ?")
+            params.append(category.lower())
+        if start_date:
+            where.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            where.append("date <= ?")
+            params.append(end_date)
+        sql = (
+            f"SELECT event_id, category, date, deleted_at FROM event_tombstones "
+            f"WHERE {' AND '.join(where)} ORDER BY deleted_at, event_id"
         )
+        
+        def read_tombstones(conn: sqlite3.Connection) -> Tuple[Optional[str], List[tuple]]:
+            # Newest stamp first: anything committed after it is returned again
+            # on the next poll rather than skipped
+            latest = self._latest_change(conn)
+            # All or nothing: a cut-short list would let the cursor skip cancellations
+            return latest, conn.execute(sql, params).fetchall()
+        
+        latest, tombstones = await run_query(self.db_path, read_tombstones)
+        cancelled = [
+            {"event_id": event_id, "category": event_category, "date": event_date, "cancelled_at": deleted_at}
+            for event_id, event_category, event_date, deleted_at in tombstones
+        ]
+        
+        events = await self._query_events(EventQuery(
+            event_filters(query, category, start_date, end_date, neighborhood, borough, changed_since),
+            limit=limit,
+            order="changed"
+        ))
+        
+        complete = len(events) < limit
+        if complete:
+            next_changed_since = max(latest or since, since)
+        else:
+            # Resume right after the last event of this page
+            next_changed_since = f"{events[-1].updated_at}{CURSOR_SEPARATOR}{events[-1].event_id}"
+        
+        retention = timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        retained_from = (datetime.now(timezone.utc) - retention).isoformat(timespec="microseconds")
+        logger.info(f"Found {len(events)} changed and {len(cancelled)} cancelled events since {since}")
+        return {
+            "events": events,
+            "cancelled": cancelled,
+            "next_changed_since": next_changed_since,
+            "complete": complete,
+            "cancelled_complete": since >= retained_from,
+        }
     
+    @traced("events_service.find_events_near_location")
     async def find_events_near_location(
         self,
         latitude: float,
@@ -225,8 +520,11 @@ class EventsService:
         category: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 20
-    ) -> List[Dict[str, Any]]:
+        limit: int = 20,
+        max_travel_minutes: Optional[int] = None,
+        sort: str = "distance",
+        progress: Optional[ProgressReporter] = None
+    ) -> List[EventRecord]:
         """
         Find events near a specific location using proximity search.
         
@@ -238,60 +536,676 @@ class EventsService:
             start_date: Optional start date filter
             end_date: Optional end date filter
             limit: Maximum number of results
+            max_travel_minutes: Keep venues within this estimated travel time
+                instead of within radius_km (optional)
+            sort: "distance" or "travel" (estimated travel minutes)
+            progress: Stream result batches as progress notifications (optional)
+            
+        Returns:
+            List of EventRecord objects with distance_km set (and travel_minutes
+            when filtering or sorting by travel time), nearest first
+        """
+        if max_travel_minutes is not None or sort == "travel":
+            return await self._find_events_by_travel(
+                (await self._get_commute_matrix()).from_point(latitude, longitude),
+                latitude, longitude, radius_km, max_travel_minutes,
+                event_filters(category=category, start_date=start_date, end_date=end_date), limit, sort, progress
+            )
+        
+        # Venues first: a bounding-box scan over the venue index, then exact distances
+        venues = await self.find_venues_near_location(latitude, longitude, radius_km)
+        if not venues:
+            logger.info(f"Found 0 events within {radius_km}km of location")
+            return []
+        if progress is not None:
+            await progress.report(0, limit, f"Searching events at {len(venues)} venue(s) within {radius_km}km")
+        
+        # Join the in-radius venues to their events; the nearest venues come first
+        near = json.dumps([[venue.venue_id, venue.distance_km] for venue in venues])
+        filters = event_filters(category=category, start_date=start_date, end_date=end_date)
+        results = await self._stream_events(EventQuery(filters, limit=limit, near=near), progress)
+        
+        logger.info(f"Found {len(results)} events within {radius_km}km of location")
+        return results
+    
+    async def _get_commute_matrix(self):
+        """
+        Return the commute-time matrix, loading or building it on first use.
+        
+        Like the semantic index, it is only re-validated after the database
+        file is modified, and loads off the event loop.
+        """
+        from .commute import load_or_build
+        
+        mtime = os.path.getmtime(self.db_path)
+        if self._commute_matrix is None or mtime != self._commute_db_mtime:
+            async with self._load_lock:
+                if self._commute_matrix is None or mtime != self._commute_db_mtime:
+                    self._commute_matrix = await asyncio.to_thread(load_or_build, self.db_path, self._commute_matrix)
+                    self._commute_db_mtime = mtime
+        return self._commute_matrix
+    
+    async def _find_events_by_travel(
+        self,
+        minutes: Sequence[int],
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        max_travel_minutes: Optional[int],
+        filters: All,
+        limit: int,
+        sort: str,
+        progress: Optional[ProgressReporter] = None
+    ) -> List[EventRecord]:
+        """
+        Events at the venues selected by a row of travel minutes (aligned with the matrix venues).
+        """
+        from .commute import haversine_km
+        
+        matrix = await self._get_commute_matrix()
+        distances = haversine_km(latitude, longitude, matrix.latitudes, matrix.longitudes)
+        if max_travel_minutes is not None:
+            selected = (minutes <= max_travel_minutes).nonzero()[0]
+        else:
+            selected = (distances <= radius_km).nonzero()[0]
+        if len(selected) == 0:
+            return []
+        if progress is not None:
+            await progress.report(0, limit, f"Searching events at {len(selected)} venue(s) by travel time")
+        
+        near = json.dumps([
+            [int(matrix.venue_ids[i]), float(distances[i]), int(minutes[i])] for i in selected
+        ])
+        results = await self._stream_events(EventQuery(filters, limit=limit, near=near, near_order=sort), progress)
+        logger.info(f"Found {len(results)} events across {len(selected)} venue(s) by travel time")
+        return results
+    
+    async def travel_minutes_between_venues(self, from_venue_id: int, to_venue_id: int) -> Optional[int]:
+        """
+        Estimated travel minutes between two venues (a matrix lookup).
+        
+        Returns:
+            Minutes, or None if either venue is unknown
+        """
+        return (await self._get_commute_matrix()).between(from_venue_id, to_venue_id)
+    
+    @traced("events_service.find_events_near_venue")
+    async def find_events_near_venue(
+        self,
+        venue_id: int,
+        max_travel_minutes: int,
+        category: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 20
+    ) -> List[EventRecord]:
+        """
+        Find events within an estimated travel time of a venue, quickest first.
+        
+        Args:
+            venue_id: Venue to travel from
+            max_travel_minutes: Maximum estimated travel time
+            category: Optional category filter
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of results
+            
+        Returns:
+            List of EventRecord objects with distance_km and travel_minutes set
+        """
+        matrix = await self._get_commute_matrix()
+        row = matrix.row_of(venue_id)
+        if row is None:
+            raise ValueError(f"Unknown venue: {venue_id}")
+        return await self._find_events_by_travel(
+            matrix.minutes[row], float(matrix.latitudes[row]), float(matrix.longitudes[row]), 0.0,
+            max_travel_minutes, event_filters(category=category, start_date=start_date, end_date=end_date),
+            limit, "travel"
+        )
+    
+    @traced("events_service.find_events_along_route")
+    async def find_events_along_route(
+        self,
+        waypoints: Sequence[Tuple[float, float]],
+        corridor_km: float = 0.5,
+        category: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 20
+    ) -> List[EventRecord]:
+        """
+        Find events within a corridor around a route, cheapest detour first.
+        
+        Args:
+            waypoints: (latitude, longitude) stops in travel order, at least two
+            corridor_km: Maximum distance of a venue from the route
+            category: Optional category filter
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of results
+            
+        Returns:
+            List of EventRecord objects with distance_km (from the route) and
+            detour_km set, ordered by detour
+        """
+        from .route import corridor_boxes, route_distances
+        
+        if len(waypoints) < 2:
+            raise ValueError("A route needs at least two waypoints")
+        
+        # Candidates: venues in any of the corridor's boxes, via the location index
+        boxes = corridor_boxes(waypoints, corridor_km)
+        candidates = await self._query_venues(
+            f"SELECT {VENUE_SELECT} FROM venues WHERE "
+            + " OR ".join("(latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?)" for _ in boxes),
+            [value for box in boxes for value in box]
+        )
+        if not candidates:
+            return []
+        
+        distances, detours = route_distances(
+            waypoints, [venue.latitude for venue in candidates], [venue.longitude for venue in candidates]
+        )
+        near = json.dumps([
+            [venue.venue_id, float(distance), None, float(detour)]
+            for venue, distance, detour in zip(candidates, distances, detours)
+            if distance <= corridor_km
+        ])
+        filters = event_filters(category=category, start_date=start_date, end_date=end_date)
+        results = await self._query_events(EventQuery(filters, limit=limit, near=near, near_order="detour"))
+        
+        logger.info(f"Found {len(results)} events within {corridor_km}km of a {len(waypoints)}-stop route")
+        return results
+    
+    @traced("events_service.find_venues_near_location")
+    async def find_venues_near_location(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float = 2.0
+    ) -> List[VenueRecord]:
+        """
+        Find venues within a radius, using the venue location index.
+        
+        Args:
+            latitude: Latitude of the reference location
+            longitude: Longitude of the reference location
+            radius_km: Search radius in kilometers
+            
+        Returns:
+            List of VenueRecord objects with distance_km set, nearest first
+        """
+        lat_delta, lon_delta = self.bounding_box_deltas(latitude, radius_km)
+        
+        candidates = await self._query_venues(
+            f"SELECT {VENUE_SELECT} FROM venues WHERE latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?",
+            (latitude - lat_delta, latitude + lat_delta, longitude - lon_delta, longitude + lon_delta)
+        )
+        
+        venues = []
+        for venue in candidates:
+            distance = self.calculate_distance(latitude, longitude, venue.latitude, venue.longitude)
+            if distance <= radius_km:
+                venue.distance_km = distance
+                venues.append(venue)
+        
+        venues.sort(key=lambda venue: venue.distance_km)
+        return venues
+    
+    async def _get_gazetteer(self):
+        """
+        Return the place-name gazetteer, rebuilding it after the database file is modified.
+        
+        Like the semantic index, it builds off the event loop.
+        """
+        from .gazetteer import Gazetteer
+        
+        mtime = os.path.getmtime(self.db_path)
+        if self._gazetteer is None or mtime != self._gazetteer_db_mtime:
+            async with self._load_lock:
+                if self._gazetteer is None or mtime != self._gazetteer_db_mtime:
+                    self._gazetteer = await asyncio.to_thread(Gazetteer.from_database, self.db_path)
+                    self._gazetteer_db_mtime = mtime
+        return self._gazetteer
+    
+    async def resolve_place(self, place: str):
+        """
+        Resolve a venue, landmark, neighborhood or borough name to coordinates, offline.
+        
+        Args:
+            place: Place name, e.g. "Bowery Ballroom" or "Grand Central"
+            
+        Returns:
+            The matching Place; raises ValueError (with suggestions) when nothing matches
+        """
+        gazetteer = await self._get_gazetteer()
+        resolved = gazetteer.resolve(place)
+        if resolved is None:
+            suggestions = ", ".join(p.name for p in gazetteer.suggest(place, limit=3))
+            hint = f" Did you mean: {suggestions}?" if suggestions else " Pass latitude and longitude instead."
+            raise ValueError(f"Unknown place: {place!r}.{hint}")
+        return resolved
+    
+    @traced("events_service.get_venue")
+    async def get_venue(self, venue_id: int) -> Optional[VenueRecord]:
+        """
+        Get a venue by ID.
+        
+        Args:
+            venue_id: The venue identifier
+            
+        Returns:
+            VenueRecord or None if not found
+        """
+        venues = await self._query_venues(f"SELECT {VENUE_SELECT} FROM venues WHERE venue_id = ?", (venue_id,))
+        return venues[0] if venues else None
+    
+    @traced("events_service.find_venues_by_name")
+    async def find_venues_by_name(self, name: str, limit: int = 10) -> List[VenueRecord]:
+        """
+        Find venues by name: exact (case-insensitive) matches first, then substring matches.
+        
+        Args:
+            name: Venue name or part of it
+            limit: Maximum number of venues
+            
+        Returns:
+            List of VenueRecord objects
+        """
+        venues = await self._query_venues(f"SELECT {VENUE_SELECT} FROM venues WHERE name = ? LIMIT ?", (name, limit))
+        if not venues:
+            venues = await self._query_venues(
+                f"SELECT {VENUE_SELECT} FROM venues WHERE name LIKE ? ORDER BY name LIMIT ?",
+                (f"%{name}%", limit)
+            )
+        return venues
+    
+    @traced("events_service.get_events_at_venue")
+    async def get_events_at_venue(
+        self,
+        venue_id: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 20
+    ) -> List[EventRecord]:
+        """
+        Get events at a venue, using the (venue_id, date) index.
+        
+        Args:
+            venue_id: The venue identifier
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of results
             
         Returns:
-            List of event dictionaries with distance information, sorted by distance
+            List of EventRecord objects in chronological order
+        """
+        return await self._query_events(
+            EventQuery(All(Venue(venue_id), event_filters(start_date=start_date, end_date=end_date)), limit=limit)
+        )
+    
+    async def _get_semantic_index(self):
+        """
+        Return the semantic index, loading it on first use and applying event changes.
+        
+        The index is only re-validated after the database file is modified,
+        so repeated searches skip the staleness check. Loads and rebuilds run
+        in a worker thread so other requests keep being served; until one
+        finishes, searches already holding the previous index keep using it.
         """
-        # First get all potentially matching events
-        events = await self.search_events(
+        # NumPy and the index load only when semantic search is first used
+        from .semantic import load_or_build
+        
+        mtime = os.path.getmtime(self.db_path)
+        if self._semantic_index is None or mtime != self._semantic_db_mtime:
+            # Concurrent callers wait for a single load
+            async with self._load_lock:
+                if self._semantic_index is None or mtime != self._semantic_db_mtime:
+                    self._semantic_index = await asyncio.to_thread(load_or_build, self.db_path, self._semantic_index)
+                    self._semantic_db_mtime = mtime
+        return self._semantic_index
+    
+    @traced("events_service.semantic_search_events")
+    async def semantic_search_events(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        min_score: float = SEMANTIC_MIN_SCORE
+    ) -> List[EventRecord]:
+        """
+        Rank events by meaning rather than exact substrings, using the offline vector index.
+        
+        Args:
+            query: Free-text description of what to look for (e.g. "live jazz")
+            category: Optional category filter
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of results
+            min_score: Minimum cosine similarity for a result
+            
+        Returns:
+            List of EventRecord objects with score set, most relevant first
+        """
+        matches = (await self._get_semantic_index()).search(
+            query,
+            limit=limit,
             category=category,
             start_date=start_date,
             end_date=end_date,
-            limit=1000  # Get more to filter by distance
+            min_score=min_score
         )
+        if not matches:
+            logger.info("Found 0 semantically similar events")
+            return []
         
-        # Calculate distances and filter
-        events_with_distance = []
+        scores = dict(matches)
+        events = await self._query_events(EventQuery(EventIds(list(scores))))
         for event in events:
-            distance = self.calculate_distance(
-                latitude, longitude,
-                event["latitude"], event["longitude"]
-            )
+            event.score = scores[event.event_id]
+        events.sort(key=lambda event: -event.score)
+        
+        logger.info(f"Found {len(events)} semantically similar events")
+        return events
+    
+    @staticmethod
+    async def _get_prefs_store():
+        """
+        Return the shared PrefsStore, opening it off the event loop.
+        
+        The first call migrates the preferences database and may import
+        prefs.json; like every PrefsStore call made here, it runs in a worker thread.
+        """
+        from .user_prefs import get_prefs_store
+        
+        return await asyncio.to_thread(get_prefs_store)
+    
+    async def get_user_prefs(self, user_id: str):
+        """
+        Look up a user's stored preferences.
+        
+        Args:
+            user_id: User identifier in the preferences store
             
-            if distance <= radius_km:
-                event["distance_km"] = round(distance, 2)
-                event["distance_miles"] = round(distance * 0.621371, 2)
-                events_with_distance.append(event)
+        Returns:
+            UserPrefs for the user (ValueError if the user is unknown)
+        """
+        store = await self._get_prefs_store()
+        prefs = await asyncio.to_thread(store.get, user_id)
+        if prefs is None:
+            raise ValueError(f"Unknown user: {user_id}")
+        return prefs
+    
+    async def get_user_profile(self, user_id: str):
+        """
+        Resolve the ranking profile of a user.
         
-        # Sort by distance
-        events_with_distance.sort(key=lambda x: x["distance_km"])
+        Args:
+            user_id: User identifier in the preferences store
+            
+        Returns:
+            UserProfile for the user
+        """
+        from .ranking import UserProfile
         
-        # Return limited results
-        results = events_with_distance[:limit]
-        logger.info(f"Found {len(results)} events within {radius_km}km of location")
-        return results
+        return UserProfile.from_user_prefs(await self.get_user_prefs(user_id))
     
-    async def get_event_by_id(self, event_id: str) -> Optional[Dict[str, Any]]:
+    @traced("events_service.rank_for_user")
+    async def rank_for_user(self, events: List[EventRecord], user_id: str, limit: int) -> List[EventRecord]:
         """
-        Get a specific event by ID.
+        Rank candidate events by a user's interests, diet and home location.
+        
+        Preference scores are cached per (user, prefs version) and extended
+        incrementally as events change.
         
         Args:
-            event_id: The unique event identifier
+            events: Candidate events (e.g. RANK_CANDIDATES results of a list query)
+            user_id: User whose preferences drive the ranking
+            limit: Number of events to return
+            
+        Returns:
+            The top ``limit`` events with score set, best first
+        """
+        from .ranking import PersonalRanker
+        
+        profile = await self.get_user_profile(user_id)
+        if self._ranker is None:
+            self._ranker = PersonalRanker()
+        index = await self._get_semantic_index()
+        ranked = self._ranker.rank(index, profile, events, limit)
+        logger.info(f"Ranked {len(events)} candidate(s) for user {user_id}")
+        return ranked
+    
+    @traced("events_service.recommend_for_user")
+    async def recommend_for_user(
+        self,
+        user_id: str,
+        date: str,
+        locations: Optional[Sequence[Tuple[float, float]]] = None,
+        limit: int = RECOMMENDATIONS_PER_DAY,
+        cache: bool = True
+    ) -> List[EventRecord]:
+        """
+        Compute a user's recommended events for one day.
+        
+        Events are scored by interest match and diet, get a proximity bonus
+        from the nearest of the user's home and the day's scheduled locations,
+        and are picked with a per-category penalty so one category does not
+        fill the list.
+        
+        Args:
+            user_id: User identifier in the preferences store
+            date: Day in YYYY-MM-DD format
+            locations: (latitude, longitude) of the day's scheduled appointments (optional)
+            limit: Number of events to return
+            cache: Keep the user's index-wide preference scores for later calls
+                (the nightly batch passes False and scores only the day's candidates)
+            
+        Returns:
+            Recommended events with score set, best first
+        """
+        from .ranking import DIVERSITY_PENALTY, PersonalRanker, UserProfile
+        
+        profile = UserProfile.from_user_prefs(await self.get_user_prefs(user_id))
+        anchors = [(profile.home_latitude, profile.home_longitude)] if profile.has_home else []
+        anchors.extend(locations or [])
+        
+        candidates = await self._query_events(EventQuery(event_filters(start_date=date, end_date=date), limit=RANK_CANDIDATES))
+        index = await self._get_semantic_index()
+        if self._ranker is None:
+            self._ranker = PersonalRanker()
+        return self._ranker.rank(
+            index, profile, candidates, limit,
+            anchors=anchors, diversity=DIVERSITY_PENALTY, cache=cache
+        )
+    
+    @traced("events_service.get_my_recommendations")
+    async def get_my_recommendations(self, user_id: str, date: str) -> List[EventRecord]:
+        """
+        Return a user's recommendations for a day, as precomputed by the nightly batch.
+        
+        A day the batch has not covered (or covered before the user's
+        preferences changed) is computed on demand and stored.
+        
+        Args:
+            user_id: User identifier in the preferences store
+            date: Day in YYYY-MM-DD format
+            
+        Returns:
+            Recommended events with score set, best first
+        """
+        store = await self._get_prefs_store()
+        prefs = await self.get_user_prefs(user_id)
+        stored = await asyncio.to_thread(store.get_recommendations, user_id, date)
+        if stored is not None and stored["prefs_version"] == prefs.version:
+            return [EventRecord.from_dict(event) for event in stored["events"]]
+        
+        logger.info(f"No precomputed recommendations for {user_id} on {date}; computing")
+        events = await self.recommend_for_user(user_id, date)
+        await asyncio.to_thread(
+            store.put_recommendations, user_id, date, prefs.version, [event.to_dict() for event in events]
+        )
+        return events
+    
+    async def save_search(self, user_id: str, name: str, **predicates: Any) -> Dict[str, Any]:
+        """
+        Save a standing search for a user; events added or changed later that match it are recorded at ingest.
+        
+        Args:
+            user_id: User identifier in the preferences store
+            name: Label for the search
+            **predicates: query, category, neighborhood, borough, latitude, longitude and radius_km
+                (a point without a radius gets DEFAULT_SEARCH_RADIUS_KM)
+            
+        Returns:
+            The stored search with search_id and uri; raises ValueError for an unknown
+            user or a search without any predicate
+        """
+        from .saved_searches import SEARCH_PREDICATES, search_uri
+        
+        await self.get_user_prefs(user_id)
+        unknown = set(predicates) - set(SEARCH_PREDICATES)
+        if unknown:
+            raise ValueError(f"Unknown saved search fields: {', '.join(sorted(unknown))}")
+        search = {field: predicates.get(field) for field in SEARCH_PREDICATES}
+        if (search["latitude"] is None) != (search["longitude"] is None):
+            raise ValueError("A saved search location needs both latitude and longitude")
+        if search["latitude"] is not None and search["radius_km"] is None:
+            search["radius_km"] = DEFAULT_SEARCH_RADIUS_KM
+        if search["category"]:
+            search["category"] = search["category"].lower()
+        if all(search[field] in (None, "") for field in ("query", "category", "neighborhood", "borough", "latitude")):
+            raise ValueError("A saved search needs a query, category, neighborhood, borough or location")
+        
+        store = await self._get_prefs_store()
+        stored = await asyncio.to_thread(store.add_saved_search, {**search, "user_id": user_id, "name": name})
+        stored["uri"] = search_uri(user_id, stored["search_id"])
+        logger.info(f"Saved search {stored['search_id']} for {user_id}: {name}")
+        return stored
+    
+    async def get_saved_searches(self, user_id: str) -> List[Dict[str, Any]]:
+        """
+        List a user's saved searches.
+        
+        Args:
+            user_id: User identifier in the preferences store
+            
+        Returns:
+            Stored searches, oldest first, each with its resource uri
+        """
+        from .saved_searches import search_uri
+        
+        await self.get_user_prefs(user_id)
+        store = await self._get_prefs_store()
+        return [
+            {**search, "uri": search_uri(user_id, search["search_id"])}
+            for search in await asyncio.to_thread(store.saved_searches, user_id)
+        ]
+    
+    async def delete_saved_search(self, user_id: str, search_id: int) -> bool:
+        """
+        Delete one of a user's saved searches.
+        
+        Returns:
+            True if the search existed
+        """
+        store = await self._get_prefs_store()
+        return await asyncio.to_thread(store.delete_saved_search, user_id, search_id)
+    
+    @traced("events_service.get_saved_search_matches")
+    async def get_saved_search_matches(self, user_id: str, search_id: int, limit: int = 20) -> List[EventRecord]:
+        """
+        Events matched to a saved search, most recently matched first.
+        
+        Args:
+            user_id: Owner of the search
+            search_id: Saved search id
+            limit: Maximum number of events
             
         Returns:
-            Event dictionary or None if not found
+            List of EventRecord objects (cancelled events are left out); raises
+            ValueError if the user has no such search
+        """
+        store = await self._get_prefs_store()
+        searches = await asyncio.to_thread(store.saved_searches, user_id)
+        if not any(search["search_id"] == search_id for search in searches):
+            raise ValueError(f"Unknown saved search {search_id} for user {user_id}")
+        order = [match["event_id"] for match in await asyncio.to_thread(store.search_matches, search_id, limit)]
+        if not order:
+            return []
+        rank = {event_id: i for i, event_id in enumerate(order)}
+        events = await self._query_events(EventQuery(EventIds(order)))
+        events.sort(key=lambda event: rank[event.event_id])
+        return events
+    
+    @traced("events_service.get_trending_events")
+    async def get_trending_events(
+        self,
+        category: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10
+    ) -> List[EventRecord]:
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        Events users have been looking at most, from the in-memory popularity sketch.
         
-        cursor.execute("SELECT * FROM events WHERE event_id = ?", (event_id,))
-        row = cursor.fetchone()
-        conn.close()
+        Args:
+            category: Optional category filter
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of results
+            
+        Returns:
+            List of EventRecord objects with score set to recent weighted views, most viewed first
+        """
+        from .popularity import get_popularity_tracker
+        
+        top = get_popularity_tracker().top(TRENDING_CANDIDATES)
+        if not top:
+            return []
         
-        if row:
-            return self._row_to_dict(row)
-        return None
+        scores = dict(top)
+        filters = All(EventIds(list(scores)), event_filters(category=category, start_date=start_date, end_date=end_date))
+        events = await self._query_events(EventQuery(filters))
+        for event in events:
+            event.score = scores[event.event_id]
+        events.sort(key=lambda event: -event.score)
+        return events[:limit]
     
+    def sort_by_trending(self, events: List[EventRecord]) -> List[EventRecord]:
+        """
+        Reorder events by recent views (most viewed first; ties keep their order).
+        
+        Args:
+            events: Events to reorder
+            
+        Returns:
+            New list with score set to each event's recent weighted views
+        """
+        from .popularity import get_popularity_tracker
+        
+        scores = get_popularity_tracker().scores(event.event_id for event in events)
+        for event in events:
+            event.score = scores[event.event_id]
+        return sorted(events, key=lambda event: -event.score)
+    
+    @traced("events_service.get_event_by_id")
+    async def get_event_by_id(self, event_id: str) -> Optional[EventRecord]:
+        """
+        Get a specific event by ID.
+        
+        Args:
+            event_id: The unique event identifier
+            
+        Returns:
+            EventRecord or None if not found
+        """
+        events = await self._query_events(EventQuery(EventId(event_id)))
+        return events[0] if events else None
+    
+    @traced("events_service.get_all_categories")
     async def get_all_categories(self) -> List[str]:
         """
         Get list of all available event categories.
@@ -299,51 +1213,270 @@ class EventsService:
         Returns:
             List of category names
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        rows = await run_query(
+            self.db_path, lambda conn: conn.execute("SELECT DISTINCT category FROM events ORDER BY category").fetchall()
+        )
+        return [row[0] for row in rows]
+    
+    @traced("events_service.get_areas")
+    async def get_areas(self, borough: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List the boroughs and neighborhoods that have venues, with event counts.
+        
+        Args:
+            borough: Only neighborhoods of this borough (optional)
+            
+        Returns:
+            List of dictionaries with borough, neighborhood, venues and events,
+            ordered by borough and neighborhood
+        """
+        # Events are counted per venue over the covering venue index first
+        sql = (
+            "SELECT v.borough, v.neighborhood, COUNT(*) AS venues, COALESCE(SUM(c.n), 0) AS events "
+            "FROM venues v LEFT JOIN (SELECT venue_id, COUNT(*) AS n FROM events GROUP BY venue_id) c "
+            "ON c.venue_id = v.venue_id "
+            "WHERE v.borough IS NOT NULL AND (? IS NULL OR v.borough = ? COLLATE NOCASE) "
+            "GROUP BY v.borough, v.neighborhood ORDER BY v.borough, v.neighborhood"
+        )
+        rows = await run_query(self.db_path, lambda conn: conn.execute(sql, (borough, borough)).fetchall())
+        return [
+            {"borough": area_borough, "neighborhood": neighborhood, "venues": venues, "events": events}
+            for area_borough, neighborhood, venues, events in rows
+        ]
+    
+    @traced("events_service.get_day_digest")
+    async def get_day_digest(self, start_date: str, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get precomputed per-day digests.
+        
+        Args:
+            start_date: Date in YYYY-MM-DD format
+            end_date: Optional last date (inclusive) for a multi-day digest
+            
+        Returns:
+            List of digest dictionaries, one per day that has events
+        """
+        def read_digests(conn: sqlite3.Connection) -> List[sqlite3.Row]:
+            conn.row_factory = sqlite3.Row
+            return conn.execute(
+                "SELECT * FROM day_digest WHERE date BETWEEN ? AND ? ORDER BY date",
+                (start_date, end_date or start_date)
+            ).fetchall()
+        
+        rows = await run_query(self.db_path, read_digests)
+        return [
+            {
+                "date": row["date"],
+                "total_events": row["total_events"],
+                "category_counts": json.loads(row["category_counts"]),
+                "top_venues": json.loads(row["top_venues"]),
+                "earliest_start": row["earliest_start"],
+                "latest_start": row["latest_start"],
+                "highlight_event_ids": json.loads(row["highlight_event_ids"]),
+            }
+            for row in rows
+        ]
+    
+    @staticmethod
+    def _listing_document(events: List[EventRecord], **fields: Any) -> Dict[str, Any]:
+        """
+        Build a versioned document for a published event listing.
+        
+        Events are ordered by start time and id, so equal content always
+        serializes the same way.
+        
+        Args:
+            events: The listing's events
+            **fields: Leading fields identifying the listing (part of its version)
+            
+        Returns:
+            Dictionary with the fields, version, count and events
+        """
+        from ..ingest import content_version
+        
+        events = sorted(events, key=lambda event: (event.date, event.start_time_local, event.event_id))
+        last_change = max((event.updated_at for event in events if event.updated_at), default=None)
+        return {
+            **fields,
+            "version": content_version(*fields.values(), len(events), last_change),
+            "count": len(events),
+            "events": [event.to_dict() for event in events],
+        }
+    
+    @traced("events_service.get_day_listing")
+    async def get_day_listing(self, date: str, category: Optional[str] = None) -> Dict[str, Any]:
+        """
+        All events of a day, optionally of one category, as a versioned document.
         
-        cursor.execute("SELECT DISTINCT category FROM events ORDER BY category")
-        rows = cursor.fetchall()
-        conn.close()
+        The version equals the one get_day_versions reports for the day, so a
+        client holding it can skip refetching.
         
-        categories = [row["category"] for row in rows]
-        return categories
+        Args:
+            date: Date in YYYY-MM-DD format
+            category: Optional category filter
+            
+        Returns:
+            Dictionary with date, category (when given), version, count and events
+        """
+        datetime.strptime(date, "%Y-%m-%d")
+        events = await self._query_events(EventQuery(event_filters(category=category, start_date=date, end_date=date)))
+        fields: Dict[str, Any] = {"date": date}
+        if category:
+            fields["category"] = category.lower()
+        return self._listing_document(events, **fields)
     
-    def format_event_summary(self, event: Dict[str, Any]) -> str:
+    @traced("events_service.get_day_versions")
+    async def get_day_versions(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Content versions of each day with events, read from the digest.
+        
+        Args:
+            start_date: Optional first date
+            end_date: Optional last date (inclusive)
+            
+        Returns:
+            List of dictionaries with date, total_events, version and category_versions, ordered by date
+        """
+        rows = await run_query(self.db_path, lambda conn: conn.execute(
+            "SELECT date, total_events, version, category_versions FROM day_digest "
+            "WHERE date BETWEEN ? AND ? ORDER BY date",
+            (start_date or "", end_date or "9999-12-31")
+        ).fetchall())
+        return [
+            {"date": day, "total_events": total, "version": version, "category_versions": json.loads(versions)}
+            for day, total, version, versions in rows
+        ]
+    
+    @traced("events_service.get_event_document")
+    async def get_event_document(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        One event as a versioned document.
+        
+        Args:
+            event_id: The unique event identifier
+            
+        Returns:
+            The event's fields plus version, or None if not found
+        """
+        from ..ingest import content_version
+        
+        event = await self.get_event_by_id(event_id)
+        if event is None:
+            return None
+        return {**event.to_dict(), "version": content_version(event.event_id, event.updated_at)}
+    
+    @traced("events_service.get_venue_listing")
+    async def get_venue_listing(self, venue_id: int) -> Optional[Dict[str, Any]]:
+        """
+        A venue and all of its events as a versioned document.
+        
+        Args:
+            venue_id: The venue identifier
+            
+        Returns:
+            Dictionary with venue, version, count and events, or None if not found
+        """
+        venue = await self.get_venue(venue_id)
+        if venue is None:
+            return None
+        events = await self._query_events(EventQuery(Venue(venue_id)))
+        return self._listing_document(events, venue=venue.to_dict())
+    
+    def format_event_summary(self, event: EventRecord) -> str:
         """
         Format an event as a human-readable summary.
         
         Args:
-            event: Event dictionary
+            event: EventRecord to format
             
         Returns:
             Formatted string representation
         """
         lines = [
-            f"📅 {event['title']}",
-            f"   Category: {event['category'].title()}",
-            f"   Date: {event['date']}",
-            f"   Time: {event['start_time_local'].split('T')[1]} - {event['end_time_local'].split('T')[1]}",
-            f"   Venue: {event['venue_name']}",
-            f"   Location: ({event['latitude']}, {event['longitude']})"
+            f"📅 {event.title}",
+            f"   Category: {event.category.title()}",
+            f"   Date: {event.date}",
+            f"   Time: {event.start_time_local.split('T')[1]} - {event.end_time_local.split('T')[1]}",
+            f"   Venue: {event.venue_name}",
+            f"   Location: ({event.latitude}, {event.longitude})"
         ]
         
-        if "distance_km" in event:
-            lines.append(f"   Distance: {event['distance_km']} km ({event['distance_miles']} miles)")
+        area = ", ".join(part for part in (event.neighborhood, event.borough) if part)
+        if area:
+            lines.append(f"   Area: {area}")
+        
+        if event.distance_km is not None:
+            lines.append(
+                f"   Distance: {round(event.distance_km, 2)} km ({round(event.distance_miles, 2)} miles)"
+            )
+        
+        if event.travel_minutes is not None:
+            lines.append(f"   Travel: ~{event.travel_minutes} min")
         
-        if event.get("description"):
-            lines.append(f"   Description: {event['description']}")
+        if event.detour_km is not None:
+            lines.append(f"   Detour: +{round(event.detour_km, 2)} km")
         
-        lines.append(f"   Event ID: {event['event_id']}")
+        if event.score is not None:
+            lines.append(f"   Relevance: {round(event.score, 2)}")
+        
+        if event.description:
+            lines.append(f"   Description: {event.description}")
+        
+        lines.append(f"   Event ID: {event.event_id}")
         
         return "\n".join(lines)
     
-    def format_events_list(self, events: List[Dict[str, Any]]) -> str:
+    @traced("events_service.format_day_digest")
+    def format_day_digest(self, digests: List[Dict[str, Any]]) -> str:
+        """
+        Format day digests as a compact human-readable summary.
+        
+        Args:
+            digests: List of digest dictionaries
+            
+        Returns:
+            Formatted string representation
+        """
+        if not digests:
+            return "No events found."
+        
+        lines = []
+        for digest in digests:
+            counts = ", ".join(f"{cat} {n}" for cat, n in digest["category_counts"].items())
+            venues = ", ".join(f"{name} ({n})" for name, n in digest["top_venues"])
+            lines.append(f"📅 {digest['date']}: {digest['total_events']} event(s) — {counts}")
+            lines.append(
+                f"   Starts: {digest['earliest_start'].split('T')[1]} to {digest['latest_start'].split('T')[1]}"
+            )
+            lines.append(f"   Top venues: {venues}")
+            lines.append(f"   Highlights (event IDs): {', '.join(digest['highlight_event_ids'])}")
+        
+        return "\n".join(lines)
+    
+    @traced("events_service.format_facets")
+    def format_facets(self, facets: Dict[str, Any]) -> str:
+        """
+        Format facet counts as a compact human-readable block.
+        
+        Args:
+            facets: Facet dictionary from get_search_facets
+            
+        Returns:
+            Formatted string representation
+        """
+        lines = [f"Facets ({facets['total']} total match(es)):"]
+        for name in ("category", "date", "venue"):
+            counts = ", ".join(f"{key} ({n})" for key, n in facets[name].items())
+            lines.append(f"   By {name}: {counts or 'none'}")
+        return "\n".join(lines)
+    
+    @traced("events_service.format_events_list")
+    def format_events_list(self, events: List[EventRecord]) -> str:
         """
         Format a list of events as a human-readable summary.
         
         Args:
-            events: List of event dictionaries
+            events: List of EventRecord objects
             
         Returns:
             Formatted string representation
@@ -357,4 +1490,79 @@ class EventsService:
             lines.append(f"\n{i}. {self.format_event_summary(event)}")
         
         return "\n".join(lines)
+    
+    def format_event_batch(self, events: List[EventRecord], start: int) -> str:
+        """
+        Format a batch of streamed results, numbered as in format_events_list.
+        
+        Args:
+            events: Consecutive events of a result list
+            start: Position of the first one (1-based)
+            
+        Returns:
+            Formatted string representation
+        """
+        return "\n\n".join(
+            f"{i}. {self.format_event_summary(event)}" for i, event in enumerate(events, start)
+        )
+    
+    @traced("events_service.format_event_changes")
+    def format_event_changes(self, changes: Dict[str, Any], changed_since: str) -> str:
+        """
+        Format a get_event_changes() result for a polling client.
+        
+        Args:
+            changes: Result of get_event_changes()
+            changed_since: The cursor the changes were requested with
+            
+        Returns:
+            Formatted string ending with the cursor for the next poll
+        """
+        events = changes["events"]
+        cancelled = changes["cancelled"]
+        if not events and not cancelled:
+            lines = [f"No changes since {changed_since}."]
+        else:
+            lines = []
+            if events:
+                lines.append(f"{len(events)} new or updated event(s) since {changed_since}:\n")
+                for i, event in enumerate(events, 1):
+                    lines.append(f"\n{i}. {self.format_event_summary(event)}")
+            if cancelled:
+                if lines:
+                    lines.append("")
+                lines.append(f"{len(cancelled)} cancelled event(s):")
+                for tombstone in cancelled:
+                    lines.append(
+                        f"- {tombstone['event_id']} ({tombstone['category']}, {tombstone['date']}), "
+                        f"cancelled at {tombstone['cancelled_at']}"
+                    )
+        
+        if not changes["cancelled_complete"]:
+            lines.append("\nCancellations older than the tombstone retention are not listed; "
+                         "refresh the full list once instead.")
+        lines.append("")
+        if changes["complete"]:
+            lines.append(f"next_changed_since: {changes['next_changed_since']}")
+        else:
+            lines.append(
+                f"More changes remain; call again with changed_since: {changes['next_changed_since']}"
+            )
+        return "\n".join(lines)
+
+
+# Shared instance used by the tool handlers; created on first use
+_shared_service: Optional[EventsService] = None
+
 
+def get_events_service() -> EventsService:
+    """
+    Return the process-wide EventsService, creating it on first call.
+
+    Returns:
+        The shared EventsService instance
+    """
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = EventsService()
+    return _shared_service
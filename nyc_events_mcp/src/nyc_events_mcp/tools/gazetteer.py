@@ -0,0 +1,316 @@
+"""
+Offline gazetteer: resolve place names to coordinates without a geocoding service.
+
+Places come from three sources, in priority order for identical names:
+venues in the events database, the bundled landmark list
+(``data/nyc_landmarks.json``) and neighborhoods and boroughs (centered on
+their venues).
+
+Names are normalized (case, accents, punctuation, a leading "the") and
+looked up in three steps:
+    1. exact name or alias (dict lookup)
+    2. prefix of a name, via binary search over the sorted keys
+       ("bowery" -> "Bowery Ballroom"); the shortest match wins
+    3. trigram similarity for typos and partial names ("chelsee market"),
+       scoring only keys that share a trigram with the query
+
+Results, including misses, are kept in a bounded LRU so repeated lookups
+are a single dict hit.
+
+Usage:
+    python -m nyc_events_mcp.tools.gazetteer "bowery ballroom" [--db events.sqlite]
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Resolved names kept in the LRU cache
+PLACE_CACHE_SIZE = 4096
+
+# Minimum trigram similarity (Jaccard) for a fuzzy match
+MIN_SIMILARITY = 0.4
+
+VENUE = "venue"
+LANDMARK = "landmark"
+NEIGHBORHOOD = "neighborhood"
+BOROUGH = "borough"
+
+# Lower wins when two places share a normalized name
+_KIND_PRIORITY = {VENUE: 0, LANDMARK: 1, NEIGHBORHOOD: 2, BOROUGH: 3}
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def default_landmarks_path() -> str:
+    """Return the bundled landmark list path."""
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "nyc_landmarks.json")
+
+
+def normalize(name: str) -> str:
+    """
+    Normalize a place name for lookup.
+
+    Args:
+        name: Place name as written
+
+    Returns:
+        Lowercase ASCII words separated by single spaces, without a leading "the"
+    """
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    text = _NON_WORD.sub(" ", text.replace("&", " and ").replace("'", "")).strip()
+    if text.startswith("the "):
+        text = text[4:]
+    return text
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class Place:
+    """
+    A resolved place.
+    """
+
+    __slots__ = ("name", "kind", "latitude", "longitude", "venue_id")
+
+    def __init__(self, name: str, kind: str, latitude: float, longitude: float, venue_id: Optional[int] = None):
+        self.name = name
+        self.kind = kind
+        self.latitude = latitude
+        self.longitude = longitude
+        self.venue_id = venue_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dictionary.
+
+        Returns:
+            Dictionary with name, kind, coordinates and venue_id (venues only)
+        """
+        result = {"name": self.name, "kind": self.kind, "latitude": self.latitude, "longitude": self.longitude}
+        if self.venue_id is not None:
+            result["venue_id"] = self.venue_id
+        return result
+
+    def __repr__(self) -> str:
+        return f"Place({self.name!r}, {self.kind!r})"
+
+
+def load_landmarks(path: Optional[str] = None) -> List[Tuple[Place, List[str]]]:
+    """
+    Read the landmark list.
+
+    Args:
+        path: JSON file of {"name", "latitude", "longitude", "aliases"?} objects
+            (default: the bundled list)
+
+    Returns:
+        List of (place, aliases)
+    """
+    with open(path or default_landmarks_path(), encoding="utf-8") as f:
+        entries = json.load(f)
+    return [
+        (Place(entry["name"], LANDMARK, entry["latitude"], entry["longitude"]), entry.get("aliases", []))
+        for entry in entries
+    ]
+
+
+def load_database_places(db_path: str) -> List[Place]:
+    """
+    Read venues and neighborhood and borough centers from an events database.
+
+    Args:
+        db_path: Events database path
+
+    Returns:
+        Venue places followed by neighborhood and borough places
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        places = [
+            Place(name, VENUE, latitude, longitude, venue_id)
+            for venue_id, name, latitude, longitude in conn.execute(
+                "SELECT venue_id, name, latitude, longitude FROM venues ORDER BY venue_id"
+            )
+        ]
+        for kind, column in ((NEIGHBORHOOD, "neighborhood"), (BOROUGH, "borough")):
+            places.extend(
+                Place(name, kind, round(latitude, 5), round(longitude, 5))
+                for name, latitude, longitude in conn.execute(
+                    f"SELECT {column}, AVG(latitude), AVG(longitude) FROM venues "
+                    f"WHERE {column} IS NOT NULL GROUP BY {column}"
+                )
+            )
+    finally:
+        conn.close()
+    return places
+
+
+class Gazetteer:
+    """
+    Name index over places with exact, prefix and trigram lookup.
+    """
+
+    def __init__(self, places: List[Tuple[Place, List[str]]], cache_size: int = PLACE_CACHE_SIZE):
+        """
+        Args:
+            places: (place, aliases) pairs
+            cache_size: Resolved names kept in the LRU cache
+        """
+        self.places: List[Place] = []
+        exact: Dict[str, int] = {}
+        for place, aliases in places:
+            index = len(self.places)
+            self.places.append(place)
+            for name in [place.name, *aliases]:
+                key = normalize(name)
+                if not key:
+                    continue
+                current = exact.get(key)
+                if current is None or _KIND_PRIORITY[place.kind] < _KIND_PRIORITY[self.places[current].kind]:
+                    exact[key] = index
+
+        self._exact = exact
+        # Sorted keys for prefix search; trigram postings index into this list
+        self._keys: List[str] = sorted(exact)
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._key_trigrams: List[int] = []
+        for i, key in enumerate(self._keys):
+            grams = _trigrams(key)
+            self._key_trigrams.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(i)
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Optional[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_database(cls, db_path: str, landmarks_path: Optional[str] = None) -> "Gazetteer":
+        """
+        Build a gazetteer over a database's venues and neighborhoods plus the landmark list.
+
+        Args:
+            db_path: Events database path
+            landmarks_path: Landmark JSON file (default: the bundled list)
+
+        Returns:
+            Gazetteer instance
+        """
+        places = [(place, []) for place in load_database_places(db_path)]
+        return cls(places + load_landmarks(landmarks_path))
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def resolve(self, name: str) -> Optional[Place]:
+        """
+        Resolve a place name.
+
+        Args:
+            name: Venue, landmark, neighborhood or borough name; case, punctuation and small typos are tolerated
+
+        Returns:
+            The best matching Place, or None
+        """
+        key = normalize(name)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                index = self._cache[key]
+                return None if index is None else self.places[index]
+
+        index = self._lookup(key) if key else None
+        with self._lock:
+            self._cache[key] = index
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return None if index is None else self.places[index]
+
+    def suggest(self, name: str, limit: int = 5) -> List[Place]:
+        """
+        Closest places by trigram similarity, e.g. for "did you mean" messages.
+
+        Args:
+            name: Place name as written
+            limit: Maximum number of suggestions
+
+        Returns:
+            Places, most similar first
+        """
+        seen = set()
+        result = []
+        for key_index, _ in self._similar(normalize(name)):
+            place_index = self._exact[self._keys[key_index]]
+            if place_index not in seen:
+                seen.add(place_index)
+                result.append(self.places[place_index])
+                if len(result) >= limit:
+                    break
+        return result
+
+    def _lookup(self, key: str) -> Optional[int]:
+        if key in self._exact:
+            return self._exact[key]
+
+        start = bisect.bisect_left(self._keys, key)
+        end = bisect.bisect_left(self._keys, key + "\x7f")
+        if start < end:
+            best = min(self._keys[start:end], key=lambda k: (len(k), k))
+            return self._exact[best]
+
+        for key_index, similarity in self._similar(key):
+            if similarity >= MIN_SIMILARITY:
+                return self._exact[self._keys[key_index]]
+            break
+        return None
+
+    def _similar(self, key: str) -> List[Tuple[int, float]]:
+        # Shared-trigram counts over the postings of the query's trigrams only
+        grams = _trigrams(key)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for key_index in self._postings.get(gram, ()):
+                shared[key_index] += 1
+        scored = [
+            (key_index, count / (len(grams) + self._key_trigrams[key_index] - count))
+            for key_index, count in shared.items()
+        ]
+        scored.sort(key=lambda item: (-item[1], self._keys[item[0]]))
+        return scored
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return the current cache size and capacity."""
+        with self._lock:
+            return {"size": len(self._cache), "maxsize": self.cache_size}
+
+
+def main() -> None:
+    from .events_service import default_db_path
+
+    parser = argparse.ArgumentParser(description="Resolve a place name with the offline gazetteer")
+    parser.add_argument("name", help="Venue, landmark, neighborhood or borough name")
+    parser.add_argument("--db", default=None, help="Events database (default: bundled database)")
+    args = parser.parse_args()
+
+    gazetteer = Gazetteer.from_database(args.db or default_db_path())
+    place = gazetteer.resolve(args.name)
+    if place is None:
+        suggestions = ", ".join(p.name for p in gazetteer.suggest(args.name))
+        print(f"Unknown place: {args.name}" + (f" (did you mean: {suggestions}?)" if suggestions else ""))
+    else:
+        print(json.dumps(place.to_dict()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+"""
+Approximate event popularity for "trending" ordering.
+
+Tool calls record which events users look at: opening an event with
+``get_event_by_id`` counts as a view, appearing in a result list as a
+lighter impression. Counts live in memory in a count-min sketch (fixed
+size, never an exact per-event table) plus a small heavy-hitters map of the
+most viewed events, so recording never writes to the events database.
+
+Counts decay exponentially with a half-life of ``HALF_LIFE_HOURS``. Decay is
+applied lazily: new weight is scaled up by ``2 ** (age / half_life)`` against
+a fixed epoch, so existing counters never need rewriting, and estimates are
+scaled back down when read. The epoch is rebased before the scale overflows.
+
+Each worker process periodically snapshots its sketch to
+``<snapshot_dir>/<worker_id>.npz``. Unless NYC_EVENTS_WORKER_ID is set, a
+worker takes the lowest free ``worker-<n>`` slot, so a restarted server
+(e.g. a stdio server spawned per session) resumes its own snapshot instead
+of leaving a new file behind. Readers merge their live sketch with the
+other workers' snapshots (count-min sketches add cell-wise). Snapshots that
+have decayed to nothing are removed.
+"""
+
+import atexit
+import glob
+import hashlib
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# NumPy loads with the first sketch, not when the server imports this module
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger("nyc-events-mcp")
+
+SKETCH_WIDTH = 4096
+SKETCH_DEPTH = 4
+
+# Events tracked exactly enough to list as trending
+HEAVY_HITTERS = 200
+
+HALF_LIFE_HOURS = 24.0
+
+# Weight of opening an event vs. seeing it in a result list
+VIEW_WEIGHT = 1.0
+IMPRESSION_WEIGHT = 0.1
+
+# Tools whose results count as views; results of other tools count as impressions
+VIEW_TOOLS = frozenset({"get_event_by_id"})
+
+# Tools whose results are not recorded (listing trending events must not feed itself)
+UNTRACKED_TOOLS = frozenset({"trending_events"})
+
+SNAPSHOT_INTERVAL_S = 60.0
+
+# How long a merged view of the other workers' snapshots is reused
+MERGE_INTERVAL_S = 5.0
+
+# Snapshots not written for this many half-lives are dropped
+STALE_HALF_LIVES = 10
+
+# Default worker ids tried before falling back to one derived from the pid
+WORKER_SLOTS = 64
+
+# Rebase the decay epoch before scaled counters grow past this factor
+_MAX_SCALE = 2.0 ** 32
+
+
+def default_snapshot_dir() -> str:
+    """
+    Return the snapshot directory: NYC_EVENTS_TRENDING_DIR, or next to the default events database.
+    """
+    from .events_service import default_db_path
+
+    return os.environ.get("NYC_EVENTS_TRENDING_DIR") or default_db_path() + ".trending"
+
+
+# Lock files of the worker slots this process holds; closing one frees the slot
+_slot_locks: List[object] = []
+
+
+def default_worker_id(snapshot_dir: Optional[str] = None) -> str:
+    """
+    Return this process's snapshot name.
+
+    NYC_EVENTS_WORKER_ID if set; otherwise the lowest ``worker-<n>`` slot of
+    snapshot_dir that no running process holds. The slot is held with a file
+    lock until the process exits, so concurrent workers get distinct names
+    while a restarted worker gets its old one back and picks up its own
+    snapshot. Falls back to a pid-derived name where slots cannot be locked.
+
+    Args:
+        snapshot_dir: Directory for worker snapshots
+
+    Returns:
+        Worker id
+    """
+    worker_id = os.environ.get("NYC_EVENTS_WORKER_ID")
+    if worker_id:
+        return worker_id
+    if snapshot_dir:
+        try:
+            import fcntl
+
+            os.makedirs(snapshot_dir, exist_ok=True)
+            for slot in range(WORKER_SLOTS):
+                lock_file = open(os.path.join(snapshot_dir, f"worker-{slot}.lock"), "a")
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    lock_file.close()
+                    continue
+                _slot_locks.append(lock_file)
+                return f"worker-{slot}"
+        except (ImportError, OSError) as e:
+            logger.warning(f"Could not claim a popularity worker slot: {str(e)}")
+    return f"pid-{os.getpid()}"
+
+
+def _cells(key: str, width: int, depth: int) -> List[int]:
+    # Flat table index of the key's counter in each row. The hash is stable
+    # across processes (unlike hash()), so sketches from different workers line up.
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [row * width + (h1 + row * h2) % width for row in range(depth)]
+
+
+class CountMinSketch:
+    """
+    Count-min sketch with conservative update over decayed weights.
+
+    Counters are stored in "epoch units": a weight recorded at time t is
+    stored multiplied by 2 ** ((t - epoch) / half_life).
+    """
+
+    def __init__(
+        self,
+        width: int = SKETCH_WIDTH,
+        depth: int = SKETCH_DEPTH,
+        half_life_s: float = HALF_LIFE_HOURS * 3600,
+        epoch: Optional[float] = None
+    ):
+        import numpy as np
+
+        self.width = width
+        self.depth = depth
+        self.half_life_s = half_life_s
+        self.epoch = time.time() if epoch is None else epoch
+        self.table = np.zeros((depth, width), dtype=np.float64)
+
+    @property
+    def table(self) -> "np.ndarray":
+        return self._table
+
+    @table.setter
+    def table(self, table: "np.ndarray") -> None:
+        import numpy as np
+
+        self._table = np.ascontiguousarray(table, dtype=np.float64)
+        # Flat view of the same buffer: scalar access is far cheaper than NumPy indexing
+        self._flat = memoryview(self._table).cast("B").cast("d")
+
+    def scale(self, now: float) -> float:
+        """Factor between epoch units and current counts at time ``now``."""
+        return 2.0 ** ((now - self.epoch) / self.half_life_s)
+
+    def rebase(self, now: float) -> float:
+        """
+        Move the epoch to ``now``, rescaling the counters.
+
+        Returns:
+            Factor the caller must apply to values it holds in the old epoch units
+        """
+        factor = 1.0 / self.scale(now)
+        self.table *= factor
+        self.epoch = now
+        return factor
+
+    def add(self, key: str, weight: float, now: float) -> float:
+        """
+        Add weight for a key (conservative update: only counters below the new estimate grow).
+
+        Returns:
+            The key's new estimate in epoch units
+        """
+        flat = self._flat
+        cells = _cells(key, self.width, self.depth)
+        estimate = min(flat[i] for i in cells) + weight * self.scale(now)
+        for i in cells:
+            if flat[i] < estimate:
+                flat[i] = estimate
+        return estimate
+
+    def estimate(self, key: str) -> float:
+        """Estimate for a key in epoch units (never below the true decayed count)."""
+        flat = self._flat
+        return min(flat[i] for i in _cells(key, self.width, self.depth))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """
+        Add another sketch of the same dimensions, aligning its epoch to ours.
+        """
+        if other.table.shape != self.table.shape:
+            raise ValueError("Cannot merge sketches of different dimensions")
+        self.table += other.table * 2.0 ** ((other.epoch - self.epoch) / self.half_life_s)
+
+    def copy(self) -> "CountMinSketch":
+        sketch = CountMinSketch(self.width, self.depth, self.half_life_s, self.epoch)
+        sketch.table = self.table.copy()
+        return sketch
+
+
+class PopularityTracker:
+    """
+    Per-process popularity counts: a count-min sketch plus heavy hitters, snapshotted to disk.
+    """
+
+    def __init__(
+        self,
+        snapshot_dir: Optional[str] = None,
+        worker_id: Optional[str] = None,
+        heavy_hitters: int = HEAVY_HITTERS,
+        half_life_hours: float = HALF_LIFE_HOURS,
+        snapshot_interval_s: float = SNAPSHOT_INTERVAL_S
+    ):
+        """
+        Args:
+            snapshot_dir: Directory for worker snapshots (None keeps counts in memory only)
+            worker_id: Snapshot name of this process (default: default_worker_id(snapshot_dir))
+            heavy_hitters: Number of top events tracked for listing
+            half_life_hours: Decay half-life
+            snapshot_interval_s: Minimum seconds between snapshots
+        """
+        self.snapshot_dir = snapshot_dir
+        self.worker_id = worker_id or default_worker_id(snapshot_dir)
+        self.heavy_hitters = heavy_hitters
+        self.snapshot_interval_s = snapshot_interval_s
+        self.sketch = CountMinSketch(half_life_s=half_life_hours * 3600)
+        # event_id -> estimate in the sketch's epoch units
+        self.heavy: Dict[str, float] = {}
+        self._floor = 0.0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_snapshot = time.time()
+        self._merged: Optional[Tuple[float, CountMinSketch, Dict[str, float]]] = None
+        self._peer_cache: Dict[str, Tuple[float, CountMinSketch, Dict[str, float]]] = {}
+
+        if snapshot_dir:
+            own = self.snapshot_path()
+            if os.path.exists(own):
+                try:
+                    self.sketch, self.heavy = _load_snapshot(own)
+                    self._floor = min(self.heavy.values(), default=0.0)
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable popularity snapshot {own}: {str(e)}")
+
+    def snapshot_path(self, worker_id: Optional[str] = None) -> str:
+        return os.path.join(self.snapshot_dir, f"{worker_id or self.worker_id}.npz")
+
+    def record(self, event_ids: Iterable[str], weight: float, now: Optional[float] = None) -> None:
+        """
+        Count views or impressions of events.
+
+        Args:
+            event_ids: Events that were looked at
+            weight: Weight per event (VIEW_WEIGHT or IMPRESSION_WEIGHT)
+            now: Current time (default: time.time())
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            if self.sketch.scale(now) > _MAX_SCALE:
+                factor = self.sketch.rebase(now)
+                self.heavy = {key: value * factor for key, value in self.heavy.items()}
+                self._floor *= factor
+            for event_id in event_ids:
+                self._admit(event_id, self.sketch.add(event_id, weight, now))
+            self._dirty = True
+            due = self.snapshot_dir and now - self._last_snapshot >= self.snapshot_interval_s
+        if due:
+            try:
+                self.snapshot(now)
+            except OSError as e:
+                # Counting goes on in memory; the next interval retries
+                logger.warning(f"Could not write popularity snapshot: {str(e)}")
+
+    def _admit(self, event_id: str, estimate: float) -> None:
+        if event_id in self.heavy or len(self.heavy) < self.heavy_hitters:
+            self.heavy[event_id] = estimate
+            return
+        # Estimates only grow, so the cached floor never exceeds the true minimum
+        if estimate <= self._floor:
+            return
+        floor_id = min(self.heavy, key=self.heavy.__getitem__)
+        if self.heavy[floor_id] < estimate:
+            del self.heavy[floor_id]
+            self.heavy[event_id] = estimate
+        self._floor = min(self.heavy.values())
+
+    def snapshot(self, now: Optional[float] = None) -> None:
+        """
+        Write this worker's counts to its snapshot file (atomically) and drop stale peer snapshots.
+        """
+        if not self.snapshot_dir:
+            return
+        import numpy as np
+
+        now = time.time() if now is None else now
+        with self._lock:
+            if not self._dirty:
+                return
+            table = self.sketch.table.copy()
+            epoch = self.sketch.epoch
+            heavy = dict(self.heavy)
+            self._dirty = False
+            self._last_snapshot = now
+
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        path = self.snapshot_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                table=table,
+                epoch=np.float64(epoch),
+                half_life_s=np.float64(self.sketch.half_life_s),
+                ids=np.array(list(heavy), dtype=str),
+                values=np.array(list(heavy.values()), dtype=np.float64),
+            )
+        os.replace(tmp_path, path)
+
+        stale_after = STALE_HALF_LIVES * self.sketch.half_life_s
+        for peer in glob.glob(os.path.join(self.snapshot_dir, "*.npz")):
+            try:
+                if now - os.path.getmtime(peer) > stale_after:
+                    os.remove(peer)
+            except OSError:
+                pass
+
+    def _merged_view(self, now: float) -> Tuple[CountMinSketch, Dict[str, float]]:
+        # Own live counts plus the latest snapshot of every other worker
+        if self._merged is not None and now - self._merged[0] < MERGE_INTERVAL_S:
+            return self._merged[1], self._merged[2]
+
+        with self._lock:
+            sketch = self.sketch.copy()
+            heavy = dict(self.heavy)
+        if self.snapshot_dir and os.path.isdir(self.snapshot_dir):
+            own = self.snapshot_path()
+            for path in glob.glob(os.path.join(self.snapshot_dir, "*.npz")):
+                if path == own:
+                    continue
+                try:
+                    mtime = os.path.getmtime(path)
+                    cached = self._peer_cache.get(path)
+                    if cached is None or cached[0] != mtime:
+                        cached = (mtime, *_load_snapshot(path))
+                        self._peer_cache[path] = cached
+                    sketch.merge(cached[1])
+                    heavy.update(dict.fromkeys(cached[2], 0.0))
+                except Exception as e:
+                    logger.warning(f"Skipping popularity snapshot {path}: {str(e)}")
+
+        heavy = {event_id: sketch.estimate(event_id) for event_id in heavy}
+        self._merged = (now, sketch, heavy)
+        return sketch, heavy
+
+    def top(self, n: int, now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        Most viewed events across all workers.
+
+        Args:
+            n: Maximum number of events
+            now: Current time (default: time.time())
+
+        Returns:
+            List of (event_id, decayed weighted views), highest first
+        """
+        now = time.time() if now is None else now
+        sketch, heavy = self._merged_view(now)
+        scale = sketch.scale(now)
+        ranked = sorted(heavy.items(), key=lambda item: (-item[1], item[0]))[:n]
+        return [(event_id, value / scale) for event_id, value in ranked if value > 0]
+
+    def scores(self, event_ids: Iterable[str], now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Decayed weighted views of the given events across all workers.
+
+        Args:
+            event_ids: Events to score
+            now: Current time (default: time.time())
+
+        Returns:
+            Dictionary of event_id -> score (upper-bound estimates)
+        """
+        now = time.time() if now is None else now
+        sketch, _ = self._merged_view(now)
+        scale = sketch.scale(now)
+        return {event_id: sketch.estimate(event_id) / scale for event_id in event_ids}
+
+
+def _load_snapshot(path: str) -> Tuple[CountMinSketch, Dict[str, float]]:
+    import numpy as np
+
+    with np.load(path) as data:
+        table = data["table"]
+        sketch = CountMinSketch(table.shape[1], table.shape[0], float(data["half_life_s"]), float(data["epoch"]))
+        sketch.table = table.astype(np.float64)
+        heavy = dict(zip(data["ids"].tolist(), data["values"].tolist()))
+    return sketch, heavy
+
+
+_tracker: Optional[PopularityTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_popularity_tracker() -> PopularityTracker:
+    """
+    Return the process-wide tracker, creating it on first use.
+    """
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = PopularityTracker(default_snapshot_dir())
+                # Keep counts recorded since the last periodic snapshot
+                atexit.register(_tracker.snapshot)
+    return _tracker
+
+
+# Events shown by the tool call running in this context, collected by observing()
+_observed: ContextVar[Optional[List[str]]] = ContextVar("popularity_observed", default=None)
+
+
+@contextmanager
+def observing() -> Iterator[List[str]]:
+    """
+    Collect the event ids that tool handlers report via observe() within this block.
+    """
+    collected: List[str] = []
+    token = _observed.set(collected)
+    try:
+        yield collected
+    finally:
+        _observed.reset(token)
+
+
+def observe(event_ids: Iterable[str]) -> None:
+    """
+    Report events returned to the user; a no-op outside observing().
+    """
+    collected = _observed.get()
+    if collected is not None:
+        collected.extend(event_ids)
+
+
+def record_tool_call(tool_name: str, event_ids: List[str]) -> None:
+    """
+    Count the events a tool call returned, as views or impressions depending on the tool.
+
+    Args:
+        tool_name: Name of the tool that ran
+        event_ids: Events it returned
+    """
+    if not event_ids or tool_name in UNTRACKED_TOOLS:
+        return
+    weight = VIEW_WEIGHT if tool_name in VIEW_TOOLS else IMPRESSION_WEIGHT
+    get_popularity_tracker().record(event_ids, weight)
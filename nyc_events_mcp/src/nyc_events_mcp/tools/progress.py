@@ -0,0 +1,83 @@
+"""
+Progress notifications for long-running tool calls.
+
+A client that sends a ``progressToken`` with tools/call gets
+notifications/progress while the tool runs. Event listings that support it
+(search, category, date-range and proximity) stream their results: the
+query runs in a worker thread and every ``PROGRESS_BATCH_SIZE`` rows the
+formatted batch goes out as the progress message, numbered as in the final
+answer. Interactive clients can show the first results before the whole
+list is fetched and formatted, and a slow query shows up as steady progress
+rather than a silent wait. Calls without a token run exactly as before.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterator, Optional
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# Rows per streamed batch
+PROGRESS_BATCH_SIZE = 25
+
+# send(progress, total, message)
+ProgressSender = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+
+class ProgressReporter:
+    """
+    Sends progress notifications for one tool call.
+
+    Sending failures (e.g. the client went away) are logged once and further
+    reports are dropped, so progress can never fail the call itself.
+    """
+
+    def __init__(self, send: ProgressSender):
+        """
+        Args:
+            send: Coroutine function sending one notification
+        """
+        self._send = send
+        self.progress = 0.0
+        self.enabled = True
+
+    async def report(self, progress: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+        """
+        Send a progress notification.
+
+        Args:
+            progress: Work done so far; never reported lower than a previous value
+            total: Total work, if known
+            message: Human-readable progress or partial results
+        """
+        if not self.enabled:
+            return
+        self.progress = max(self.progress, progress)
+        try:
+            await self._send(self.progress, total, message)
+        except Exception as e:
+            self.enabled = False
+            logger.warning(f"Stopped sending progress notifications: {str(e)}")
+
+
+_current: ContextVar[Optional[ProgressReporter]] = ContextVar("progress_reporter", default=None)
+
+
+@contextmanager
+def reporting_progress(reporter: Optional[ProgressReporter]) -> Iterator[Optional[ProgressReporter]]:
+    """
+    Make ``reporter`` the progress reporter of tool handlers run within this block.
+    """
+    token = _current.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current.reset(token)
+
+
+def current_progress() -> Optional[ProgressReporter]:
+    """
+    Return the progress reporter of the running tool call, or None if the client asked for no progress.
+    """
+    return _current.get()
@@ -0,0 +1,493 @@
+"""
+Composable event filters compiled to cached, parameterized SQL.
+
+Filters form a small AST (``Text``, ``Category``, ``DateRange``, ``Venue``,
+``Borough``, ``Neighborhood``, ``ChangedSince``, ``EventId`` and ``EventIds``,
+combined with ``All``). Each node separates its
+*shape* (which columns and operators it uses) from its *values*, so every
+query with the same shape compiles to the same SQL text. ``StatementCache`` keeps compiled
+statements in a bounded LRU keyed by shape; hot shapes skip SQL building and
+only collect their parameters.
+
+Example:
+    query = EventQuery(All(Category("music"), DateRange("2025-10-24", None)), limit=20)
+    sql = cache.get(query)
+    rows = conn.execute(sql, query.params())
+"""
+
+import json
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Hashable, List, Optional, Tuple
+
+from .records import EVENT_FIELDS
+
+# Alias of the event_details view in compiled statements; filters qualify
+# their columns with it so they stay unambiguous inside joins.
+SOURCE_ALIAS = "e"
+
+_EVENT_COLUMNS = ", ".join(f"{SOURCE_ALIAS}.{field}" for field in EVENT_FIELDS)
+
+# ORDER BY keys of a plain listing, by EventQuery.order
+_ORDER = {
+    "date": f"{SOURCE_ALIAS}.date, {SOURCE_ALIAS}.start_time_local",
+    "changed": f"{SOURCE_ALIAS}.updated_at, {SOURCE_ALIAS}.event_id",
+}
+
+# Planner estimate of the fraction of events matching a changed_since filter
+CHANGED_LIKELIHOOD = 0.0001
+
+# Separates the timestamp and the last event id in a partial-page change cursor
+CURSOR_SEPARATOR = "|"
+
+# ORDER BY keys of a proximity join, by EventQuery.near_order
+_NEAR_ORDER = {
+    "distance": "near.distance",
+    "travel": "near.minutes, near.distance",
+    "detour": "near.detour, near.distance",
+}
+
+
+class Filter:
+    """
+    Base class for filter nodes.
+    """
+
+    __slots__ = ()
+
+    def shape(self) -> Hashable:
+        """Hashable description of the SQL this node compiles to, without values."""
+        raise NotImplementedError
+
+    def to_sql(self) -> str:
+        """SQL boolean expression with ``?`` placeholders."""
+        raise NotImplementedError
+
+    def params(self) -> List[Any]:
+        """Placeholder values, in the order they appear in to_sql()."""
+        raise NotImplementedError
+
+    def __and__(self, other: "Filter") -> "All":
+        return All(self, other)
+
+
+class All(Filter):
+    """
+    Conjunction of filters; None children are dropped and nested Alls flattened.
+    """
+
+    __slots__ = ("filters",)
+
+    def __init__(self, *filters: Optional[Filter]):
+        flat: List[Filter] = []
+        for node in filters:
+            if isinstance(node, All):
+                flat.extend(node.filters)
+            elif node is not None:
+                flat.append(node)
+        self.filters = tuple(flat)
+
+    def shape(self) -> Hashable:
+        return ("all",) + tuple(node.shape() for node in self.filters)
+
+    def to_sql(self) -> str:
+        if not self.filters:
+            return "1=1"
+        return " AND ".join(node.to_sql() for node in self.filters)
+
+    def params(self) -> List[Any]:
+        values: List[Any] = []
+        for node in self.filters:
+            values.extend(node.params())
+        return values
+
+
+class Text(Filter):
+    """
+    Substring match on title, description or venue name.
+    """
+
+    __slots__ = ("query",)
+
+    def __init__(self, query: str):
+        self.query = query
+
+    def shape(self) -> Hashable:
+        return ("text",)
+
+    def to_sql(self) -> str:
+        return (
+            f"({SOURCE_ALIAS}.title LIKE ? OR {SOURCE_ALIAS}.description LIKE ? "
+            f"OR {SOURCE_ALIAS}.venue_name LIKE ?)"
+        )
+
+    def params(self) -> List[Any]:
+        pattern = f"%{self.query}%"
+        return [pattern, pattern, pattern]
+
+
+class Category(Filter):
+    """
+    Exact category match (categories are stored lowercase).
+    """
+
+    __slots__ = ("category",)
+
+    def __init__(self, category: str):
+        self.category = category.lower()
+
+    def shape(self) -> Hashable:
+        return ("category",)
+
+    def to_sql(self) -> str:
+        return f"{SOURCE_ALIAS}.category = ?"
+
+    def params(self) -> List[Any]:
+        return [self.category]
+
+
+class DateRange(Filter):
+    """
+    Inclusive date range; either end may be open.
+    """
+
+    __slots__ = ("start", "end")
+
+    def __init__(self, start: Optional[str], end: Optional[str]):
+        self.start = start
+        self.end = end
+
+    def shape(self) -> Hashable:
+        return ("date", self.start is not None, self.end is not None)
+
+    def to_sql(self) -> str:
+        if self.start is not None and self.end is not None:
+            return f"{SOURCE_ALIAS}.date BETWEEN ? AND ?"
+        if self.start is not None:
+            return f"{SOURCE_ALIAS}.date >= ?"
+        if self.end is not None:
+            return f"{SOURCE_ALIAS}.date <= ?"
+        return "1=1"
+
+    def params(self) -> List[Any]:
+        return [value for value in (self.start, self.end) if value is not None]
+
+
+class Venue(Filter):
+    """
+    Events at one venue.
+    """
+
+    __slots__ = ("venue_id",)
+
+    def __init__(self, venue_id: int):
+        self.venue_id = venue_id
+
+    def shape(self) -> Hashable:
+        return ("venue",)
+
+    def to_sql(self) -> str:
+        return f"{SOURCE_ALIAS}.venue_id = ?"
+
+    def params(self) -> List[Any]:
+        return [self.venue_id]
+
+
+class Borough(Filter):
+    """
+    Events in a borough (case-insensitive; served by the venue borough index).
+    """
+
+    __slots__ = ("borough",)
+
+    def __init__(self, borough: str):
+        self.borough = borough.strip()
+
+    def shape(self) -> Hashable:
+        return ("borough",)
+
+    def to_sql(self) -> str:
+        return f"{SOURCE_ALIAS}.borough = ? COLLATE NOCASE"
+
+    def params(self) -> List[Any]:
+        return [self.borough]
+
+
+class Neighborhood(Filter):
+    """
+    Events in a neighborhood (case-insensitive; served by the venue neighborhood index).
+    """
+
+    __slots__ = ("neighborhood",)
+
+    def __init__(self, neighborhood: str):
+        self.neighborhood = neighborhood.strip()
+
+    def shape(self) -> Hashable:
+        return ("neighborhood",)
+
+    def to_sql(self) -> str:
+        return f"{SOURCE_ALIAS}.neighborhood = ? COLLATE NOCASE"
+
+    def params(self) -> List[Any]:
+        return [self.neighborhood]
+
+
+def parse_change_cursor(value: str) -> Tuple[str, Optional[str]]:
+    """
+    Parse a changed_since value.
+
+    Args:
+        value: ISO date or timestamp (naive values are UTC), or a cursor
+            returned by a previous change listing ("<timestamp>|<event_id>")
+
+    Returns:
+        Tuple of (UTC timestamp in the stored updated_at format, last event id or None)
+    """
+    text, _, after_id = value.strip().partition(CURSOR_SEPARATOR)
+    try:
+        moment = datetime.fromisoformat(text[:-1] + "+00:00" if text.endswith("Z") else text)
+    except ValueError:
+        raise ValueError(
+            f"Invalid changed_since: {value!r} (expected an ISO timestamp such as 2025-10-20T08:00:00Z)"
+        ) from None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat(timespec="microseconds"), after_id or None
+
+
+class ChangedSince(Filter):
+    """
+    Events added or modified after a change cursor (served by the updated_at index).
+    """
+
+    __slots__ = ("timestamp", "after_id")
+
+    def __init__(self, cursor: str):
+        self.timestamp, self.after_id = parse_change_cursor(cursor)
+
+    def shape(self) -> Hashable:
+        return ("changed_since", self.after_id is not None)
+
+    def to_sql(self) -> str:
+        # Polls are frequent, so few rows have changed: the hint makes the
+        # planner drive the query from the updated_at index instead of, say,
+        # scanning a week of dates and sorting them
+        if self.after_id is not None:
+            return f"likelihood(({SOURCE_ALIAS}.updated_at, {SOURCE_ALIAS}.event_id) > (?, ?), {CHANGED_LIKELIHOOD})"
+        return f"likelihood({SOURCE_ALIAS}.updated_at > ?, {CHANGED_LIKELIHOOD})"
+
+    def params(self) -> List[Any]:
+        if self.after_id is not None:
+            return [self.timestamp, self.after_id]
+        return [self.timestamp]
+
+
+class EventId(Filter):
+    """
+    A single event by id.
+    """
+
+    __slots__ = ("event_id",)
+
+    def __init__(self, event_id: str):
+        self.event_id = event_id
+
+    def shape(self) -> Hashable:
+        return ("event_id",)
+
+    def to_sql(self) -> str:
+        return f"{SOURCE_ALIAS}.event_id = ?"
+
+    def params(self) -> List[Any]:
+        return [self.event_id]
+
+
+class EventIds(Filter):
+    """
+    A set of events by id; the ids travel as one JSON parameter so the
+    statement shape does not depend on how many there are.
+    """
+
+    __slots__ = ("event_ids",)
+
+    def __init__(self, event_ids: List[str]):
+        self.event_ids = event_ids
+
+    def shape(self) -> Hashable:
+        return ("event_ids",)
+
+    def to_sql(self) -> str:
+        return f"{SOURCE_ALIAS}.event_id IN (SELECT value FROM json_each(?))"
+
+    def params(self) -> List[Any]:
+        return [json.dumps(self.event_ids)]
+
+
+def event_filters(
+    query: Optional[str] = None,
+    category: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    neighborhood: Optional[str] = None,
+    borough: Optional[str] = None,
+    changed_since: Optional[str] = None
+) -> All:
+    """
+    Build the filter tree for the common search arguments.
+
+    Args:
+        query: Search text for title, description, or venue
+        category: Category filter
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        neighborhood: Neighborhood name, e.g. "Williamsburg"
+        borough: Borough name, e.g. "Brooklyn"
+        changed_since: Only events added or modified after this timestamp or change cursor
+
+    Returns:
+        Conjunction of the filters that were given
+    """
+    return All(
+        Text(query) if query else None,
+        Category(category) if category else None,
+        DateRange(start_date, end_date) if start_date or end_date else None,
+        Neighborhood(neighborhood) if neighborhood else None,
+        Borough(borough) if borough else None,
+        ChangedSince(changed_since) if changed_since else None,
+    )
+
+
+class EventQuery:
+    """
+    An event listing: filters, optional proximity join and a limit.
+
+    When ``near`` is given (a JSON array of ``[venue_id, distance_km]``
+    entries, optionally followed by travel minutes and a detour in km),
+    results are restricted to those venues, ordered by ``near_order``
+    ("distance", "travel" or "detour") and carry the extra values as columns.
+    Otherwise results are ordered by ``order``: "date" (start time) or
+    "changed" (change order, for paging through changed_since listings).
+    """
+
+    __slots__ = ("where", "limit", "near", "near_order", "order")
+
+    def __init__(
+        self,
+        where: Filter,
+        limit: Optional[int] = None,
+        near: Optional[str] = None,
+        near_order: str = "distance",
+        order: str = "date"
+    ):
+        self.where = where
+        self.limit = limit
+        self.near = near
+        self.near_order = near_order
+        self.order = order
+
+    def shape(self) -> Hashable:
+        return (
+            "events", self.where.shape(), self.limit is not None, self.near is not None, self.near_order, self.order
+        )
+
+    def compile(self) -> str:
+        where = self.where.to_sql()
+        if self.near is not None:
+            order = _NEAR_ORDER[self.near_order]
+            sql = (
+                "WITH near(venue_id, distance, minutes, detour) AS ("
+                "SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'), "
+                "json_extract(value, '$[2]'), json_extract(value, '$[3]') FROM json_each(?)) "
+                f"SELECT {_EVENT_COLUMNS}, near.distance, near.minutes, near.detour "
+                f"FROM near JOIN event_details {SOURCE_ALIAS} ON {SOURCE_ALIAS}.venue_id = near.venue_id "
+                f"WHERE {where} "
+                f"ORDER BY {order}, {SOURCE_ALIAS}.date, {SOURCE_ALIAS}.start_time_local"
+            )
+        else:
+            sql = (
+                f"SELECT {_EVENT_COLUMNS} FROM event_details {SOURCE_ALIAS} WHERE {where} "
+                f"ORDER BY {_ORDER[self.order]}"
+            )
+        if self.limit is not None:
+            sql += " LIMIT ?"
+        return sql
+
+    def params(self) -> List[Any]:
+        values = [self.near] if self.near is not None else []
+        values.extend(self.where.params())
+        if self.limit is not None:
+            values.append(self.limit)
+        return values
+
+
+class FacetQuery:
+    """
+    Per (category, date, venue) counts of everything a filter matches.
+    """
+
+    __slots__ = ("where",)
+
+    def __init__(self, where: Filter):
+        self.where = where
+
+    def shape(self) -> Hashable:
+        return ("facets", self.where.shape())
+
+    def compile(self) -> str:
+        return (
+            f"SELECT {SOURCE_ALIAS}.category, {SOURCE_ALIAS}.date, {SOURCE_ALIAS}.venue_name, COUNT(*) "
+            f"FROM event_details {SOURCE_ALIAS} WHERE {self.where.to_sql()} "
+            f"GROUP BY {SOURCE_ALIAS}.category, {SOURCE_ALIAS}.date, {SOURCE_ALIAS}.venue_name"
+        )
+
+    def params(self) -> List[Any]:
+        return self.where.params()
+
+
+class StatementCache:
+    """
+    Bounded LRU of compiled SQL keyed by query shape.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._statements: "OrderedDict[Hashable, str]" = OrderedDict()
+
+    def get(self, query: Any) -> str:
+        """
+        Return the SQL for a query, compiling it on the first use of its shape.
+
+        Args:
+            query: EventQuery or FacetQuery
+
+        Returns:
+            Parameterized SQL text
+        """
+        key = query.shape()
+        sql = self._statements.get(key)
+        if sql is not None:
+            self.hits += 1
+            self._statements.move_to_end(key)
+            return sql
+
+        self.misses += 1
+        sql = query.compile()
+        self._statements[key] = sql
+        if len(self._statements) > self.maxsize:
+            self._statements.popitem(last=False)
+        return sql
+
+    def info(self) -> dict:
+        """Hit/miss counters and current size, in the spirit of functools cache_info()."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._statements),
+            "maxsize": self.maxsize,
+        }
+
+    def __len__(self) -> int:
+        return len(self._statements)
@@ -0,0 +1,285 @@
+"""
+Personalized ranking of events against a user's preferences.
+
+An event's score combines:
+- interest match: the best cosine similarity between the event and any of
+  the user's interests, using the semantic index vectors;
+- diet: a penalty for events centred on food the user's diet excludes;
+- proximity: a bonus that decays with distance from the user's home (or
+  the nearest of several anchor locations, such as the day's appointments).
+
+Optionally, picks are diversified across categories: each event already
+picked in a category lowers the score of the rest of that category.
+
+The interest and diet parts only depend on the event text and the user's
+preferences, so they are computed for every indexed event at once and cached
+per (user id, prefs version). When events change, the semantic index appends
+rows and only those rows are scored; a full index rebuild rescores.
+"""
+
+import hashlib
+import json
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .records import EventRecord
+from .semantic import SemanticIndex
+from .user_prefs import UserPrefs
+
+# Weight of the home-proximity bonus relative to a perfect interest match
+PROXIMITY_WEIGHT = 0.3
+
+# Distance (km) at which the proximity bonus has decayed to ~37%
+PROXIMITY_SCALE_KM = 3.0
+
+# Weight of the penalty for events matching the diet's excluded foods
+DIET_PENALTY_WEIGHT = 0.5
+
+# Normalized diet -> food words that conflict with it
+DIET_CONFLICTS: Dict[str, str] = {
+    "vegetarian": "steak steakhouse bbq barbecue burger meat chicken pork seafood oyster sushi",
+    "vegan": "steak steakhouse bbq barbecue burger meat chicken pork seafood oyster sushi cheese dairy ice cream",
+    "pescatarian": "steak steakhouse bbq barbecue burger meat chicken pork",
+    "halal": "pork bacon beer wine",
+    "kosher": "pork bacon shellfish oyster",
+}
+
+# Number of (user, prefs version) score vectors kept in memory
+SCORE_CACHE_SIZE = 256
+
+# Score subtracted per event already picked from the same category when diversifying
+DIVERSITY_PENALTY = 0.15
+
+
+class UserProfile:
+    """
+    The preference fields used for ranking.
+    """
+
+    __slots__ = ("user_id", "version", "interests", "diet", "home_latitude", "home_longitude")
+
+    def __init__(
+        self,
+        user_id: str,
+        version: str,
+        interests: Sequence[str],
+        diet: Optional[str] = None,
+        home_latitude: Optional[float] = None,
+        home_longitude: Optional[float] = None,
+    ):
+        self.user_id = user_id
+        self.version = version
+        self.interests = tuple(interests)
+        self.diet = diet
+        self.home_latitude = home_latitude
+        self.home_longitude = home_longitude
+
+    @property
+    def has_home(self) -> bool:
+        return self.home_latitude is not None and self.home_longitude is not None
+
+    @classmethod
+    def from_prefs(cls, user_id: str, prefs: Dict[str, Any]) -> "UserProfile":
+        """
+        Build a profile from a prefs.json-style dictionary.
+
+        The home location is read from an optional ``"home": {"latitude": ..., "longitude": ...}``
+        entry. The version is a digest of the preferences, so any edit
+        invalidates cached scores.
+
+        Args:
+            user_id: User identifier
+            prefs: Preferences dictionary
+
+        Returns:
+            A UserProfile
+        """
+        home = prefs.get("home") or {}
+        version = hashlib.sha1(json.dumps(prefs, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        return cls(
+            user_id=user_id,
+            version=version,
+            interests=prefs.get("interests") or [],
+            diet=prefs.get("diet"),
+            home_latitude=home.get("latitude"),
+            home_longitude=home.get("longitude"),
+        )
+
+    @classmethod
+    def from_user_prefs(cls, prefs: "UserPrefs") -> "UserProfile":
+        """
+        Build a profile from stored preferences; the store's version is the profile version.
+
+        Args:
+            prefs: UserPrefs from the preferences store
+
+        Returns:
+            A UserProfile
+        """
+        return cls(
+            user_id=prefs.user_id,
+            version=str(prefs.version),
+            interests=prefs.interests,
+            diet=prefs.diet,
+            home_latitude=prefs.home_latitude,
+            home_longitude=prefs.home_longitude,
+        )
+
+
+def _diet_conflicts(diet: Optional[str]) -> Optional[str]:
+    if not diet:
+        return None
+    normalized = diet.lower().strip()
+    # "non vegetarian" and similar carry no restriction
+    if normalized.startswith("non"):
+        return None
+    for name, conflicts in DIET_CONFLICTS.items():
+        if name in normalized:
+            return conflicts
+    return None
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    lat1_rad, lat2_rad = math.radians(lat1), np.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = np.radians(lon2) - math.radians(lon1)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    return 6371.0 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _diversified_order(scores: np.ndarray, categories: Sequence[str], limit: int, penalty: float) -> List[int]:
+    # Greedy: repeatedly take the best adjusted score, then penalize the rest of its category
+    codes, category_of = np.unique(np.asarray(categories, dtype=object).astype(str), return_inverse=True)
+    picked_per_category = np.zeros(len(codes))
+    available = np.ones(len(scores), dtype=bool)
+    order: List[int] = []
+    for _ in range(min(limit, len(scores))):
+        adjusted = np.where(available, scores - penalty * picked_per_category[category_of], -np.inf)
+        best = int(np.argmax(adjusted))
+        order.append(best)
+        available[best] = False
+        picked_per_category[category_of[best]] += 1
+    return order
+
+
+class PersonalRanker:
+    """
+    Ranks events for a user, caching per-event preference scores.
+    """
+
+    def __init__(self, maxsize: int = SCORE_CACHE_SIZE):
+        self.maxsize = maxsize
+        # (user_id, version) -> (index build id, scores for index rows [0, len(scores)))
+        self._scores: "OrderedDict[Tuple[str, str], Tuple[int, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _score_rows(self, index: SemanticIndex, profile: UserProfile, rows: np.ndarray) -> np.ndarray:
+        scores = np.zeros(len(rows), dtype=np.float32)
+        if profile.interests:
+            interests = [index.score(index.embed_query(interest), rows) for interest in profile.interests]
+            scores = np.maximum(np.max(interests, axis=0), 0.0)
+        conflicts = _diet_conflicts(profile.diet)
+        if conflicts:
+            scores -= DIET_PENALTY_WEIGHT * np.maximum(index.score(index.embed_query(conflicts), rows), 0.0)
+        return scores
+
+    def preference_scores(self, index: SemanticIndex, profile: UserProfile) -> np.ndarray:
+        """
+        Interest and diet scores for every row of the index.
+
+        Cached per (user id, prefs version); rows appended to the index since
+        the last call are scored on their own.
+
+        Args:
+            index: Current semantic index
+            profile: User profile
+
+        Returns:
+            Array of scores aligned with the index rows
+        """
+        key = (profile.user_id, profile.version)
+        with self._lock:
+            cached = self._scores.get(key)
+        if cached is not None and cached[0] == index.build_id:
+            scores = cached[1]
+            if len(scores) < len(index):
+                scores = np.concatenate([scores, self._score_rows(index, profile, np.arange(len(scores), len(index)))])
+        else:
+            scores = self._score_rows(index, profile, np.arange(len(index)))
+
+        with self._lock:
+            self._scores[key] = (index.build_id, scores)
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.maxsize:
+                self._scores.popitem(last=False)
+        return scores
+
+    def rank(
+        self,
+        index: SemanticIndex,
+        profile: UserProfile,
+        events: List[EventRecord],
+        limit: int,
+        anchors: Optional[Sequence[Tuple[float, float]]] = None,
+        diversity: float = 0.0,
+        cache: bool = True
+    ) -> List[EventRecord]:
+        """
+        Order events by personal score and keep the top ``limit``.
+
+        Args:
+            index: Current semantic index
+            profile: User profile
+            events: Candidate events
+            limit: Number of events to return
+            anchors: (latitude, longitude) points for the proximity bonus
+                (default: the user's home, if known)
+            diversity: Score subtracted per event already picked from the same
+                category (0 keeps the plain score order)
+            cache: Score the whole index once and reuse it for this profile;
+                one-off rankings (e.g. a batch over many users) pass False to
+                score only the candidates
+
+        Returns:
+            The best events, with score set
+        """
+        if not events:
+            return []
+        rows = [index.row_of(event.event_id) for event in events]
+        if cache:
+            preference = self.preference_scores(index, profile)
+            scores = np.array([preference[row] if row is not None else 0.0 for row in rows], dtype=np.float64)
+        else:
+            scores = np.zeros(len(events), dtype=np.float64)
+            indexed = [i for i, row in enumerate(rows) if row is not None]
+            if indexed:
+                scores[indexed] = self._score_rows(index, profile, np.array([rows[i] for i in indexed]))
+
+        if anchors is None:
+            anchors = [(profile.home_latitude, profile.home_longitude)] if profile.has_home else []
+        if anchors:
+            latitudes = np.array([event.latitude for event in events], dtype=np.float64)
+            longitudes = np.array([event.longitude for event in events], dtype=np.float64)
+            distances = np.min(
+                [_haversine_km(latitude, longitude, latitudes, longitudes) for latitude, longitude in anchors],
+                axis=0,
+            )
+            scores += PROXIMITY_WEIGHT * np.exp(-distances / PROXIMITY_SCALE_KM)
+
+        if diversity > 0:
+            order = _diversified_order(scores, [event.category for event in events], limit, diversity)
+        else:
+            order = np.argsort(-scores, kind="stable")[:limit]
+        ranked = []
+        for i in order:
+            event = events[i]
+            event.score = float(scores[i])
+            ranked.append(event)
+        return ranked
+
+    def clear(self) -> None:
+        self._scores.clear()
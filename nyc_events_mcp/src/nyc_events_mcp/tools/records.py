@@ -0,0 +1,192 @@
+"""
+Compact record types used inside EventsService.
+
+Rows are materialized straight from SQLite tuples into ``__slots__`` objects
+(no per-row dict); dictionaries are only built at the output boundary via
+``to_dict()``. Records also support read-only ``record["field"]`` access so
+callers written against the old dict results keep working.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+# Column order of EventRecord; queries select exactly these columns
+EVENT_FIELDS: Tuple[str, ...] = (
+    "event_id",
+    "title",
+    "category",
+    "date",
+    "start_time_local",
+    "end_time_local",
+    "venue_id",
+    "venue_name",
+    "latitude",
+    "longitude",
+    "neighborhood",
+    "borough",
+    "description",
+    "updated_at",
+)
+
+EVENT_SELECT = ", ".join(EVENT_FIELDS)
+
+VENUE_FIELDS: Tuple[str, ...] = ("venue_id", "name", "latitude", "longitude", "neighborhood", "borough")
+
+VENUE_SELECT = ", ".join(VENUE_FIELDS)
+
+KM_TO_MILES = 0.621371
+
+
+class _Record:
+    """
+    Mapping-style read access shared by the record types.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+class EventRecord(_Record):
+    """
+    A single event, optionally with its distance, estimated travel time and
+    route detour from a query point or route, or its relevance score from a
+    semantic search.
+    """
+
+    __slots__ = EVENT_FIELDS + ("distance_km", "travel_minutes", "detour_km", "score")
+
+    def __init__(
+        self,
+        event_id: str,
+        title: str,
+        category: str,
+        date: str,
+        start_time_local: str,
+        end_time_local: str,
+        venue_id: int,
+        venue_name: str,
+        latitude: float,
+        longitude: float,
+        neighborhood: Optional[str],
+        borough: Optional[str],
+        description: Optional[str],
+        updated_at: Optional[str],
+        distance_km: Optional[float] = None,
+        travel_minutes: Optional[int] = None,
+        detour_km: Optional[float] = None,
+        score: Optional[float] = None,
+    ):
+        self.event_id = event_id
+        self.title = title
+        self.category = category
+        self.date = date
+        self.start_time_local = start_time_local
+        self.end_time_local = end_time_local
+        self.venue_id = venue_id
+        self.venue_name = venue_name
+        self.latitude = latitude
+        self.longitude = longitude
+        self.neighborhood = neighborhood
+        self.borough = borough
+        self.description = description
+        self.updated_at = updated_at
+        self.distance_km = distance_km
+        self.travel_minutes = travel_minutes
+        self.detour_km = detour_km
+        self.score = score
+
+    @classmethod
+    def row_factory(cls, cursor, row: tuple) -> "EventRecord":
+        """sqlite3 row factory for queries selecting EVENT_SELECT (plus the optional proximity columns)."""
+        return cls(*row)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EventRecord":
+        """Rebuild a record from its to_dict() form (e.g. stored recommendations)."""
+        return cls(
+            *(data.get(field) for field in EVENT_FIELDS),
+            distance_km=data.get("distance_km"),
+            travel_minutes=data.get("travel_minutes"),
+            detour_km=data.get("detour_km"),
+            score=data.get("score"),
+        )
+
+    @property
+    def distance_miles(self) -> Optional[float]:
+        """Distance in miles, if the record came from a proximity query."""
+        return None if self.distance_km is None else self.distance_km * KM_TO_MILES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the dictionary shape exposed by the tools.
+
+        Returns:
+            Dictionary with the event fields, plus rounded distances, travel minutes, detour and score when present
+        """
+        result = {field: getattr(self, field) for field in EVENT_FIELDS}
+        if self.distance_km is not None:
+            result["distance_km"] = round(self.distance_km, 2)
+            result["distance_miles"] = round(self.distance_miles, 2)
+        if self.travel_minutes is not None:
+            result["travel_minutes"] = self.travel_minutes
+        if self.detour_km is not None:
+            result["detour_km"] = round(self.detour_km, 2)
+        if self.score is not None:
+            result["score"] = round(self.score, 3)
+        return result
+
+    def __repr__(self) -> str:
+        return f"EventRecord({self.event_id!r}, {self.title!r}, {self.date!r})"
+
+
+class VenueRecord(_Record):
+    """
+    A venue, optionally with its distance from a query point.
+    """
+
+    __slots__ = VENUE_FIELDS + ("distance_km",)
+
+    def __init__(
+        self,
+        venue_id: int,
+        name: str,
+        latitude: float,
+        longitude: float,
+        neighborhood: Optional[str],
+        borough: Optional[str],
+        distance_km: Optional[float] = None,
+    ):
+        self.venue_id = venue_id
+        self.name = name
+        self.latitude = latitude
+        self.longitude = longitude
+        self.neighborhood = neighborhood
+        self.borough = borough
+        self.distance_km = distance_km
+
+    @classmethod
+    def row_factory(cls, cursor, row: tuple) -> "VenueRecord":
+        """sqlite3 row factory for queries selecting VENUE_SELECT."""
+        return cls(*row)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dictionary.
+
+        Returns:
+            Dictionary with the venue fields, plus the rounded distance when present
+        """
+        result = {field: getattr(self, field) for field in VENUE_FIELDS}
+        if self.distance_km is not None:
+            result["distance_km"] = round(self.distance_km, 2)
+        return result
+
+    def __repr__(self) -> str:
+        return f"VenueRecord({self.venue_id!r}, {self.name!r})"
@@ -0,0 +1,110 @@
+"""
+Geometry for corridor searches along a multi-stop route.
+
+A route is a polyline through two or more waypoints. Candidate venues are
+fetched through the venue location index with one bounding box per short
+piece of the route (a single box around a long diagonal leg would cover
+mostly irrelevant area), then exact point-to-segment distances and detour
+costs are computed for all candidates and segments at once.
+
+Distances use an equirectangular projection around the route, which is
+accurate to well under 1% at city scale.
+"""
+
+import math
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# Route pieces longer than this get their own bounding box
+BOX_PIECE_KM = 1.0
+
+# Upper bound on bounding boxes per query; longer routes use longer pieces
+MAX_BOXES = 64
+
+_KM_PER_DEG_LAT = 110.574
+_KM_PER_DEG_LON_EQUATOR = 111.320
+
+Point = Tuple[float, float]
+
+
+def _project(waypoints: np.ndarray, latitudes: np.ndarray, longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Local km coordinates (x east, y north) around the route's mean latitude
+    origin_lat, origin_lon = waypoints[:, 0].mean(), waypoints[:, 1].mean()
+    km_per_deg_lon = _KM_PER_DEG_LON_EQUATOR * math.cos(math.radians(origin_lat))
+    route = np.column_stack([
+        (waypoints[:, 1] - origin_lon) * km_per_deg_lon,
+        (waypoints[:, 0] - origin_lat) * _KM_PER_DEG_LAT,
+    ])
+    points = np.column_stack([
+        (np.asarray(longitudes, dtype=np.float64) - origin_lon) * km_per_deg_lon,
+        (np.asarray(latitudes, dtype=np.float64) - origin_lat) * _KM_PER_DEG_LAT,
+    ])
+    return route, points
+
+
+def corridor_boxes(waypoints: Sequence[Point], corridor_km: float) -> List[Tuple[float, float, float, float]]:
+    """
+    Bounding boxes that together cover the corridor around a route.
+
+    Args:
+        waypoints: (latitude, longitude) points, at least two
+        corridor_km: Half-width of the corridor
+
+    Returns:
+        List of (min_lat, max_lat, min_lon, max_lon) boxes
+    """
+    route = np.asarray(waypoints, dtype=np.float64)
+    projected, _ = _project(route, route[:, 0], route[:, 1])
+    lengths = np.hypot(*(projected[1:] - projected[:-1]).T)
+    piece_km = max(BOX_PIECE_KM, lengths.sum() / MAX_BOXES)
+
+    lat_pad = corridor_km / _KM_PER_DEG_LAT
+    boxes = []
+    for (start, end), length in zip(zip(route[:-1], route[1:]), lengths):
+        pieces = max(1, math.ceil(length / piece_km))
+        stops = start + np.linspace(0.0, 1.0, pieces + 1)[:, None] * (end - start)
+        for a, b in zip(stops[:-1], stops[1:]):
+            lon_pad = corridor_km / (_KM_PER_DEG_LON_EQUATOR * max(math.cos(math.radians(max(abs(a[0]), abs(b[0])))), 0.01))
+            boxes.append((
+                min(a[0], b[0]) - lat_pad, max(a[0], b[0]) + lat_pad,
+                min(a[1], b[1]) - lon_pad, max(a[1], b[1]) + lon_pad,
+            ))
+    return boxes
+
+
+def route_distances(
+    waypoints: Sequence[Point],
+    latitudes: Sequence[float],
+    longitudes: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distance of each point from the route and the detour needed to visit it.
+
+    The detour is taken on the cheapest leg: stepping off leg A-B to visit P
+    costs |AP| + |PB| - |AB| extra.
+
+    Args:
+        waypoints: (latitude, longitude) points, at least two
+        latitudes: Point latitudes
+        longitudes: Point longitudes
+
+    Returns:
+        Tuple of (distance_km, detour_km) arrays aligned with the points
+    """
+    route, points = _project(np.asarray(waypoints, dtype=np.float64), latitudes, longitudes)
+    starts, ends = route[:-1], route[1:]              # (segments, 2)
+    legs = ends - starts
+    leg_lengths = np.hypot(legs[:, 0], legs[:, 1])
+
+    # Points x segments, vectorized
+    offsets = points[:, None, :] - starts[None, :, :]
+    squared = np.maximum(leg_lengths ** 2, 1e-12)
+    t = np.clip(np.einsum("psk,sk->ps", offsets, legs) / squared, 0.0, 1.0)
+    closest = starts[None, :, :] + t[:, :, None] * legs[None, :, :]
+    distances = np.hypot(*(points[:, None, :] - closest).transpose(2, 0, 1)).min(axis=1)
+
+    to_start = np.hypot(offsets[..., 0], offsets[..., 1])
+    to_end = np.hypot(*(points[:, None, :] - ends[None, :, :]).transpose(2, 0, 1))
+    detours = (to_start + to_end - leg_lengths[None, :]).min(axis=1)
+    return distances, np.maximum(detours, 0.0)
@@ -0,0 +1,255 @@
+"""
+Saved searches: standing queries matched against new and changed events.
+
+A saved search is a conjunction of optional predicates: keywords (every
+word must appear in the title, description or venue name, compared after
+the semantic tokenizer's stemming), category, neighborhood, borough and a
+radius around a point.
+
+After an ingest, only the event changes since the matcher's last run are
+read (the changed_since listing) and each changed event is checked against
+the few searches that can match it rather than every search. An inverted
+index files each search under one key of its most selective predicate:
+    1. its longest keyword            ("word", "jazz")
+    2. the grid cells its radius covers ("cell", x, y)
+    3. its neighborhood or borough    ("neighborhood", "williamsburg")
+    4. its category                   ("category", "music")
+and a changed event only looks up the keys it carries (its words, its cell,
+its area and its category). Candidates are then checked against all their
+predicates. Searches with no predicate at all match every event.
+
+Matches are stored in the preferences database; the server reads new ones
+and notifies clients subscribed to the search's resource
+(``searches://<user_id>/<search_id>``).
+"""
+
+import logging
+import math
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .events_service import EventsService
+from .records import EventRecord
+from .user_prefs import PrefsStore
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# Side of an area index cell in degrees (~2km)
+AREA_CELL_DEG = 0.02
+
+# Changed events read per page while matching
+MATCH_PAGE_SIZE = 1000
+
+# Resource URI scheme of saved searches
+SEARCH_URI_SCHEME = "searches"
+
+# Predicates of a saved search, as accepted by the save_search tool
+SEARCH_PREDICATES = ("query", "category", "neighborhood", "borough", "latitude", "longitude", "radius_km")
+
+_EARTH_RADIUS_KM = 6371.0
+
+
+def search_uri(user_id: str, search_id: int) -> str:
+    """Return the resource URI of a saved search."""
+    return f"{SEARCH_URI_SCHEME}://{user_id}/{search_id}"
+
+
+def parse_search_uri(uri: str) -> Tuple[str, int]:
+    """
+    Split a saved search resource URI.
+
+    Args:
+        uri: URI of the form searches://<user_id>/<search_id>
+
+    Returns:
+        Tuple of (user_id, search_id); raises ValueError for other URIs
+    """
+    prefix = f"{SEARCH_URI_SCHEME}://"
+    user_id, _, search_id = uri[len(prefix):].rpartition("/") if uri.startswith(prefix) else ("", "", "")
+    if not user_id or not search_id.isdigit():
+        raise ValueError(f"Not a saved search URI: {uri}")
+    return user_id, int(search_id)
+
+
+def _cell(latitude: float, longitude: float) -> Tuple[int, int]:
+    return math.floor(longitude / AREA_CELL_DEG), math.floor(latitude / AREA_CELL_DEG)
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _event_words(event: EventRecord) -> Set[str]:
+    # Imported here: the semantic module pulls in NumPy, which server startup avoids
+    from .semantic import tokenize
+
+    return set(tokenize(f"{event.title or ''} {event.description or ''} {event.venue_name or ''}"))
+
+
+class SavedSearch:
+    """
+    One saved search with its predicates prepared for matching.
+    """
+
+    __slots__ = (
+        "search_id", "user_id", "created_at", "keywords", "category", "neighborhood", "borough",
+        "latitude", "longitude", "radius_km",
+    )
+
+    def __init__(self, search: Dict[str, Any]):
+        """
+        Args:
+            search: Stored saved search (see PrefsStore.saved_searches)
+        """
+        from .semantic import tokenize
+
+        self.search_id = search["search_id"]
+        self.user_id = search["user_id"]
+        self.created_at = search["created_at"]
+        self.keywords = set(tokenize(search.get("query") or ""))
+        self.category = (search.get("category") or "").lower() or None
+        self.neighborhood = (search.get("neighborhood") or "").strip().lower() or None
+        self.borough = (search.get("borough") or "").strip().lower() or None
+        self.latitude = search.get("latitude")
+        self.longitude = search.get("longitude")
+        self.radius_km = search.get("radius_km")
+
+    @property
+    def has_radius(self) -> bool:
+        return self.latitude is not None and self.longitude is not None and self.radius_km is not None
+
+    def index_keys(self) -> List[Hashable]:
+        """Keys of the most selective predicate; an empty list means the search matches every event."""
+        if self.keywords:
+            # Longest word as a cheap stand-in for the rarest one
+            return [("word", max(sorted(self.keywords), key=len))]
+        if self.has_radius:
+            lat_pad = self.radius_km / 111.0
+            lon_pad = self.radius_km / (111.0 * max(math.cos(math.radians(self.latitude)), 0.01))
+            min_x, min_y = _cell(self.latitude - lat_pad, self.longitude - lon_pad)
+            max_x, max_y = _cell(self.latitude + lat_pad, self.longitude + lon_pad)
+            return [("cell", x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+        if self.neighborhood:
+            return [("neighborhood", self.neighborhood)]
+        if self.borough:
+            return [("borough", self.borough)]
+        if self.category:
+            return [("category", self.category)]
+        return []
+
+    def matches(self, event: EventRecord, words: Optional[Set[str]] = None) -> bool:
+        """
+        Check every predicate against an event.
+
+        Args:
+            event: Changed event
+            words: The event's tokens, if already computed
+
+        Returns:
+            True if the event matches and changed after the search was saved
+        """
+        if event.updated_at is not None and event.updated_at <= self.created_at:
+            return False
+        if self.category and (event.category or "").lower() != self.category:
+            return False
+        if self.neighborhood and (event.neighborhood or "").lower() != self.neighborhood:
+            return False
+        if self.borough and (event.borough or "").lower() != self.borough:
+            return False
+        if self.has_radius and (
+            event.latitude is None
+            or _haversine_km(self.latitude, self.longitude, event.latitude, event.longitude) > self.radius_km
+        ):
+            return False
+        if self.keywords:
+            words = _event_words(event) if words is None else words
+            if not self.keywords <= words:
+                return False
+        return True
+
+
+class SearchIndex:
+    """
+    Inverted index from predicate keys to the saved searches filed under them.
+    """
+
+    def __init__(self, searches: Iterable[SavedSearch]):
+        self.postings: Dict[Hashable, List[SavedSearch]] = defaultdict(list)
+        self.match_all: List[SavedSearch] = []
+        self.size = 0
+        for search in searches:
+            self.size += 1
+            keys = search.index_keys()
+            if not keys:
+                self.match_all.append(search)
+            for key in keys:
+                self.postings[key].append(search)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def match(self, event: EventRecord) -> List[SavedSearch]:
+        """
+        Saved searches matching an event.
+
+        Args:
+            event: Changed event
+
+        Returns:
+            Matching searches, in no particular order
+        """
+        words = _event_words(event)
+        keys: List[Hashable] = [("word", word) for word in words]
+        if event.category:
+            keys.append(("category", event.category.lower()))
+        if event.neighborhood:
+            keys.append(("neighborhood", event.neighborhood.lower()))
+        if event.borough:
+            keys.append(("borough", event.borough.lower()))
+        if event.latitude is not None and event.longitude is not None:
+            keys.append(("cell", *_cell(event.latitude, event.longitude)))
+
+        candidates: Dict[int, SavedSearch] = {search.search_id: search for search in self.match_all}
+        for key in keys:
+            for search in self.postings.get(key, ()):
+                candidates[search.search_id] = search
+        return [search for search in candidates.values() if search.matches(event, words)]
+
+
+async def match_saved_searches(events_service: EventsService, store: PrefsStore) -> int:
+    """
+    Match the events changed since the last run against all saved searches.
+
+    Args:
+        events_service: Service over the events database
+        store: Preferences store holding the saved searches and their matches
+
+    Returns:
+        Number of new matches (an event already matched to a search is not matched again)
+    """
+    searches = [SavedSearch(search) for search in store.saved_searches()]
+    if not searches:
+        return 0
+
+    # The first run starts at the oldest search: nothing earlier can match
+    cursor = store.match_cursor() or min(search.created_at for search in searches)
+    index = SearchIndex(searches)
+    added = 0
+    while True:
+        changes = await events_service.get_event_changes(cursor, limit=MATCH_PAGE_SIZE)
+        pairs = [
+            (search.search_id, event.event_id)
+            for event in changes["events"]
+            for search in index.match(event)
+        ]
+        cursor = changes["next_changed_since"]
+        # Each page commits its matches together with the cursor, so a crash resumes cleanly
+        added += store.add_search_matches(pairs, cursor)
+        if changes["complete"]:
+            break
+
+    logger.info(f"Matched changed events against {len(index)} saved search(es): {added} new match(es)")
+    return added
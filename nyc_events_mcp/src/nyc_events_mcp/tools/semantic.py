@@ -0,0 +1,613 @@
+"""
+Offline semantic index over event titles and descriptions.
+
+Each event's title, category and description are turned into TF-IDF weighted
+features (word unigrams, word bigrams and character trigrams, so "meetups"
+still lands near "Meetup") over the vocabulary of the events themselves, and
+L2-normalized. Every feature has its own column, so unrelated words never
+share weight. Recurring events share one text; texts are stored as sparse
+rows and, for queries, as per-feature posting lists, so a query only touches
+the texts containing one of its features. Queries are expanded with a small
+built-in table that also maps interests onto categories ("sports" looks for
+"football", "live jazz" for "music"). Nothing needs network access or a
+model download.
+
+The index is saved next to the database (``<db>.semantic.npz``) together
+with a signature of the events table. Changed events are applied
+incrementally; a full rebuild happens only after substantial churn.
+
+Usage:
+    python -m nyc_events_mcp.tools.semantic [--db events.sqlite]
+"""
+
+import argparse
+import copy
+import logging
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# Character trigrams count less than whole words
+CHAR_NGRAM_WEIGHT = 0.5
+
+# Weight of synonym terms added to a query, relative to the query's own words
+EXPANSION_WEIGHT = 0.5
+
+# Bump when features or the file layout change so stale index files are rebuilt
+INDEX_FORMAT = 3
+
+# Full rebuild once appended or dead rows exceed this share of the last build
+REBUILD_FRACTION = 0.2
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "at", "by", "for", "from", "in", "is", "it",
+    "of", "on", "or", "the", "this", "to", "with",
+})
+
+# Stemmed query term -> related terms found in event text, including the
+# category an interest falls under (meetups are listed as pop-ups)
+QUERY_EXPANSIONS: Dict[str, str] = {
+    "sport": "football game match watch party",
+    "soccer": "football match",
+    "tech": "technology meetup pop up",
+    "meetup": "tech meetup pop up",
+    "networking": "meetup pop up",
+    "movie": "movies film cinema screening",
+    "film": "movies cinema screening",
+    "cinema": "movies film screening",
+    "concert": "music live",
+    "gig": "music live set",
+    "jazz": "music live club",
+    "band": "music live",
+    "dj": "music night",
+    "art": "museum gallery exhibit",
+    "museum": "gallery exhibit curator",
+    "gallery": "museum exhibit",
+    "market": "pop up sale",
+    "shopping": "pop up market sale",
+}
+
+
+def _stem(word: str) -> str:
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase, split on non-alphanumerics, drop stopwords and stem plurals.
+
+    Args:
+        text: Free text
+
+    Returns:
+        List of normalized words
+    """
+    return [_stem(word) for word in TOKEN_RE.findall(text.lower()) if word not in STOPWORDS]
+
+
+def extract_features(words: List[str], weight: float = 1.0) -> Counter:
+    """
+    Count word, bigram and character trigram features of a token list.
+
+    Args:
+        words: Output of tokenize()
+        weight: Multiplier for every feature
+
+    Returns:
+        Counter of feature -> raw term frequency
+    """
+    features: Counter = Counter()
+    for word in words:
+        features["w:" + word] += weight
+        padded = f"<{word}>"
+        for i in range(len(padded) - 2):
+            features["c:" + padded[i:i + 3]] += weight * CHAR_NGRAM_WEIGHT
+    for first, second in zip(words, words[1:]):
+        features[f"b:{first} {second}"] += weight
+    return features
+
+
+def _tf(count: float) -> float:
+    # Sublinear term frequency; fractional weights (trigrams, expansions) pass through
+    return 1.0 + math.log(count) if count > 1 else count
+
+
+def _vectorize(
+    features: Counter,
+    vocabulary: Dict[str, int],
+    idf: np.ndarray,
+    unseen_idf: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TF-IDF weight the features and L2-normalize.
+
+    Features outside the vocabulary count towards the norm (so a query that
+    is mostly unknown words scores low) but are not returned.
+
+    Returns:
+        Tuple of (vocabulary columns, weights), sorted by column
+    """
+    columns = []
+    weights = []
+    norm = 0.0
+    for feature, count in features.items():
+        column = vocabulary.get(feature)
+        weight = _tf(count) * (idf[column] if column is not None else unseen_idf)
+        norm += weight * weight
+        if column is not None:
+            columns.append(column)
+            weights.append(weight)
+    columns = np.array(columns, dtype=np.int32)
+    weights = np.array(weights, dtype=np.float32)
+    if norm > 0:
+        weights /= math.sqrt(norm)
+    order = np.argsort(columns)
+    return columns[order], weights[order]
+
+
+def index_path(db_path: str) -> str:
+    """Return where the semantic index of a database is stored."""
+    return db_path + ".semantic.npz"
+
+
+def database_signature(conn: sqlite3.Connection) -> Tuple[int, int, int]:
+    """
+    Cheap fingerprint of the events table used to detect a stale index.
+
+    INSERT OR REPLACE (what ingest uses) assigns a new rowid, so updates
+    move MAX(rowid) and deletes change the count. A plain UPDATE that keeps
+    the rowid is not detected.
+
+    Returns:
+        Tuple of (index format, event count, max rowid)
+    """
+    count, max_rowid = conn.execute("SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM events").fetchone()
+    return (INDEX_FORMAT, count, max_rowid)
+
+
+def _row_features(rows: List[tuple]) -> Tuple[List[Counter], np.ndarray]:
+    """
+    Extract features for (event_id, category, date, title, description) rows.
+
+    Identical texts (common for recurring events) are processed once.
+
+    Returns:
+        Tuple of (features per distinct text, distinct text index per row)
+    """
+    text_ids: Dict[str, int] = {}
+    text_features: List[Counter] = []
+    row_texts = np.empty(len(rows), dtype=np.int64)
+    for i, (_, category, _, title, description) in enumerate(rows):
+        text = f"{title} {category} {description or ''}"
+        text_id = text_ids.get(text)
+        if text_id is None:
+            text_id = text_ids[text] = len(text_features)
+            text_features.append(extract_features(tokenize(text)))
+        row_texts[i] = text_id
+    return text_features, row_texts
+
+
+def _text_rows(
+    text_features: List[Counter],
+    vocabulary: Dict[str, int],
+    idf: np.ndarray,
+    unseen_idf: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorize texts into sparse rows.
+
+    Returns:
+        Tuple of (row lengths, columns, weights), rows concatenated
+    """
+    lengths = np.zeros(len(text_features), dtype=np.int64)
+    columns = []
+    weights = []
+    for text_id, features in enumerate(text_features):
+        text_columns, text_weights = _vectorize(features, vocabulary, idf, unseen_idf)
+        lengths[text_id] = len(text_columns)
+        columns.append(text_columns)
+        weights.append(text_weights)
+    if not columns:
+        return lengths, np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    return lengths, np.concatenate(columns), np.concatenate(weights)
+
+
+_ROW_QUERY = "SELECT event_id, category, date, title, description FROM events"
+
+
+class SemanticIndex:
+    """
+    Sparse normalized event vectors plus the columns needed to filter them.
+
+    Each row points at one distinct text (``row_texts``); texts are stored
+    as sparse rows over the vocabulary (``text_offsets``, ``text_columns``,
+    ``text_weights``). Rows are append-only between full builds: new and
+    updated events are appended using the IDF weights of the last build
+    (features first seen then get the weight of an unseen feature), and
+    replaced or deleted events are marked dead in ``alive``. ``build_id``
+    changes only on a full build, so callers caching per-row data (e.g.
+    per-user scores) can extend their cache with the appended rows instead
+    of recomputing it.
+    """
+
+    def __init__(
+        self,
+        event_ids: np.ndarray,
+        categories: np.ndarray,
+        dates: np.ndarray,
+        row_texts: np.ndarray,
+        text_offsets: np.ndarray,
+        text_columns: np.ndarray,
+        text_weights: np.ndarray,
+        features: List[str],
+        idf: np.ndarray,
+        unseen_idf: float,
+        signature: Tuple[int, int, int],
+        alive: Optional[np.ndarray] = None,
+        built_rows: Optional[int] = None,
+        build_id: Optional[int] = None
+    ):
+        self.event_ids = event_ids
+        self.categories = categories
+        self.dates = dates
+        self.row_texts = row_texts
+        self.text_offsets = text_offsets
+        self.text_columns = text_columns
+        self.text_weights = text_weights
+        self.vocabulary = {feature: column for column, feature in enumerate(features)}
+        self.idf = idf
+        self.unseen_idf = float(unseen_idf)
+        self.signature = tuple(int(value) for value in signature)
+        self.alive = alive if alive is not None else np.ones(len(event_ids), dtype=bool)
+        self.built_rows = len(event_ids) if built_rows is None else int(built_rows)
+        self.build_id = time.time_ns() if build_id is None else int(build_id)
+        self._rows: Optional[Dict[str, int]] = None
+        self._postings: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.event_ids)
+
+    def copy(self) -> "SemanticIndex":
+        """Shallow copy that refresh() can update without changing this index."""
+        other = copy.copy(self)
+        other.alive = self.alive.copy()
+        other.vocabulary = dict(self.vocabulary)
+        return other
+
+    @property
+    def text_count(self) -> int:
+        return len(self.text_offsets) - 1
+
+    @classmethod
+    def build(cls, conn: sqlite3.Connection) -> "SemanticIndex":
+        """
+        Build the index from every event in the database.
+
+        Args:
+            conn: Open SQLite connection
+
+        Returns:
+            A new SemanticIndex
+        """
+        signature = database_signature(conn)
+        rows = conn.execute(f"{_ROW_QUERY} ORDER BY rowid").fetchall()
+        text_features, row_texts = _row_features(rows)
+
+        # Document frequency counts every event, not just every distinct text
+        text_counts = np.bincount(row_texts, minlength=len(text_features))
+        document_frequency: Counter = Counter()
+        for text_id, features in enumerate(text_features):
+            count = int(text_counts[text_id])
+            for feature in features:
+                document_frequency[feature] += count
+
+        n = len(rows)
+        features = sorted(document_frequency)
+        vocabulary = {feature: column for column, feature in enumerate(features)}
+        frequencies = np.array([document_frequency[feature] for feature in features], dtype=np.float64)
+        idf = (np.log((1.0 + n) / (1.0 + frequencies)) + 1.0).astype(np.float32)
+        unseen_idf = math.log(1.0 + n) + 1.0
+        lengths, columns, weights = _text_rows(text_features, vocabulary, idf, unseen_idf)
+
+        return cls(
+            event_ids=np.array([row[0] for row in rows], dtype=str),
+            categories=np.array([row[1] for row in rows], dtype=str),
+            dates=np.array([row[2] for row in rows], dtype="U10"),
+            row_texts=row_texts,
+            text_offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+            text_columns=columns,
+            text_weights=weights,
+            features=features,
+            idf=idf,
+            unseen_idf=unseen_idf,
+            signature=signature,
+        )
+
+    def refresh(self, conn: sqlite3.Connection) -> bool:
+        """
+        Bring the index up to date incrementally.
+
+        Events with a rowid above the last one seen (inserts and INSERT OR
+        REPLACE updates) are appended; their previous rows and deleted
+        events are marked dead.
+
+        Args:
+            conn: Open SQLite connection
+
+        Returns:
+            False if the index cannot be updated incrementally and needs a full build
+        """
+        signature = database_signature(conn)
+        if signature == self.signature:
+            return True
+        if signature[0] != self.signature[0] or signature[2] < self.signature[2]:
+            return False
+
+        rows = conn.execute(f"{_ROW_QUERY} WHERE rowid > ? ORDER BY rowid", (self.signature[2],)).fetchall()
+        if rows:
+            new_ids = np.array([row[0] for row in rows], dtype=str)
+            self.alive &= ~np.isin(self.event_ids, new_ids)
+            text_features, row_texts = _row_features(rows)
+
+            # Features never seen before get their own column at the unseen weight
+            new_features = sorted({f for features in text_features for f in features} - self.vocabulary.keys())
+            for feature in new_features:
+                self.vocabulary[feature] = len(self.vocabulary)
+            self.idf = np.concatenate([self.idf, np.full(len(new_features), self.unseen_idf, dtype=np.float32)])
+
+            lengths, columns, weights = _text_rows(text_features, self.vocabulary, self.idf, self.unseen_idf)
+            self.row_texts = np.concatenate([self.row_texts, row_texts + self.text_count])
+            self.text_offsets = np.concatenate([self.text_offsets, self.text_offsets[-1] + np.cumsum(lengths)])
+            self.text_columns = np.concatenate([self.text_columns, columns])
+            self.text_weights = np.concatenate([self.text_weights, weights])
+            self.event_ids = np.concatenate([self.event_ids, new_ids])
+            self.categories = np.concatenate([self.categories, np.array([row[1] for row in rows], dtype=str)])
+            self.dates = np.concatenate([self.dates, np.array([row[2] for row in rows], dtype="U10")])
+            self.alive = np.concatenate([self.alive, np.ones(len(rows), dtype=bool)])
+            self._postings = None
+
+        if int(self.alive.sum()) != signature[1]:
+            live = np.array([row[0] for row in conn.execute("SELECT event_id FROM events")], dtype=str)
+            self.alive &= np.isin(self.event_ids, live)
+            if int(self.alive.sum()) != signature[1]:
+                # Rows we never saw (e.g. rowids reused after VACUUM)
+                return False
+
+        self.signature = signature
+        self._rows = None
+        return True
+
+    def needs_rebuild(self) -> bool:
+        """True once appended or dead rows make the frozen IDF weights drift too far."""
+        drift = (len(self) - self.built_rows) + int((~self.alive[:self.built_rows]).sum())
+        return drift > REBUILD_FRACTION * max(self.built_rows, 1)
+
+    def row_of(self, event_id: str) -> Optional[int]:
+        """Index row of a live event, or None if it is not indexed."""
+        if self._rows is None:
+            self._rows = {str(self.event_ids[i]): int(i) for i in np.flatnonzero(self.alive)}
+        return self._rows.get(event_id)
+
+    def save(self, path: str) -> None:
+        """
+        Write the index atomically to path.
+        """
+        features = sorted(self.vocabulary, key=self.vocabulary.get)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                event_ids=self.event_ids,
+                categories=self.categories,
+                dates=self.dates,
+                row_texts=self.row_texts,
+                text_offsets=self.text_offsets,
+                text_columns=self.text_columns,
+                text_weights=self.text_weights,
+                features=np.array(features, dtype=str),
+                idf=self.idf,
+                unseen_idf=np.float64(self.unseen_idf),
+                alive=self.alive,
+                signature=np.array(self.signature, dtype=np.int64),
+                built_rows=np.int64(self.built_rows),
+                build_id=np.int64(self.build_id),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SemanticIndex":
+        """
+        Read an index written by save().
+        """
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["signature"][0]) != INDEX_FORMAT:
+                raise ValueError(f"index format {int(data['signature'][0])} is not {INDEX_FORMAT}")
+            return cls(
+                event_ids=data["event_ids"],
+                categories=data["categories"],
+                dates=data["dates"],
+                row_texts=data["row_texts"],
+                text_offsets=data["text_offsets"],
+                text_columns=data["text_columns"],
+                text_weights=data["text_weights"],
+                features=data["features"].tolist(),
+                idf=data["idf"],
+                unseen_idf=float(data["unseen_idf"]),
+                signature=tuple(data["signature"]),
+                alive=data["alive"],
+                built_rows=data["built_rows"],
+                build_id=data["build_id"],
+            )
+
+    def embed_query(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorize a query, adding synonym expansions at reduced weight.
+
+        Returns:
+            Tuple of (vocabulary columns, weights)
+        """
+        words = tokenize(query)
+        features = extract_features(words)
+        for word in words:
+            expansion = QUERY_EXPANSIONS.get(word)
+            if expansion:
+                features.update(extract_features(tokenize(expansion), EXPANSION_WEIGHT))
+        return _vectorize(features, self.vocabulary, self.idf, self.unseen_idf)
+
+    def _get_postings(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Column-major copy of the text rows: per feature, the texts containing it
+        if self._postings is None:
+            lengths = np.diff(self.text_offsets)
+            entry_texts = np.repeat(np.arange(self.text_count, dtype=np.int32), lengths)
+            order = np.argsort(self.text_columns, kind="stable")
+            counts = np.bincount(self.text_columns, minlength=len(self.vocabulary))
+            offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+            self._postings = (offsets, entry_texts[order], self.text_weights[order])
+        return self._postings
+
+    def score(self, query_vector: Tuple[np.ndarray, np.ndarray], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Cosine similarity of index rows to a vector from embed_query().
+
+        Args:
+            query_vector: Output of embed_query()
+            rows: Index rows to score (default: all)
+
+        Returns:
+            float32 array of scores aligned with rows
+        """
+        offsets, texts, weights = self._get_postings()
+        text_scores = np.zeros(self.text_count, dtype=np.float32)
+        for column, weight in zip(*query_vector):
+            start, end = offsets[column], offsets[column + 1]
+            # A text appears at most once per feature, so plain indexing adds correctly
+            text_scores[texts[start:end]] += weight * weights[start:end]
+        return text_scores[self.row_texts if rows is None else self.row_texts[rows]]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        category: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        min_score: float = 0.0
+    ) -> List[Tuple[str, float]]:
+        """
+        Top-k events by cosine similarity to the query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            category: Optional category filter
+            start_date: Optional start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+            min_score: Drop results scoring below this
+
+        Returns:
+            List of (event_id, score), best first
+        """
+        if not len(self) or limit <= 0:
+            return []
+        scores = self.score(self.embed_query(query))
+
+        mask = self.alive.copy()
+        if category:
+            mask &= self.categories == category.lower()
+        if start_date:
+            mask &= self.dates >= start_date
+        if end_date:
+            mask &= self.dates <= end_date
+        scores = np.where(mask, scores, -np.inf)
+
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(str(self.event_ids[i]), float(scores[i])) for i in top if scores[i] >= min_score]
+
+
+def load_or_build(db_path: str, index: Optional[SemanticIndex] = None) -> SemanticIndex:
+    """
+    Return an up-to-date index for a database.
+
+    Starts from the given in-memory index or the persisted one, applies
+    event changes incrementally and falls back to a full build when the
+    index is missing, unreadable or has drifted too far. Changes are applied
+    to a copy, so the given index can keep serving searches meanwhile.
+
+    Args:
+        db_path: Events database path
+        index: Index already held in memory, if any
+
+    Returns:
+        An up-to-date SemanticIndex
+    """
+    path = index_path(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        if index is not None:
+            index = index.copy()
+        elif os.path.exists(path):
+            try:
+                index = SemanticIndex.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable semantic index {path}: {e}")
+
+        if index is not None:
+            previous = index.signature
+            if index.refresh(conn) and not index.needs_rebuild():
+                if index.signature != previous:
+                    logger.info(f"Updated semantic index incrementally to {len(index)} rows")
+                    _save(index, path)
+                # Pay for the query-side layout here rather than in the first search
+                index._get_postings()
+                return index
+            logger.info("Semantic index is stale, rebuilding")
+
+        started = time.perf_counter()
+        index = SemanticIndex.build(conn)
+    finally:
+        conn.close()
+
+    logger.info(f"Built semantic index of {len(index)} events in {time.perf_counter() - started:.2f}s")
+    _save(index, path)
+    index._get_postings()
+    return index
+
+
+def _save(index: SemanticIndex, path: str) -> None:
+    try:
+        index.save(path)
+    except OSError as e:
+        logger.warning(f"Could not persist semantic index to {path}: {e}")
+
+
+def main() -> None:
+    from .events_service import default_db_path
+
+    parser = argparse.ArgumentParser(description="Build the semantic index for an events database")
+    parser.add_argument("--db", default=None, help="SQLite database path (default: bundled events database)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db_path = args.db or default_db_path()
+    index = load_or_build(db_path)
+    print(f"{index_path(db_path)}: {len(index)} events, {index.text_count} distinct texts, {len(index.vocabulary)} features")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Structured event results for programmatic clients.
+
+A tools/call whose ``_meta`` carries ``"structured": true`` gets the events
+the tool returned as ``structuredContent`` next to the usual text:
+``{"events": [...], "truncated": bool}`` with each event in the
+``EventRecord.to_dict()`` shape. Clients such as ``nyc_events_mcp.client``
+then get typed records without parsing the text. Tools that return no event
+list, and calls that fail, carry no structured content. Calls without the
+flag are unchanged.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List, Optional
+
+from .records import EventRecord
+
+
+class CollectedEvents:
+    """
+    Events a tool call returned; ``events`` stays None if the tool reported none.
+    """
+
+    def __init__(self):
+        self.events: Optional[List[EventRecord]] = None
+
+
+_current: ContextVar[Optional[CollectedEvents]] = ContextVar("collected_events", default=None)
+
+
+@contextmanager
+def collecting_events(enabled: bool) -> Iterator[Optional[CollectedEvents]]:
+    """
+    Collect the events tool handlers report via collect_events() within this block.
+
+    Args:
+        enabled: Whether the client asked for structured results; yields None otherwise
+    """
+    collected = CollectedEvents() if enabled else None
+    token = _current.set(collected)
+    try:
+        yield collected
+    finally:
+        _current.reset(token)
+
+
+def collect_events(events: Iterable[EventRecord]) -> None:
+    """
+    Report events returned to the user; a no-op unless the client asked for structured results.
+    """
+    collected = _current.get()
+    if collected is not None:
+        if collected.events is None:
+            collected.events = []
+        collected.events.extend(events)
@@ -21,6 +21,9 @@ class ToolHandler(ABC):
     description, and execution across the NYC Events MCP server.
     """
     
+    # Seconds a call may run before it is cut short (None: the server default)
+    deadline_s: float | None = None
+    
     def __init__(self, tool_name: str):
         """
         Initialize a tool handler with a unique name.
@@ -6,21 +6,137 @@ This module contains all event-specific tool implementations.
 import json
 import logging
 from collections.abc import Sequence
+from datetime import date
+from typing import TYPE_CHECKING
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 from .toolhandler import ToolHandler
-from .events_service import EventsService
+from .popularity import observe
+from .progress import ProgressReporter, current_progress
+from .structured import collect_events
+
+# The events service (and the database layer behind it) loads on the first
+# tool call, not when list_tools imports this module
+if TYPE_CHECKING:
+    from .events_service import EventsService
 
 logger = logging.getLogger("nyc-events-mcp")
 
+# Shared input schema for the optional personalized ranking of list tools
+RANK_FOR_USER_PROPERTY = {
+    "type": "string",
+    "description": "User id whose interests, diet and home location rank the matches; returns the "
+                   "top `limit` personalized events instead of the first ones (optional, e.g. 'default')"
+}
+
+# Shared area filters; names are matched case-insensitively (see get_neighborhoods)
+NEIGHBORHOOD_PROPERTY = {
+    "type": "string",
+    "description": "Only events in this neighborhood, e.g. 'Williamsburg', 'East Village' (optional)"
+}
+BOROUGH_PROPERTY = {
+    "type": "string",
+    "description": "Only events in this borough: Manhattan, Brooklyn, Queens, Bronx, Staten Island (optional)"
+}
+
+# Shared delta-polling argument of the list tools
+CHANGED_SINCE_PROPERTY = {
+    "type": "string",
+    "description": (
+        "Only return events added, changed or cancelled after this time (ISO timestamp, e.g. "
+        "'2025-10-20T08:00:00Z'), or the next_changed_since value of a previous call. Changes come "
+        "in the order they happened; rank_for_user, sort and facets are not applied (optional)"
+    )
+}
+
+# Shared result order of the list tools
+SORT_PROPERTY = {
+    "type": "string",
+    "description": "Result order: chronological, or trending (most viewed by users recently; ignored with rank_for_user)",
+    "enum": ["date", "trending"],
+    "default": "date"
+}
+
+
+class EventsToolHandler(ToolHandler):
+    """
+    Base class for tool handlers backed by the events database.
+
+    The EventsService is resolved lazily so registering handlers (and
+    answering list_tools) never touches the database.
+    """
+
+    def __init__(self, tool_name: str):
+        super().__init__(tool_name)
+        self._events_service: "EventsService | None" = None
+
+    @property
+    def events_service(self) -> "EventsService":
+        """The EventsService used by this handler (shared by default)."""
+        if self._events_service is None:
+            from .events_service import get_events_service
+
+            self._events_service = get_events_service()
+        return self._events_service
+
+    @events_service.setter
+    def events_service(self, service: "EventsService") -> None:
+        self._events_service = service
+
+    @staticmethod
+    def reordered(args: dict) -> bool:
+        """Whether matches are reordered after the query (ranked for a user or by popularity)."""
+        return bool(args.get("rank_for_user")) or args.get("sort") == "trending"
+
+    def candidate_limit(self, args: dict, limit: int) -> int:
+        """Number of matches to fetch: a wider pool when they will be ranked for a user or by popularity."""
+        from .events_service import RANK_CANDIDATES
+
+        return max(limit, RANK_CANDIDATES) if self.reordered(args) else limit
 
-class SearchEventsToolHandler(ToolHandler):
+    def progress(self, args: dict) -> ProgressReporter | None:
+        """
+        Reporter for streaming results as progress notifications, when the client asked for progress.
+
+        Candidates that will be reordered are not the final results, so they are not streamed.
+        """
+        return None if self.reordered(args) else current_progress()
+
+    async def personalize(self, args: dict, events: list, limit: int) -> list:
+        """
+        Rank events for args["rank_for_user"], or by recent views when args["sort"] is "trending",
+        and keep the top ``limit``.
+        """
+        user_id = args.get("rank_for_user")
+        if user_id:
+            return await self.events_service.rank_for_user(events, user_id, limit)
+        if args.get("sort") == "trending":
+            return self.events_service.sort_by_trending(events)[:limit]
+        return events
+
+    def observe(self, events: list) -> None:
+        """Report the events returned by this call for popularity tracking and structured results."""
+        observe(event.event_id for event in events)
+        collect_events(events)
+
+    async def list_changes(self, args: dict, limit: int, **filters) -> Sequence[TextContent]:
+        """Respond with only the events added, changed or cancelled since args["changed_since"]."""
+        changes = await self.events_service.get_event_changes(args["changed_since"], limit=limit, **filters)
+        self.observe(changes["events"])
+        return [
+            TextContent(
+                type="text",
+                text=self.events_service.format_event_changes(changes, args["changed_since"])
+            )
+        ]
+
+
+class SearchEventsToolHandler(EventsToolHandler):
     """
     Tool handler for searching events with various filters.
     """
     
     def __init__(self):
         super().__init__("search_events")
-        self.events_service = EventsService()
     
     def get_tool_description(self) -> Tool:
         """
@@ -29,7 +145,8 @@ class SearchEventsToolHandler(ToolHandler):
         return Tool(
             name=self.name,
             description="""Search for NYC events with optional filters. You can search by keywords in the title, 
-            description, or venue name. You can also filter by category, date range, or a combination of these. 
+            description, or venue name. You can also filter by category, date range, neighborhood or borough, or a 
+            combination of these. 
             This is a flexible search tool that returns events matching your criteria.""",
             inputSchema={
                 "type": "object",
@@ -51,6 +168,16 @@ class SearchEventsToolHandler(ToolHandler):
                         "type": "string",
                         "description": "End date in YYYY-MM-DD format (optional, e.g., '2025-11-20')"
                     },
+                    "neighborhood": NEIGHBORHOOD_PROPERTY,
+                    "borough": BOROUGH_PROPERTY,
+                    "sort": SORT_PROPERTY,
+                    "changed_since": CHANGED_SINCE_PROPERTY,
+                    "facets": {
+                        "type": "boolean",
+                        "description": "Also return counts by category, date and venue for the full match set (default: false)",
+                        "default": False
+                    },
+                    "rank_for_user": RANK_FOR_USER_PROPERTY,
                     "limit": {
                         "type": "integer",
                         "description": "Maximum number of results to return (default: 20)",
@@ -70,9 +197,27 @@ class SearchEventsToolHandler(ToolHandler):
             category = args.get("category")
             start_date = args.get("start_date")
             end_date = args.get("end_date")
+            neighborhood = args.get("neighborhood")
+            borough = args.get("borough")
             limit = args.get("limit", 20)
             
-            logger.info(f"Searching events with query={query}, category={category}, dates={start_date} to {end_date}")
+            logger.info(
+                f"Searching events with query={query}, category={category}, dates={start_date} to {end_date}, "
+                f"area={neighborhood or borough}"
+            )
+            
+            # Polling clients only get what changed since their last call
+            if args.get("changed_since"):
+                return await self.list_changes(
+                    args,
+                    limit,
+                    query=query,
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    neighborhood=neighborhood,
+                    borough=borough
+                )
             
             # Get events from service
             events = await self.events_service.search_events(
@@ -80,12 +225,29 @@ class SearchEventsToolHandler(ToolHandler):
                 category=category,
                 start_date=start_date,
                 end_date=end_date,
-                limit=limit
+                limit=self.candidate_limit(args, limit),
+                neighborhood=neighborhood,
+                borough=borough,
+                progress=self.progress(args)
             )
+            events = await self.personalize(args, events, limit)
+            self.observe(events)
             
             # Format the response
             formatted_response = self.events_service.format_events_list(events)
             
+            # Optional facet counts over the full match set, not just this page
+            if args.get("facets"):
+                facets = await self.events_service.get_search_facets(
+                    query=query,
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    neighborhood=neighborhood,
+                    borough=borough
+                )
+                formatted_response += "\n\n" + self.events_service.format_facets(facets)
+            
             return [
                 TextContent(
                     type="text",
@@ -103,14 +265,106 @@ class SearchEventsToolHandler(ToolHandler):
             ]
 
 
-class GetEventsByCategoryToolHandler(ToolHandler):
+class SemanticSearchEventsToolHandler(EventsToolHandler):
+    """
+    Tool handler for meaning-based event search over the offline vector index.
+    """
+    
+    def __init__(self):
+        super().__init__("semantic_search_events")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for semantic event search.
+        """
+        return Tool(
+            name=self.name,
+            description="""Find NYC events that match a free-text interest by meaning rather than exact words, 
+            e.g. "tech meetups", "live jazz" or "sports". Use this for interests from user preferences that may 
+            not appear verbatim in event titles. Results are ranked by relevance and can be filtered by category 
+            and date range.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "What to look for, in plain words (e.g., 'live jazz', 'tech meetups')"
+                    },
+                    "category": {
+                        "type": "string",
+                        "description": "Filter by event category: music, museum, pop-ups, football, or movies (optional)",
+                        "enum": ["music", "museum", "pop-ups", "football", "movies"]
+                    },
+                    "start_date": {
+                        "type": "string",
+                        "description": "Start date in YYYY-MM-DD format (optional, e.g., '2025-10-20')"
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "End date in YYYY-MM-DD format (optional, e.g., '2025-11-20')"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results to return (default: 10)",
+                        "default": 10
+                    }
+                },
+                "required": ["query"]
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the semantic search events tool.
+        """
+        try:
+            self.validate_required_args(args, ["query"])
+            
+            query = args["query"]
+            category = args.get("category")
+            start_date = args.get("start_date")
+            end_date = args.get("end_date")
+            limit = args.get("limit", 10)
+            
+            logger.info(f"Semantic search for '{query}' (category={category}, {start_date} to {end_date})")
+            
+            # Get events from service
+            events = await self.events_service.semantic_search_events(
+                query=query,
+                category=category,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit
+            )
+            self.observe(events)
+            
+            # Format the response
+            formatted_response = self.events_service.format_events_list(events)
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=formatted_response
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in semantic_search_events: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error in semantic search: {str(e)}"
+                )
+            ]
+
+
+class GetEventsByCategoryToolHandler(EventsToolHandler):
     """
     Tool handler for getting events by category.
     """
     
     def __init__(self):
         super().__init__("get_events_by_category")
-        self.events_service = EventsService()
     
     def get_tool_description(self) -> Tool:
         """
@@ -137,6 +391,16 @@ class GetEventsByCategoryToolHandler(ToolHandler):
                         "type": "string",
                         "description": "Optional end date in YYYY-MM-DD format (e.g., '2025-11-20')"
                     },
+                    "neighborhood": NEIGHBORHOOD_PROPERTY,
+                    "borough": BOROUGH_PROPERTY,
+                    "sort": SORT_PROPERTY,
+                    "changed_since": CHANGED_SINCE_PROPERTY,
+                    "facets": {
+                        "type": "boolean",
+                        "description": "Also return counts by category, date and venue for the full match set (default: false)",
+                        "default": False
+                    },
+                    "rank_for_user": RANK_FOR_USER_PROPERTY,
                     "limit": {
                         "type": "integer",
                         "description": "Maximum number of results to return (default: 20)",
@@ -157,21 +421,51 @@ class GetEventsByCategoryToolHandler(ToolHandler):
             category = args["category"]
             start_date = args.get("start_date")
             end_date = args.get("end_date")
+            neighborhood = args.get("neighborhood")
+            borough = args.get("borough")
             limit = args.get("limit", 20)
             
-            logger.info(f"Getting {category} events from {start_date} to {end_date}")
+            logger.info(f"Getting {category} events from {start_date} to {end_date}, area={neighborhood or borough}")
+            
+            # Polling clients only get what changed since their last call
+            if args.get("changed_since"):
+                return await self.list_changes(
+                    args,
+                    limit,
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    neighborhood=neighborhood,
+                    borough=borough
+                )
             
             # Get events from service
             events = await self.events_service.get_events_by_category(
                 category=category,
                 start_date=start_date,
                 end_date=end_date,
-                limit=limit
+                limit=self.candidate_limit(args, limit),
+                neighborhood=neighborhood,
+                borough=borough,
+                progress=self.progress(args)
             )
+            events = await self.personalize(args, events, limit)
+            self.observe(events)
             
             # Format the response
             formatted_response = self.events_service.format_events_list(events)
             
+            # Optional facet counts over the full match set, not just this page
+            if args.get("facets"):
+                facets = await self.events_service.get_search_facets(
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    neighborhood=neighborhood,
+                    borough=borough
+                )
+                formatted_response += "\n\n" + self.events_service.format_facets(facets)
+            
             return [
                 TextContent(
                     type="text",
@@ -189,14 +483,13 @@ class GetEventsByCategoryToolHandler(ToolHandler):
             ]
 
 
-class GetEventsByDateRangeToolHandler(ToolHandler):
+class GetEventsByDateRangeToolHandler(EventsToolHandler):
     """
     Tool handler for getting events within a date range.
     """
     
     def __init__(self):
         super().__init__("get_events_by_date_range")
-        self.events_service = EventsService()
     
     def get_tool_description(self) -> Tool:
         """
@@ -223,6 +516,16 @@ class GetEventsByDateRangeToolHandler(ToolHandler):
                         "description": "Optional category filter: music, museum, pop-ups, football, or movies",
                         "enum": ["music", "museum", "pop-ups", "football", "movies"]
                     },
+                    "neighborhood": NEIGHBORHOOD_PROPERTY,
+                    "borough": BOROUGH_PROPERTY,
+                    "sort": SORT_PROPERTY,
+                    "changed_since": CHANGED_SINCE_PROPERTY,
+                    "facets": {
+                        "type": "boolean",
+                        "description": "Also return counts by category, date and venue for the full match set (default: false)",
+                        "default": False
+                    },
+                    "rank_for_user": RANK_FOR_USER_PROPERTY,
                     "limit": {
                         "type": "integer",
                         "description": "Maximum number of results to return (default: 50)",
@@ -243,21 +546,51 @@ class GetEventsByDateRangeToolHandler(ToolHandler):
             start_date = args["start_date"]
             end_date = args["end_date"]
             category = args.get("category")
+            neighborhood = args.get("neighborhood")
+            borough = args.get("borough")
             limit = args.get("limit", 50)
             
-            logger.info(f"Getting events from {start_date} to {end_date}, category={category}")
+            logger.info(f"Getting events from {start_date} to {end_date}, category={category}, area={neighborhood or borough}")
+            
+            # Polling clients only get what changed since their last call
+            if args.get("changed_since"):
+                return await self.list_changes(
+                    args,
+                    limit,
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    neighborhood=neighborhood,
+                    borough=borough
+                )
             
             # Get events from service
             events = await self.events_service.get_events_by_date_range(
                 start_date=start_date,
                 end_date=end_date,
                 category=category,
-                limit=limit
+                limit=self.candidate_limit(args, limit),
+                neighborhood=neighborhood,
+                borough=borough,
+                progress=self.progress(args)
             )
+            events = await self.personalize(args, events, limit)
+            self.observe(events)
             
             # Format the response
             formatted_response = self.events_service.format_events_list(events)
             
+            # Optional facet counts over the full match set, not just this page
+            if args.get("facets"):
+                facets = await self.events_service.get_search_facets(
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    neighborhood=neighborhood,
+                    borough=borough
+                )
+                formatted_response += "\n\n" + self.events_service.format_facets(facets)
+            
             return [
                 TextContent(
                     type="text",
@@ -275,14 +608,13 @@ class GetEventsByDateRangeToolHandler(ToolHandler):
             ]
 
 
-class FindEventsNearLocationToolHandler(ToolHandler):
+class FindEventsNearLocationToolHandler(EventsToolHandler):
     """
     Tool handler for finding events near a specific location (proximity search).
     """
     
     def __init__(self):
         super().__init__("find_events_near_location")
-        self.events_service = EventsService()
     
     def get_tool_description(self) -> Tool:
         """
@@ -294,23 +626,51 @@ class FindEventsNearLocationToolHandler(ToolHandler):
             This is perfect for finding events close to another calendar event or a specific address. 
             Results include distance information and are sorted by proximity. You can specify a search radius 
             in kilometers (default 2km). This tool is especially useful when integrated with a calendar to find 
-            events near scheduled appointments.""",
+            events near scheduled appointments. Pass place (a venue, landmark, neighborhood or borough name such as 
+            "Bowery Ballroom" or "Grand Central") instead of coordinates and it is resolved offline; do not guess 
+            coordinates. Pass user_id to search around that user's stored home location, or venue_id to search 
+            around a venue. Set max_travel_minutes to search by 
+            estimated door-to-door travel time (walking or transit, including river crossings) instead of 
+            radius, and sort="travel" to order results by it.""",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "latitude": {
                         "type": "number",
-                        "description": "Latitude of the reference location (e.g., 40.7580 for Times Square)"
+                        "description": "Latitude of the reference location, when known exactly (e.g. from a calendar event)"
                     },
                     "longitude": {
                         "type": "number",
-                        "description": "Longitude of the reference location (e.g., -73.9855 for Times Square)"
+                        "description": "Longitude of the reference location, when known exactly"
+                    },
+                    "place": {
+                        "type": "string",
+                        "description": "Search around a named place instead of coordinates: venue, landmark, neighborhood "
+                                       "or borough (optional, e.g. 'Bowery Ballroom', 'Union Square')"
+                    },
+                    "user_id": {
+                        "type": "string",
+                        "description": "Search around this user's stored home location when latitude/longitude are omitted (optional)"
+                    },
+                    "venue_id": {
+                        "type": "integer",
+                        "description": "Search around this venue when latitude/longitude are omitted (optional)"
                     },
                     "radius_km": {
                         "type": "number",
                         "description": "Search radius in kilometers (default: 2.0)",
                         "default": 2.0
                     },
+                    "max_travel_minutes": {
+                        "type": "integer",
+                        "description": "Keep venues within this estimated travel time instead of radius_km (optional, e.g. the user's travel_buffer_min)"
+                    },
+                    "sort": {
+                        "type": "string",
+                        "description": "Order by straight-line distance, estimated travel time or recent views (default: distance)",
+                        "enum": ["distance", "travel", "trending"],
+                        "default": "distance"
+                    },
                     "category": {
                         "type": "string",
                         "description": "Optional category filter: music, museum, pop-ups, football, or movies",
@@ -324,13 +684,14 @@ class FindEventsNearLocationToolHandler(ToolHandler):
                         "type": "string",
                         "description": "Optional end date in YYYY-MM-DD format (e.g., '2025-11-20')"
                     },
+                    "rank_for_user": RANK_FOR_USER_PROPERTY,
                     "limit": {
                         "type": "integer",
                         "description": "Maximum number of results to return (default: 20)",
                         "default": 20
                     }
                 },
-                "required": ["latitude", "longitude"]
+                "required": []
             }
         )
     
@@ -339,36 +700,69 @@ class FindEventsNearLocationToolHandler(ToolHandler):
         Execute the find events near location tool.
         """
         try:
-            self.validate_required_args(args, ["latitude", "longitude"])
-            
-            latitude = args["latitude"]
-            longitude = args["longitude"]
             radius_km = args.get("radius_km", 2.0)
+            max_travel_minutes = args.get("max_travel_minutes")
+            sort = args.get("sort", "distance")
             category = args.get("category")
             start_date = args.get("start_date")
             end_date = args.get("end_date")
             limit = args.get("limit", 20)
+            within = f"~{max_travel_minutes} min" if max_travel_minutes is not None else f"{radius_km}km"
+            origin = "the specified location"
             
-            logger.info(f"Finding events near ({latitude}, {longitude}) within {radius_km}km")
+            if args.get("latitude") is None and args.get("longitude") is None and args.get("place"):
+                place = await self.events_service.resolve_place(args["place"])
+                args = {**args, "latitude": place.latitude, "longitude": place.longitude}
+                origin = f"{place.name} ({place.kind})"
             
-            # Get events from service
-            events = await self.events_service.find_events_near_location(
-                latitude=latitude,
-                longitude=longitude,
-                radius_km=radius_km,
-                category=category,
-                start_date=start_date,
-                end_date=end_date,
-                limit=limit
-            )
+            if args.get("latitude") is None and args.get("longitude") is None and args.get("venue_id") is not None:
+                if max_travel_minutes is None:
+                    raise ValueError("Searching around a venue needs max_travel_minutes")
+                logger.info(f"Finding events within {within} of venue {args['venue_id']}")
+                events = await self.events_service.find_events_near_venue(
+                    venue_id=args["venue_id"],
+                    max_travel_minutes=max_travel_minutes,
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=self.candidate_limit(args, limit)
+                )
+            else:
+                if args.get("latitude") is None and args.get("longitude") is None and args.get("user_id"):
+                    prefs = await self.events_service.get_user_prefs(args["user_id"])
+                    if not prefs.has_home:
+                        raise ValueError(f"User {prefs.user_id} has no home location; pass latitude and longitude")
+                    args = {**args, "latitude": prefs.home_latitude, "longitude": prefs.home_longitude}
+                self.validate_required_args(args, ["latitude", "longitude"])
+                
+                latitude = args["latitude"]
+                longitude = args["longitude"]
+                
+                logger.info(f"Finding events near ({latitude}, {longitude}) within {within}")
+                
+                # Get events from service
+                events = await self.events_service.find_events_near_location(
+                    latitude=latitude,
+                    longitude=longitude,
+                    radius_km=radius_km,
+                    category=category,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=self.candidate_limit(args, limit),
+                    max_travel_minutes=max_travel_minutes,
+                    sort="distance" if sort == "trending" else sort,
+                    progress=self.progress(args)
+                )
+            events = await self.personalize(args, events, limit)
+            self.observe(events)
             
             # Format the response with distance info
             if events:
-                response_text = f"Found {len(events)} event(s) within {radius_km}km:\n"
+                response_text = f"Found {len(events)} event(s) within {within} of {origin}:\n"
                 for i, event in enumerate(events, 1):
                     response_text += f"\n{i}. " + self.events_service.format_event_summary(event) + "\n"
             else:
-                response_text = f"No events found within {radius_km}km of the specified location."
+                response_text = f"No events found within {within} of {origin}."
             
             return [
                 TextContent(
@@ -387,14 +781,131 @@ class FindEventsNearLocationToolHandler(ToolHandler):
             ]
 
 
-class GetEventByIdToolHandler(ToolHandler):
+class FindEventsAlongRouteToolHandler(EventsToolHandler):
+    """
+    Tool handler for finding events along a route between two or more locations.
+    """
+    
+    def __init__(self):
+        super().__init__("find_events_along_route")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for corridor search.
+        """
+        return Tool(
+            name=self.name,
+            description="""Find NYC events along the way between two or more locations, e.g. between a 2pm meeting 
+            in Midtown and dinner in the East Village. Give the stops in travel order as waypoints; events at venues 
+            within corridor_km of the route are returned, ordered by how much extra distance visiting them adds 
+            (detour). Each waypoint is either coordinates or a place name (venue, landmark, neighborhood or borough) 
+            resolved offline. Use this instead of calling find_events_near_location at guessed midpoints.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "waypoints": {
+                        "type": "array",
+                        "description": "Stops in travel order (at least two), each with latitude/longitude or a place name",
+                        "minItems": 2,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "latitude": {"type": "number"},
+                                "longitude": {"type": "number"},
+                                "place": {"type": "string", "description": "e.g. 'Grand Central', 'Tompkins Square Park'"}
+                            }
+                        }
+                    },
+                    "corridor_km": {
+                        "type": "number",
+                        "description": "Maximum distance of a venue from the route in kilometers (default: 0.5)",
+                        "default": 0.5
+                    },
+                    "category": {
+                        "type": "string",
+                        "description": "Optional category filter: music, museum, pop-ups, football, or movies",
+                        "enum": ["music", "museum", "pop-ups", "football", "movies"]
+                    },
+                    "start_date": {
+                        "type": "string",
+                        "description": "Optional start date in YYYY-MM-DD format (e.g., '2025-10-20')"
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "Optional end date in YYYY-MM-DD format (e.g., '2025-11-20')"
+                    },
+                    "rank_for_user": RANK_FOR_USER_PROPERTY,
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results to return (default: 20)",
+                        "default": 20
+                    }
+                },
+                "required": ["waypoints"]
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the find events along route tool.
+        """
+        try:
+            self.validate_required_args(args, ["waypoints"])
+            
+            waypoints = []
+            for point in args["waypoints"]:
+                if point.get("latitude") is None and point.get("place"):
+                    place = await self.events_service.resolve_place(point["place"])
+                    waypoints.append((place.latitude, place.longitude))
+                else:
+                    waypoints.append((float(point["latitude"]), float(point["longitude"])))
+            corridor_km = args.get("corridor_km", 0.5)
+            limit = args.get("limit", 20)
+            
+            logger.info(f"Finding events within {corridor_km}km of a {len(waypoints)}-stop route")
+            
+            events = await self.events_service.find_events_along_route(
+                waypoints=waypoints,
+                corridor_km=corridor_km,
+                category=args.get("category"),
+                start_date=args.get("start_date"),
+                end_date=args.get("end_date"),
+                limit=self.candidate_limit(args, limit)
+            )
+            events = await self.personalize(args, events, limit)
+            self.observe(events)
+            
+            if events:
+                response_text = f"Found {len(events)} event(s) within {corridor_km}km of the route (smallest detour first):\n"
+                for i, event in enumerate(events, 1):
+                    response_text += f"\n{i}. " + self.events_service.format_event_summary(event) + "\n"
+            else:
+                response_text = f"No events found within {corridor_km}km of the route."
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=response_text
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in find_events_along_route: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error finding events along route: {str(e)}"
+                )
+            ]
+
+
+class GetEventByIdToolHandler(EventsToolHandler):
     """
     Tool handler for getting a specific event by its ID.
     """
     
     def __init__(self):
         super().__init__("get_event_by_id")
-        self.events_service = EventsService()
     
     def get_tool_description(self) -> Tool:
         """
@@ -431,6 +942,7 @@ class GetEventByIdToolHandler(ToolHandler):
             event = await self.events_service.get_event_by_id(event_id)
             
             if event:
+                self.observe([event])
                 formatted_response = self.events_service.format_event_summary(event)
             else:
                 formatted_response = f"Event not found with ID: {event_id}"
@@ -452,43 +964,75 @@ class GetEventByIdToolHandler(ToolHandler):
             ]
 
 
-class GetEventCategoriesToolHandler(ToolHandler):
+class TrendingEventsToolHandler(EventsToolHandler):
     """
-    Tool handler for listing all available event categories.
+    Tool handler for the events users have been looking at most recently.
     """
     
     def __init__(self):
-        super().__init__("get_event_categories")
-        self.events_service = EventsService()
+        super().__init__("trending_events")
     
     def get_tool_description(self) -> Tool:
         """
-        Return the tool description for listing categories.
+        Return the tool description for trending events.
         """
         return Tool(
             name=self.name,
-            description="""Get a list of all available event categories in the NYC events database. 
-            This helps you understand what types of events are available.""",
+            description="""Get the events people have been looking at most over the last day or so, 
+            counting detail views (get_event_by_id) and appearances in search results, with older 
+            activity fading out. Use this for "what's popular" or "what's hot" questions. Counts are 
+            approximate and only reflect activity seen by this server.""",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "category": {
+                        "type": "string",
+                        "description": "Optional category filter: music, museum, pop-ups, football, or movies",
+                        "enum": ["music", "museum", "pop-ups", "football", "movies"]
+                    },
+                    "start_date": {
+                        "type": "string",
+                        "description": "Optional start date in YYYY-MM-DD format (e.g., '2025-10-20')"
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "Optional end date in YYYY-MM-DD format (e.g., '2025-11-20')"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results to return (default: 10)",
+                        "default": 10
+                    }
+                },
                 "required": []
             }
         )
     
     async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """
-        Execute the get event categories tool.
+        Execute the trending events tool.
         """
         try:
-            logger.info("Getting all event categories")
+            category = args.get("category")
+            start_date = args.get("start_date")
+            end_date = args.get("end_date")
+            limit = args.get("limit", 10)
             
-            # Get categories from service
-            categories = await self.events_service.get_all_categories()
+            logger.info(f"Getting trending events (category={category}, {start_date} to {end_date})")
             
-            response_text = "Available event categories:\n\n"
-            for cat in categories:
-                response_text += f"- {cat}\n"
+            events = await self.events_service.get_trending_events(
+                category=category,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit
+            )
+            
+            if events:
+                response_text = "Trending now (relevance = recent weighted views):\n"
+                for i, event in enumerate(events, 1):
+                    response_text += f"\n{i}. " + self.events_service.format_event_summary(event) + "\n"
+            else:
+                response_text = "No trending events yet."
             
             return [
                 TextContent(
@@ -498,12 +1042,707 @@ class GetEventCategoriesToolHandler(ToolHandler):
             ]
             
         except Exception as e:
-            logger.exception(f"Error in get_event_categories: {str(e)}")
+            logger.exception(f"Error in trending_events: {str(e)}")
             return [
                 TextContent(
                     type="text",
-                    text=f"Error getting event categories: {str(e)}"
+                    text=f"Error getting trending events: {str(e)}"
                 )
             ]
 
 
+class GetEventCategoriesToolHandler(EventsToolHandler):
+    """
+    Tool handler for listing all available event categories.
+    """
+    
+    def __init__(self):
+        super().__init__("get_event_categories")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for listing categories.
+        """
+        return Tool(
+            name=self.name,
+            description="""Get a list of all available event categories in the NYC events database. 
+            This helps you understand what types of events are available.""",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the get event categories tool.
+        """
+        try:
+            logger.info("Getting all event categories")
+            
+            # Get categories from service
+            categories = await self.events_service.get_all_categories()
+            
+            response_text = "Available event categories:\n\n"
+            for cat in categories:
+                response_text += f"- {cat}\n"
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=response_text
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in get_event_categories: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error getting event categories: {str(e)}"
+                )
+            ]
+
+
+
+
+class GetNeighborhoodsToolHandler(EventsToolHandler):
+    """
+    Tool handler for listing the boroughs and neighborhoods that have events.
+    """
+    
+    def __init__(self):
+        super().__init__("get_neighborhoods")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for listing areas.
+        """
+        return Tool(
+            name=self.name,
+            description="""List the NYC boroughs and neighborhoods that have venues, with venue and event counts. 
+            Use the exact names shown here for the `neighborhood` and `borough` filters of the search tools.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "borough": {
+                        "type": "string",
+                        "description": "Only list neighborhoods in this borough (optional, e.g. 'Brooklyn')"
+                    }
+                },
+                "required": []
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the get neighborhoods tool.
+        """
+        try:
+            borough = args.get("borough")
+            
+            logger.info(f"Getting neighborhoods (borough={borough})")
+            
+            areas = await self.events_service.get_areas(borough)
+            
+            if not areas:
+                response_text = "No neighborhoods found."
+            else:
+                lines = []
+                current = None
+                for area in areas:
+                    if area["borough"] != current:
+                        current = area["borough"]
+                        lines.append(f"{current}:")
+                    lines.append(
+                        f"- {area['neighborhood'] or '(other)'}: {area['venues']} venue(s), {area['events']} event(s)"
+                    )
+                response_text = "\n".join(lines)
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=response_text
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in get_neighborhoods: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error getting neighborhoods: {str(e)}"
+                )
+            ]
+
+
+class GetDayDigestToolHandler(EventsToolHandler):
+    """
+    Tool handler for the precomputed per-day "what's on" digest.
+    """
+    
+    def __init__(self):
+        super().__init__("get_day_digest")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for the day digest.
+        """
+        return Tool(
+            name=self.name,
+            description="""Get a compact summary of what's happening in NYC on a day or over a few days 
+            (e.g. "today" or "this weekend"): event counts per category, the busiest venues, the earliest 
+            and latest start times and a few highlight event IDs. Use this first for "what's on" questions 
+            instead of listing every event; fetch details with get_event_by_id or the list tools only if needed.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "date": {
+                        "type": "string",
+                        "description": "Date in YYYY-MM-DD format (e.g., '2025-10-25')"
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "Optional last date (inclusive) in YYYY-MM-DD format for a multi-day digest"
+                    }
+                },
+                "required": ["date"]
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the get day digest tool.
+        """
+        try:
+            self.validate_required_args(args, ["date"])
+            
+            date = args["date"]
+            end_date = args.get("end_date")
+            
+            logger.info(f"Getting day digest for {date} to {end_date or date}")
+            
+            # Get digests from service
+            digests = await self.events_service.get_day_digest(date, end_date)
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=self.events_service.format_day_digest(digests)
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in get_day_digest: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error getting day digest: {str(e)}"
+                )
+            ]
+
+
+class GetEventsAtVenueToolHandler(EventsToolHandler):
+    """
+    Tool handler for listing events at a specific venue.
+    """
+    
+    def __init__(self):
+        super().__init__("get_events_at_venue")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for venue-based event retrieval.
+        """
+        return Tool(
+            name=self.name,
+            description="""Get upcoming NYC events at a specific venue, in chronological order. Identify the 
+            venue by name (e.g. "Bowery Ballroom"; partial names work) or by its numeric venue ID. 
+            You can optionally filter by date range.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "venue": {
+                        "type": "string",
+                        "description": "Venue name or part of it (e.g., 'Bowery Ballroom')"
+                    },
+                    "venue_id": {
+                        "type": "integer",
+                        "description": "Numeric venue ID (alternative to venue)"
+                    },
+                    "start_date": {
+                        "type": "string",
+                        "description": "Optional start date in YYYY-MM-DD format (e.g., '2025-10-20')"
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "Optional end date in YYYY-MM-DD format (e.g., '2025-11-20')"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results to return (default: 20)",
+                        "default": 20
+                    }
+                },
+                "required": []
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the get events at venue tool.
+        """
+        try:
+            if "venue_id" not in args and "venue" not in args:
+                raise RuntimeError("Missing required arguments: venue or venue_id")
+            
+            start_date = args.get("start_date")
+            end_date = args.get("end_date")
+            limit = args.get("limit", 20)
+            
+            # Resolve the venue
+            if "venue_id" in args:
+                venue = await self.events_service.get_venue(int(args["venue_id"]))
+                venues = [venue] if venue else []
+            else:
+                venues = await self.events_service.find_venues_by_name(args["venue"])
+            
+            if not venues:
+                response_text = f"No venue found matching: {args.get('venue', args.get('venue_id'))}"
+            elif len(venues) > 1:
+                response_text = "Multiple venues match; call again with one of these venue IDs:\n"
+                for venue in venues:
+                    response_text += f"- {venue.venue_id}: {venue.name}\n"
+            else:
+                venue = venues[0]
+                logger.info(f"Getting events at venue {venue.venue_id} ({venue.name})")
+                
+                # Get events from service
+                events = await self.events_service.get_events_at_venue(
+                    venue_id=venue.venue_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=limit
+                )
+                self.observe(events)
+                response_text = (
+                    f"Venue: {venue.name} (ID {venue.venue_id}, "
+                    f"{venue.latitude}, {venue.longitude})\n\n"
+                    + self.events_service.format_events_list(events)
+                )
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=response_text
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in get_events_at_venue: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error getting events at venue: {str(e)}"
+                )
+            ]
+
+
+class GetUserPreferencesToolHandler(EventsToolHandler):
+    """
+    Tool handler for looking up a user's stored preferences.
+    """
+    
+    def __init__(self):
+        super().__init__("get_user_preferences")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for user preference lookup.
+        """
+        return Tool(
+            name=self.name,
+            description="""Get a Morning Me user's stored preferences: name, city, home location, wake hour, diet, 
+            dress code, interests and travel buffer in minutes. Use this instead of carrying the preferences in 
+            the prompt; other tools accept the same user id (rank_for_user, user_id).""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "user_id": {
+                        "type": "string",
+                        "description": "User identifier (e.g. 'default')"
+                    }
+                },
+                "required": ["user_id"]
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the get user preferences tool.
+        """
+        try:
+            self.validate_required_args(args, ["user_id"])
+            
+            user_id = args["user_id"]
+            logger.info(f"Getting preferences for user {user_id}")
+            
+            prefs = await self.events_service.get_user_prefs(user_id)
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=json.dumps(prefs.to_dict(), indent=2)
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in get_user_preferences: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error getting user preferences: {str(e)}"
+                )
+            ]
+
+
+class GetMyRecommendationsToolHandler(EventsToolHandler):
+    """
+    Tool handler for a user's precomputed recommendations of the day.
+    """
+    
+    def __init__(self):
+        super().__init__("get_my_recommendations")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for the recommendations lookup.
+        """
+        return Tool(
+            name=self.name,
+            description="""Get a user's recommended NYC events for a day, precomputed overnight from their 
+            interests, diet, home and scheduled locations, with a mix of categories. This is the fastest way 
+            to suggest events in a morning brief; use the search tools for anything more specific.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "user_id": {
+                        "type": "string",
+                        "description": "User identifier (e.g. 'default')"
+                    },
+                    "date": {
+                        "type": "string",
+                        "description": "Day in YYYY-MM-DD format (optional, default: today)"
+                    }
+                },
+                "required": ["user_id"]
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the get my recommendations tool.
+        """
+        try:
+            self.validate_required_args(args, ["user_id"])
+            
+            user_id = args["user_id"]
+            day = args.get("date") or date.today().isoformat()
+            
+            logger.info(f"Getting recommendations for user {user_id} on {day}")
+            
+            events = await self.events_service.get_my_recommendations(user_id, day)
+            self.observe(events)
+            
+            if events:
+                response_text = f"Recommended for {user_id} on {day}:\n"
+                for i, event in enumerate(events, 1):
+                    response_text += f"\n{i}. " + self.events_service.format_event_summary(event) + "\n"
+            else:
+                response_text = f"No recommended events for {user_id} on {day}."
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=response_text
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in get_my_recommendations: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error getting recommendations: {str(e)}"
+                )
+            ]
+
+
+class SaveSearchToolHandler(EventsToolHandler):
+    """
+    Tool handler for saving a standing search that is matched against new events.
+    """
+    
+    def __init__(self):
+        super().__init__("save_search")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for saving a search.
+        """
+        return Tool(
+            name=self.name,
+            description="""Save a standing search for a user, e.g. "tell me when a new jazz show near home shows up". 
+            Events added or changed after this are matched against it as they are loaded; every given criterion 
+            must match (keywords must all appear in the title, description or venue). Returns a resource URI: 
+            clients that subscribe to it are notified of new matches, and list_saved_searches shows them.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "user_id": {
+                        "type": "string",
+                        "description": "User identifier (e.g. 'default')"
+                    },
+                    "name": {
+                        "type": "string",
+                        "description": "Short label for the search (e.g. 'Jazz near home')"
+                    },
+                    "query": {
+                        "type": "string",
+                        "description": "Keywords that must all appear (optional, e.g. 'jazz')"
+                    },
+                    "category": {
+                        "type": "string",
+                        "description": "Category filter: music, museum, pop-ups, football, or movies (optional)",
+                        "enum": ["music", "museum", "pop-ups", "football", "movies"]
+                    },
+                    "neighborhood": NEIGHBORHOOD_PROPERTY,
+                    "borough": BOROUGH_PROPERTY,
+                    "near_home": {
+                        "type": "boolean",
+                        "description": "Only events within radius_km of the user's home (default: false)",
+                        "default": False
+                    },
+                    "place": {
+                        "type": "string",
+                        "description": "Only events within radius_km of this venue, landmark or neighborhood (optional)"
+                    },
+                    "latitude": {
+                        "type": "number",
+                        "description": "Only events within radius_km of this point (optional, with longitude)"
+                    },
+                    "longitude": {
+                        "type": "number",
+                        "description": "Longitude of the point (optional, with latitude)"
+                    },
+                    "radius_km": {
+                        "type": "number",
+                        "description": "Radius around the home, place or point in kilometers (default: 2.0)"
+                    }
+                },
+                "required": ["user_id", "name"]
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the save search tool.
+        """
+        try:
+            self.validate_required_args(args, ["user_id", "name"])
+            
+            user_id = args["user_id"]
+            latitude = args.get("latitude")
+            longitude = args.get("longitude")
+            if args.get("near_home"):
+                prefs = await self.events_service.get_user_prefs(user_id)
+                if not prefs.has_home:
+                    raise ValueError(f"User {prefs.user_id} has no home location")
+                latitude, longitude = prefs.home_latitude, prefs.home_longitude
+            elif args.get("place"):
+                place = await self.events_service.resolve_place(args["place"])
+                latitude, longitude = place.latitude, place.longitude
+            
+            logger.info(f"Saving search '{args['name']}' for user {user_id}")
+            
+            search = await self.events_service.save_search(
+                user_id,
+                args["name"],
+                query=args.get("query"),
+                category=args.get("category"),
+                neighborhood=args.get("neighborhood"),
+                borough=args.get("borough"),
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=args.get("radius_km")
+            )
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=(
+                        f"Saved search {search['search_id']} ('{search['name']}') for {user_id}.\n"
+                        f"Subscribe to {search['uri']} to be notified of new matching events."
+                    )
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in save_search: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error saving search: {str(e)}"
+                )
+            ]
+
+
+class ListSavedSearchesToolHandler(EventsToolHandler):
+    """
+    Tool handler for a user's saved searches and their latest matches.
+    """
+    
+    def __init__(self):
+        super().__init__("list_saved_searches")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for listing saved searches.
+        """
+        return Tool(
+            name=self.name,
+            description="""List a user's saved searches with the events most recently matched to each. 
+            Use this to answer "anything new for my alerts?" without re-running the searches.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "user_id": {
+                        "type": "string",
+                        "description": "User identifier (e.g. 'default')"
+                    },
+                    "matches": {
+                        "type": "integer",
+                        "description": "Latest matches shown per search (default: 5)",
+                        "default": 5
+                    }
+                },
+                "required": ["user_id"]
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the list saved searches tool.
+        """
+        try:
+            self.validate_required_args(args, ["user_id"])
+            
+            user_id = args["user_id"]
+            per_search = args.get("matches", 5)
+            logger.info(f"Listing saved searches for user {user_id}")
+            
+            searches = await self.events_service.get_saved_searches(user_id)
+            
+            if not searches:
+                response_text = f"No saved searches for {user_id}."
+            else:
+                lines = []
+                for search in searches:
+                    criteria = ", ".join(
+                        f"{field}={search[field]}"
+                        for field in ("query", "category", "neighborhood", "borough", "radius_km")
+                        if search[field] not in (None, "")
+                    )
+                    lines.append(f"Search {search['search_id']}: {search['name']} ({criteria}) - {search['uri']}")
+                    events = await self.events_service.get_saved_search_matches(
+                        user_id, search["search_id"], per_search
+                    )
+                    self.observe(events)
+                    if not events:
+                        lines.append("   No matches yet.")
+                    for i, event in enumerate(events, 1):
+                        lines.append(f"   {i}. {event.title} - {event.date} {event.start_time_local} "
+                                     f"@ {event.venue_name} (ID {event.event_id})")
+                    lines.append("")
+                response_text = "\n".join(lines).rstrip()
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=response_text
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in list_saved_searches: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error listing saved searches: {str(e)}"
+                )
+            ]
+
+
+class DeleteSavedSearchToolHandler(EventsToolHandler):
+    """
+    Tool handler for removing a saved search.
+    """
+    
+    def __init__(self):
+        super().__init__("delete_saved_search")
+    
+    def get_tool_description(self) -> Tool:
+        """
+        Return the tool description for deleting a saved search.
+        """
+        return Tool(
+            name=self.name,
+            description="""Delete one of a user's saved searches (see list_saved_searches for the ids).""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "user_id": {
+                        "type": "string",
+                        "description": "User identifier (e.g. 'default')"
+                    },
+                    "search_id": {
+                        "type": "integer",
+                        "description": "Saved search id"
+                    }
+                },
+                "required": ["user_id", "search_id"]
+            }
+        )
+    
+    async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """
+        Execute the delete saved search tool.
+        """
+        try:
+            self.validate_required_args(args, ["user_id", "search_id"])
+            
+            user_id = args["user_id"]
+            search_id = int(args["search_id"])
+            logger.info(f"Deleting saved search {search_id} of user {user_id}")
+            
+            if await self.events_service.delete_saved_search(user_id, search_id):
+                response_text = f"Deleted saved search {search_id}."
+            else:
+                response_text = f"No saved search {search_id} for {user_id}."
+            
+            return [
+                TextContent(
+                    type="text",
+                    text=response_text
+                )
+            ]
+            
+        except Exception as e:
+            logger.exception(f"Error in delete_saved_search: {str(e)}")
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error deleting saved search: {str(e)}"
+                )
+            ]
@@ -0,0 +1,648 @@
+"""
+Multi-user preferences store.
+
+Preferences live in their own SQLite database keyed by user id, with a
+schema versioned through ``PRAGMA user_version`` like the events database.
+Lookups go through an in-process LRU cache; a change made by any other
+connection (``PRAGMA data_version``) flushes it, so the cache never serves
+preferences older than the last committed write.
+
+The same database holds the per-user, per-day recommendations written by
+the nightly batch (``python -m nyc_events_mcp.recommend``) and users' saved
+searches with the events matched to them at ingest.
+
+The database defaults to ``morning_me_users.sqlite`` next to the bundled
+events database (override with ``NYC_EVENTS_PREFS_DB``). When it has no
+``default`` user, the workspace ``prefs.json`` is imported as that user.
+
+Usage:
+    python -m nyc_events_mcp.tools.user_prefs list
+    python -m nyc_events_mcp.tools.user_prefs show alice
+    python -m nyc_events_mcp.tools.user_prefs set alice alice_prefs.json
+    python -m nyc_events_mcp.tools.user_prefs delete alice
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .events_service import DEFAULT_USER_ID, default_db_path
+
+logger = logging.getLogger("nyc-events-mcp")
+
+# Number of users whose preferences are kept in memory
+PREFS_CACHE_SIZE = 1024
+
+# Preference fields stored in their own columns, in table order
+PREF_FIELDS = (
+    "name",
+    "city",
+    "home_latitude",
+    "home_longitude",
+    "wake_hour",
+    "diet",
+    "dress_code",
+    "interests",
+    "travel_buffer_min",
+)
+
+
+class UserPrefs:
+    """
+    One user's preferences.
+
+    ``version`` increases on every write, so caches keyed by
+    (user id, version) invalidate themselves.
+    """
+
+    __slots__ = ("user_id", "version", "updated_at") + PREF_FIELDS
+
+    def __init__(
+        self,
+        user_id: str,
+        version: int = 1,
+        updated_at: Optional[str] = None,
+        name: Optional[str] = None,
+        city: Optional[str] = None,
+        home_latitude: Optional[float] = None,
+        home_longitude: Optional[float] = None,
+        wake_hour: Optional[int] = None,
+        diet: Optional[str] = None,
+        dress_code: Optional[str] = None,
+        interests: Optional[List[str]] = None,
+        travel_buffer_min: Optional[int] = None,
+    ):
+        self.user_id = user_id
+        self.version = version
+        self.updated_at = updated_at
+        self.name = name
+        self.city = city
+        self.home_latitude = home_latitude
+        self.home_longitude = home_longitude
+        self.wake_hour = wake_hour
+        self.diet = diet
+        self.dress_code = dress_code
+        self.interests = list(interests or [])
+        self.travel_buffer_min = travel_buffer_min
+
+    @property
+    def has_home(self) -> bool:
+        return self.home_latitude is not None and self.home_longitude is not None
+
+    @classmethod
+    def from_prefs_json(cls, user_id: str, prefs: Dict[str, Any]) -> "UserPrefs":
+        """
+        Build preferences from a prefs.json-style dictionary.
+
+        The home location may be given as ``"home": {"latitude": ..., "longitude": ...}``.
+
+        Args:
+            user_id: User identifier
+            prefs: Preferences dictionary
+
+        Returns:
+            UserPrefs (version 1, not yet stored)
+        """
+        home = prefs.get("home") or {}
+        return cls(
+            user_id=user_id,
+            name=prefs.get("name"),
+            city=prefs.get("city"),
+            home_latitude=home.get("latitude", prefs.get("home_latitude")),
+            home_longitude=home.get("longitude", prefs.get("home_longitude")),
+            wake_hour=prefs.get("wake_hour"),
+            diet=prefs.get("diet"),
+            dress_code=prefs.get("dress_code"),
+            interests=prefs.get("interests"),
+            travel_buffer_min=prefs.get("travel_buffer_min"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a prefs.json-style dictionary (plus user id and version).
+        """
+        result: Dict[str, Any] = {"user_id": self.user_id, "version": self.version}
+        for field in PREF_FIELDS:
+            if field in ("home_latitude", "home_longitude"):
+                continue
+            result[field] = getattr(self, field)
+        if self.has_home:
+            result["home"] = {"latitude": self.home_latitude, "longitude": self.home_longitude}
+        result["updated_at"] = self.updated_at
+        return result
+
+    def __repr__(self) -> str:
+        return f"UserPrefs({self.user_id!r}, version={self.version})"
+
+
+def _migrate_v1(conn: sqlite3.Connection) -> None:
+    """Users table with one column per preference; interests as a JSON array."""
+    conn.execute("""
+        CREATE TABLE users (
+            user_id TEXT PRIMARY KEY,
+            name TEXT,
+            city TEXT,
+            home_latitude REAL,
+            home_longitude REAL,
+            wake_hour INTEGER,
+            diet TEXT,
+            dress_code TEXT,
+            interests TEXT NOT NULL DEFAULT '[]',
+            travel_buffer_min INTEGER,
+            version INTEGER NOT NULL DEFAULT 1,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX idx_users_wake_hour ON users(wake_hour)")
+
+
+def _migrate_v2(conn: sqlite3.Connection) -> None:
+    """Precomputed per-user, per-day recommendations (events stored as JSON)."""
+    conn.execute("""
+        CREATE TABLE recommendations (
+            user_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            prefs_version INTEGER NOT NULL,
+            generated_at TEXT NOT NULL,
+            events TEXT NOT NULL,
+            PRIMARY KEY (user_id, date)
+        ) WITHOUT ROWID
+    """)
+
+
+def _migrate_v3(conn: sqlite3.Connection) -> None:
+    """Saved searches, the events matched to them and the matcher's position in the event changes."""
+    conn.execute("""
+        CREATE TABLE saved_searches (
+            search_id INTEGER PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            query TEXT,
+            category TEXT,
+            neighborhood TEXT,
+            borough TEXT,
+            latitude REAL,
+            longitude REAL,
+            radius_km REAL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX idx_saved_searches_user ON saved_searches(user_id)")
+    conn.execute("""
+        CREATE TABLE saved_search_matches (
+            match_id INTEGER PRIMARY KEY,
+            search_id INTEGER NOT NULL,
+            event_id TEXT NOT NULL,
+            matched_at TEXT NOT NULL,
+            UNIQUE (search_id, event_id)
+        )
+    """)
+    conn.execute("CREATE INDEX idx_saved_search_matches_search ON saved_search_matches(search_id, match_id)")
+    conn.execute("""
+        CREATE TABLE matcher_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        ) WITHOUT ROWID
+    """)
+
+
+# (schema version, migration) in order; each runs once per database
+MIGRATIONS: List[Tuple[int, Callable[[sqlite3.Connection], None]]] = [
+    (1, _migrate_v1),
+    (2, _migrate_v2),
+    (3, _migrate_v3),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+_SELECT = f"SELECT user_id, version, updated_at, {', '.join(PREF_FIELDS)} FROM users"
+
+# Saved search columns, in table order
+SEARCH_FIELDS = (
+    "search_id",
+    "user_id",
+    "name",
+    "query",
+    "category",
+    "neighborhood",
+    "borough",
+    "latitude",
+    "longitude",
+    "radius_km",
+    "created_at",
+)
+
+# matcher_state key of the last event change the saved-search matcher processed
+MATCH_CURSOR_KEY = "saved_search_cursor"
+
+
+def default_prefs_db_path() -> str:
+    """
+    Return the preferences database path (NYC_EVENTS_PREFS_DB or the workspace root).
+    """
+    return os.environ.get("NYC_EVENTS_PREFS_DB") or os.path.join(
+        os.path.dirname(default_db_path()), "morning_me_users.sqlite"
+    )
+
+
+def default_prefs_json_path() -> str:
+    """
+    Return the path of the single-user prefs.json in the workspace root.
+    """
+    return os.path.join(os.path.dirname(default_db_path()), "prefs.json")
+
+
+def _row_to_prefs(row: tuple) -> UserPrefs:
+    values = dict(zip(("user_id", "version", "updated_at") + PREF_FIELDS, row))
+    values["interests"] = json.loads(values["interests"] or "[]")
+    return UserPrefs(**values)
+
+
+class PrefsStore:
+    """
+    SQLite-backed user preferences with an LRU read cache.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, cache_size: int = PREFS_CACHE_SIZE):
+        """
+        Open (and if needed create or migrate) the preferences database.
+
+        Args:
+            db_path: SQLite path (default: default_prefs_db_path())
+            cache_size: Number of users kept in the LRU cache
+        """
+        self.db_path = db_path or default_prefs_db_path()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Optional[UserPrefs]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL lets the server keep reading while batch workers write recommendations
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._ensure_schema()
+        self._data_version = self._read_data_version()
+
+    def _ensure_schema(self) -> None:
+        current = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        for version, migrate in MIGRATIONS:
+            if version > current:
+                logger.info(f"Migrating preferences database to schema v{version}")
+                with self._conn:
+                    migrate(self._conn)
+                    self._conn.execute(f"PRAGMA user_version = {version}")
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get(self, user_id: str) -> Optional[UserPrefs]:
+        """
+        Look up a user's preferences.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            UserPrefs, or None for an unknown user
+        """
+        with self._lock:
+            # data_version moves when another connection commits; drop what we cached
+            data_version = self._read_data_version()
+            if data_version != self._data_version:
+                self._cache.clear()
+                self._data_version = data_version
+
+            if user_id in self._cache:
+                self._cache.move_to_end(user_id)
+                return self._cache[user_id]
+
+            row = self._conn.execute(f"{_SELECT} WHERE user_id = ?", (user_id,)).fetchone()
+            prefs = _row_to_prefs(row) if row else None
+            self._cache[user_id] = prefs
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return prefs
+
+    def put(self, prefs: UserPrefs) -> UserPrefs:
+        """
+        Insert or update a user's preferences, bumping their version.
+
+        Args:
+            prefs: Preferences to store (version and updated_at are assigned here)
+
+        Returns:
+            The stored preferences
+        """
+        updated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        values = [getattr(prefs, field) for field in PREF_FIELDS]
+        values[PREF_FIELDS.index("interests")] = json.dumps(prefs.interests)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO users (user_id, {', '.join(PREF_FIELDS)}, version, updated_at) "
+                f"VALUES (?, {', '.join('?' for _ in PREF_FIELDS)}, 1, ?) "
+                f"ON CONFLICT(user_id) DO UPDATE SET "
+                f"{', '.join(f'{field} = excluded.{field}' for field in PREF_FIELDS)}, "
+                f"version = users.version + 1, updated_at = excluded.updated_at",
+                (prefs.user_id, *values, updated_at),
+            )
+            self._cache.pop(prefs.user_id, None)
+        return self.get(prefs.user_id)
+
+    def delete(self, user_id: str) -> bool:
+        """
+        Remove a user.
+
+        Returns:
+            True if the user existed
+        """
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM users WHERE user_id = ?", (user_id,)).rowcount
+            self._conn.execute("DELETE FROM recommendations WHERE user_id = ?", (user_id,))
+            self._conn.execute(
+                "DELETE FROM saved_search_matches WHERE search_id IN "
+                "(SELECT search_id FROM saved_searches WHERE user_id = ?)",
+                (user_id,),
+            )
+            self._conn.execute("DELETE FROM saved_searches WHERE user_id = ?", (user_id,))
+            self._cache.pop(user_id, None)
+        return deleted > 0
+
+    def user_ids(self) -> List[str]:
+        """Return all user ids, sorted."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT user_id FROM users ORDER BY user_id")]
+
+    def users_by_wake_hour(self, wake_hour: Optional[int] = None) -> List[Tuple[str, Optional[int], int]]:
+        """
+        Return (user_id, wake_hour, version) for every user, earliest risers first.
+
+        Args:
+            wake_hour: Only users waking at this hour (optional)
+        """
+        sql = "SELECT user_id, wake_hour, version FROM users"
+        params: Tuple[Any, ...] = ()
+        if wake_hour is not None:
+            sql += " WHERE wake_hour = ?"
+            params = (wake_hour,)
+        sql += " ORDER BY wake_hour IS NULL, wake_hour, user_id"
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def home_locations(self) -> List[Tuple[float, float]]:
+        """Return the distinct (latitude, longitude) homes of all users."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT DISTINCT home_latitude, home_longitude FROM users "
+                "WHERE home_latitude IS NOT NULL AND home_longitude IS NOT NULL"
+            ).fetchall()
+
+    def get_recommendations(self, user_id: str, date: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a user's precomputed recommendations for a day (one primary-key lookup).
+
+        Args:
+            user_id: User identifier
+            date: Day in YYYY-MM-DD format
+
+        Returns:
+            Dictionary with prefs_version, generated_at and events, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT prefs_version, generated_at, events FROM recommendations WHERE user_id = ? AND date = ?",
+                (user_id, date),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"prefs_version": row[0], "generated_at": row[1], "events": json.loads(row[2])}
+
+    def put_recommendations(self, user_id: str, date: str, prefs_version: int, events: List[Dict[str, Any]]) -> None:
+        """
+        Store (or replace) a user's recommendations for a day.
+
+        Args:
+            user_id: User identifier
+            date: Day in YYYY-MM-DD format
+            prefs_version: Version of the preferences they were computed from
+            events: Recommended events as dictionaries, best first
+        """
+        generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO recommendations (user_id, date, prefs_version, generated_at, events) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (user_id, date, prefs_version, generated_at, json.dumps(events)),
+            )
+
+    def recommendation_versions(self, date: str) -> Dict[str, int]:
+        """Return user_id -> prefs_version of the recommendations already stored for a day."""
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT user_id, prefs_version FROM recommendations WHERE date = ?", (date,)
+            ))
+
+    def delete_recommendations_before(self, date: str) -> int:
+        """Drop recommendations for days before ``date``; returns the number removed."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM recommendations WHERE date < ?", (date,)).rowcount
+
+    def add_saved_search(self, search: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a saved search.
+
+        Args:
+            search: Saved search fields (SEARCH_FIELDS without search_id and created_at)
+
+        Returns:
+            The stored search, with search_id and created_at assigned
+        """
+        created_at = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+        fields = SEARCH_FIELDS[1:-1]
+        with self._lock, self._conn:
+            search_id = self._conn.execute(
+                f"INSERT INTO saved_searches ({', '.join(fields)}, created_at) "
+                f"VALUES ({', '.join('?' for _ in fields)}, ?)",
+                (*(search.get(field) for field in fields), created_at),
+            ).lastrowid
+        return {**{field: search.get(field) for field in fields}, "search_id": search_id, "created_at": created_at}
+
+    def saved_searches(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return saved searches, oldest first.
+
+        Args:
+            user_id: Only this user's searches (default: all users)
+        """
+        sql = f"SELECT {', '.join(SEARCH_FIELDS)} FROM saved_searches"
+        params: Tuple[Any, ...] = ()
+        if user_id is not None:
+            sql += " WHERE user_id = ?"
+            params = (user_id,)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY search_id", params).fetchall()
+        return [dict(zip(SEARCH_FIELDS, row)) for row in rows]
+
+    def delete_saved_search(self, user_id: str, search_id: int) -> bool:
+        """
+        Remove one of a user's saved searches and its matches.
+
+        Returns:
+            True if the search existed
+        """
+        with self._lock, self._conn:
+            deleted = self._conn.execute(
+                "DELETE FROM saved_searches WHERE search_id = ? AND user_id = ?", (search_id, user_id)
+            ).rowcount
+            if deleted:
+                self._conn.execute("DELETE FROM saved_search_matches WHERE search_id = ?", (search_id,))
+        return deleted > 0
+
+    def add_search_matches(self, matches: List[Tuple[int, str]], cursor: str) -> int:
+        """
+        Record matched events and advance the matcher cursor in one transaction.
+
+        Args:
+            matches: (search_id, event_id) pairs; pairs already recorded are ignored
+            cursor: Event change cursor up to which matching is complete
+
+        Returns:
+            Number of new matches
+        """
+        matched_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO saved_search_matches (search_id, event_id, matched_at) VALUES (?, ?, ?)",
+                [(search_id, event_id, matched_at) for search_id, event_id in matches],
+            )
+            added = self._conn.total_changes - before
+            self._conn.execute(
+                "INSERT OR REPLACE INTO matcher_state (key, value) VALUES (?, ?)", (MATCH_CURSOR_KEY, cursor)
+            )
+        return added
+
+    def match_cursor(self) -> Optional[str]:
+        """Return the event change cursor up to which saved searches have been matched."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM matcher_state WHERE key = ?", (MATCH_CURSOR_KEY,)).fetchone()
+        return row[0] if row else None
+
+    def search_matches(self, search_id: int, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Return a saved search's matches, newest first.
+
+        Returns:
+            List of dictionaries with match_id, event_id and matched_at
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT match_id, event_id, matched_at FROM saved_search_matches "
+                "WHERE search_id = ? ORDER BY match_id DESC LIMIT ?",
+                (search_id, limit),
+            ).fetchall()
+        return [{"match_id": row[0], "event_id": row[1], "matched_at": row[2]} for row in rows]
+
+    def matches_after(self, match_id: int) -> List[Tuple[int, int, str]]:
+        """
+        Return (match_id, search_id, user_id) of the matches recorded after ``match_id``.
+
+        Used by the server to notify subscribers; ``match_id`` increases with every match.
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT m.match_id, m.search_id, s.user_id FROM saved_search_matches m "
+                "JOIN saved_searches s ON s.search_id = m.search_id "
+                "WHERE m.match_id > ? ORDER BY m.match_id",
+                (match_id,),
+            ).fetchall()
+
+    def last_match_id(self) -> int:
+        """Return the newest match id (0 when there are none)."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(match_id), 0) FROM saved_search_matches").fetchone()[0]
+
+    def import_prefs_json(self, path: str, user_id: str = DEFAULT_USER_ID) -> UserPrefs:
+        """
+        Store a prefs.json file as a user's preferences.
+
+        Args:
+            path: prefs.json path
+            user_id: User to store it under
+
+        Returns:
+            The stored preferences
+        """
+        with open(path, encoding="utf-8") as f:
+            return self.put(UserPrefs.from_prefs_json(user_id, json.load(f)))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_shared_store: Optional[PrefsStore] = None
+# The events service opens the store from worker threads
+_shared_store_lock = threading.Lock()
+
+
+def get_prefs_store() -> PrefsStore:
+    """
+    Return the process-wide PrefsStore, creating it on first call.
+
+    If there is no "default" user yet, the workspace prefs.json is imported as it.
+
+    Returns:
+        The shared PrefsStore instance
+    """
+    global _shared_store
+    if _shared_store is None:
+        with _shared_store_lock:
+            if _shared_store is None:
+                store = PrefsStore()
+                prefs_json = default_prefs_json_path()
+                if store.get(DEFAULT_USER_ID) is None and os.path.exists(prefs_json):
+                    store.import_prefs_json(prefs_json)
+                    logger.info(f"Imported {prefs_json} as user '{DEFAULT_USER_ID}'")
+                _shared_store = store
+    return _shared_store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage Morning Me user preferences")
+    parser.add_argument("--db", default=None, help="Preferences database (default: NYC_EVENTS_PREFS_DB or workspace root)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List user ids")
+    show = commands.add_parser("show", help="Print a user's preferences as JSON")
+    show.add_argument("user_id")
+    put = commands.add_parser("set", help="Store a prefs.json file for a user")
+    put.add_argument("user_id")
+    put.add_argument("prefs_json")
+    delete = commands.add_parser("delete", help="Remove a user")
+    delete.add_argument("user_id")
+    args = parser.parse_args()
+
+    store = PrefsStore(args.db)
+    try:
+        if args.command == "list":
+            for user_id in store.user_ids():
+                print(user_id)
+        elif args.command == "show":
+            prefs = store.get(args.user_id)
+            if prefs is None:
+                parser.exit(1, f"Unknown user: {args.user_id}\n")
+            print(json.dumps(prefs.to_dict(), indent=2))
+        elif args.command == "set":
+            prefs = store.import_prefs_json(args.prefs_json, args.user_id)
+            print(f"Stored {prefs.user_id} (version {prefs.version})")
+        elif args.command == "delete":
+            if not store.delete(args.user_id):
+                parser.exit(1, f"Unknown user: {args.user_id}\n")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
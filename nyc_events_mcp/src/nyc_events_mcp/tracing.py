@@ -0,0 +1,319 @@
+"""
+Span-based tracing for the NYC Events MCP server.
+
+Tracing is off by default. When it is disabled, ``span()`` returns a shared
+no-op object and ``traced`` wrappers call straight through, so instrumented
+code pays for a single global lookup.
+
+Enable it with ``configure_tracing(exporter)``, the ``--trace`` server flag
+or the ``NYC_EVENTS_TRACE`` environment variable (``console`` or
+``jsonl[:path]``).
+"""
+
+import functools
+import inspect
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, TextIO
+
+DEFAULT_TRACE_FILE = "nyc_events_traces.jsonl"
+
+# The span that is currently active in this task/thread. contextvars are copied
+# into asyncio tasks and asyncio.to_thread() workers, which is what propagates
+# the trace context through the server.
+_current_span: ContextVar[Optional["Span"]] = ContextVar("nyc_events_current_span", default=None)
+
+# Active exporter; None means tracing is disabled.
+_exporter: Optional["SpanExporter"] = None
+
+
+class Span:
+    """
+    A single timed operation within a trace.
+    """
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "attributes",
+        "start_ns", "end_ns", "status", "error", "_token",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        """Mark the span as failed without requiring the exception to propagate."""
+        self.status = "error"
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration of the span in milliseconds."""
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header value for this span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable representation used by the exporters."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_unix_ns": self.start_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.time_ns()
+        if exc is not None:
+            self.record_error(exc)
+        _current_span.reset(self._token)
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export(self)
+
+
+class _NoopSpan:
+    """
+    Shared stand-in returned by ``span()`` while tracing is disabled.
+    """
+
+    __slots__ = ()
+
+    traceparent = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, exc: BaseException) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(ABC):
+    """
+    Abstract base class for span exporters.
+
+    Exporters receive every finished span. They are called inline, so
+    implementations should be cheap or hand work off to another thread.
+    """
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """
+        Export a finished span.
+
+        Args:
+            span: The span that just ended
+        """
+        raise NotImplementedError("Each span exporter must implement export")
+
+    def shutdown(self) -> None:
+        """Flush and release any resources held by the exporter."""
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """
+    Writes a one-line summary per span to stderr.
+
+    stdout is reserved for the MCP protocol in stdio mode, so this never
+    writes there.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stderr
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        attrs = " ".join(f"{k}={v}" for k, v in span.attributes.items())
+        line = (
+            f"[trace {span.trace_id[:8]}] {span.name} "
+            f"{span.duration_ms:.2f}ms {span.status}"
+            f"{' ' + attrs if attrs else ''}"
+            f"{' error=' + span.error if span.error else ''}\n"
+        )
+        with self._lock:
+            self.stream.write(line)
+            self.stream.flush()
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """
+    Appends one JSON object per span to a local file.
+    """
+
+    def __init__(self, path: str = DEFAULT_TRACE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def configure_tracing(exporter: Optional[SpanExporter]) -> None:
+    """
+    Install a span exporter, or disable tracing by passing None.
+
+    Args:
+        exporter: The exporter that receives finished spans
+    """
+    global _exporter
+    previous = _exporter
+    _exporter = exporter
+    if previous is not None and previous is not exporter:
+        previous.shutdown()
+
+
+def configure_tracing_from_spec(spec: Optional[str]) -> None:
+    """
+    Configure tracing from a short spec string.
+
+    Args:
+        spec: ``console``, ``jsonl`` or ``jsonl:<path>``; empty/None/``off`` disables tracing
+    """
+    if not spec or spec == "off":
+        configure_tracing(None)
+    elif spec == "console":
+        configure_tracing(ConsoleSpanExporter())
+    elif spec == "jsonl" or spec.startswith("jsonl:"):
+        path = spec.partition(":")[2] or DEFAULT_TRACE_FILE
+        configure_tracing(JsonLinesSpanExporter(path))
+    else:
+        raise ValueError(f"Unknown trace exporter: {spec}")
+
+
+def tracing_enabled() -> bool:
+    """Return True if a span exporter is installed."""
+    return _exporter is not None
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[tuple[str, str]]:
+    """
+    Parse a W3C ``traceparent`` value.
+
+    Args:
+        value: Header value such as ``00-<trace_id>-<span_id>-01``
+
+    Returns:
+        (trace_id, parent_span_id) or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return parts[1], parts[2]
+
+
+def span(name: str, traceparent: Optional[str] = None, **attributes: Any):
+    """
+    Start a span as a context manager.
+
+    The span becomes a child of the current span. If there is none, it joins
+    the trace given by ``traceparent`` or starts a new trace.
+
+    Args:
+        name: Span name, e.g. ``events_service.search_events``
+        traceparent: Optional W3C traceparent from an incoming request
+        **attributes: Attributes recorded on the span
+
+    Returns:
+        A context manager yielding the span (a no-op while tracing is disabled)
+    """
+    if _exporter is None:
+        return _NOOP_SPAN
+    parent = _current_span.get()
+    if parent is not None:
+        return Span(name, parent.trace_id, parent.span_id, attributes)
+    remote = parse_traceparent(traceparent)
+    if remote is not None:
+        return Span(name, remote[0], remote[1], attributes)
+    return Span(name, secrets.token_hex(16), None, attributes)
+
+
+def current_traceparent() -> Optional[str]:
+    """
+    Return the ``traceparent`` of the active span, for outgoing requests.
+    """
+    current = _current_span.get()
+    return current.traceparent if current is not None else None
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorator that wraps a sync or async function in a span.
+
+    Args:
+        name: Span name
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _exporter is None:
+                    return await func(*args, **kwargs)
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# Honour the environment variable at import time so tracing can be switched on
+# without touching the launch command (e.g. in Claude Desktop config).
+if os.environ.get("NYC_EVENTS_TRACE"):
+    configure_tracing_from_spec(os.environ["NYC_EVENTS_TRACE"])
@@ -0,0 +1,40 @@
+"""
+Cold-start budget of the stdio server, relative to a bare mcp.server server.
+
+Run from the nyc_events_mcp/ directory:
+    python -m pytest tests
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import startup
+
+
+def test_server_import_defers_tools_and_database():
+    code = (
+        "import sys, nyc_events_mcp.server; "
+        "print(' '.join(m for m in ('nyc_events_mcp.tools.tools_events', 'nyc_events_mcp.tools.events_service', "
+        "'nyc_events_mcp.resources', 'sqlite3') if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=startup._server_env(), check=True,
+    )
+    assert proc.stdout.split() == []
+
+
+def test_import_overhead_within_budget():
+    bare_ms, ours_ms = startup.measure_import_overhead(runs=5)
+    assert ours_ms / bare_ms <= startup.DEFAULT_IMPORT_BUDGET_RATIO, (
+        f"{ours_ms:.1f} ms on top of mcp.server ({bare_ms:.0f} ms)"
+    )
+
+
+def test_time_to_first_list_tools_within_budget():
+    bare_ms, overhead_ms = startup.measure_overhead(runs=5)
+    assert overhead_ms / bare_ms <= startup.DEFAULT_BUDGET_RATIO, (
+        f"{overhead_ms:.0f} ms over the bare server ({bare_ms:.0f} ms)"
+    )
@@ -11,6 +11,39 @@ import requests
 import urllib.parse
 import datetime
 
+try:
+    from nyc_events_mcp.tracing import current_traceparent, span
+except ImportError:  # running standalone inside Open WebUI without the events package
+    from contextlib import nullcontext
+
+    def span(name, traceparent=None, **attributes):
+        return nullcontext()
+
+    def current_traceparent():
+        return None
+
+
+# Upper bound on each HTTP request, in seconds (connect and read). Open WebUI
+# runs this tool in its own process, outside any MCP call budget, so this is
+# the only limit on how long a request can hold the call.
+HTTP_TIMEOUT_S = 10.0
+
+
+# Hosts that may receive our trace context (comma-separated); third-party APIs
+# such as Open-Meteo never do
+INTERNAL_HOSTS = frozenset(
+    host.strip().lower()
+    for host in os.environ.get("TRACE_INTERNAL_HOSTS", "localhost,127.0.0.1").split(",")
+    if host.strip()
+)
+
+
+def trace_headers(url):
+    # Forward the active trace context so calls to our own services can be correlated
+    if (urllib.parse.urlsplit(url).hostname or "").lower() not in INTERNAL_HOSTS:
+        return None
+    traceparent = current_traceparent()
+    return {"traceparent": traceparent} if traceparent else None
 
 
 def get_city_info(city: str):
@@ -18,7 +51,12 @@ def get_city_info(city: str):
     city = city.split(",")[0].strip()  # "New York, NY" → "New York"
 
     url = f"https://geocoding-api.open-meteo.com/v1/search?name={urllib.parse.quote(city)}&count=1&language=en&format=json"
-    response = requests.get(url)
+    try:
+        with span("weather.get_city_info", city=city):
+            response = requests.get(url, headers=trace_headers(url), timeout=HTTP_TIMEOUT_S)
+    except requests.RequestException as e:
+        print(f"Failed to retrieve data for city '{city}': {e}")
+        return None
 
     if response.status_code == 200:
         try:
@@ -66,9 +104,10 @@ wmo_weather_codes = {
 
 def fetch_weather_data(base_url, params):
     try:
-        response = requests.get(base_url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        with span("weather.fetch_weather_data", url=base_url):
+            response = requests.get(base_url, params=params, headers=trace_headers(base_url), timeout=HTTP_TIMEOUT_S)
+            response.raise_for_status()
+            data = response.json()
         if "error" in data:
             return f"Error fetching weather data: {data['message']}"
         return data